@@ -0,0 +1,10 @@
+"""Benchmarks for the hot paths in the `urban_meal_delivery.forecasts` package.
+
+The benchmarks run with pytest-benchmark in the nox session "benchmark", which
+saves the results as JSON files in the ".cache/benchmarks/" folder. To detect
+performance regressions between releases, compare runs with, for example,
+`poetry run nox -s benchmark -- --benchmark-compare --benchmark-compare-fail=mean:10%`.
+
+The benchmarks use synthetic order histories whose size is configured with the
+`BENCHMARK_N_PIXELS` and `BENCHMARK_N_WEEKS` environment variables.
+"""
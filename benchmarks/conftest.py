@@ -0,0 +1,122 @@
+"""Fixtures providing synthetic data for the benchmarks."""
+
+import datetime as dt
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from urban_meal_delivery import config
+from urban_meal_delivery import db
+from urban_meal_delivery.forecasts import timify
+
+
+# Size of the synthetic order histories.
+N_PIXELS = int(os.getenv('BENCHMARK_N_PIXELS') or 100)
+N_WEEKS = int(os.getenv('BENCHMARK_N_WEEKS') or 10)
+
+# The training horizon used throughout the benchmarks.
+TRAIN_HORIZON = 8
+
+# The `frequency`s of horizontal time series and vertical ones
+# with 60-minute and 15-minute time steps.
+FREQUENCIES = (7, 7 * 12, 7 * 48)
+
+# The first day in the synthetic order histories.
+FIRST_DAY = dt.date(2016, 7, 1)
+
+# The day to be predicted: the last day in the synthetic order histories.
+PREDICT_DAY = FIRST_DAY + dt.timedelta(weeks=N_WEEKS, days=-1)
+
+
+@pytest.fixture(scope='session')
+def grid():
+    """A `Grid` that is not persisted in the database."""
+    city = db.City(
+        name='Paris',
+        kml='<?xml ...',
+        center_latitude=48.856614,
+        center_longitude=2.3522219,
+        northeast_latitude=48.9021449,
+        northeast_longitude=2.4699208,
+        southwest_latitude=48.815573,
+        southwest_longitude=2.225193,
+        initial_zoom=12,
+    )
+
+    return db.Grid(city=city, side_length=1000)
+
+
+@pytest.fixture(scope='session')
+def pixel(grid):
+    """A `Pixel` that is not persisted in the database."""
+    return db.Pixel(id=1, grid=grid, n_x=0, n_y=0)
+
+
+@pytest.fixture(scope='session')
+def order_totals(grid):
+    """The order totals of `N_PIXELS` over `N_WEEKS` with 60-minute time steps.
+
+    The demand is random and sparse: about half of the time steps have no orders.
+    """
+    order_history = timify.OrderHistory(grid=grid, time_step=60)
+    index = order_history._make_complete_index(  # noqa:WPS437
+        pixel_ids=range(1, N_PIXELS + 1),
+        first_day=FIRST_DAY,
+        last_day=PREDICT_DAY,
+    )
+
+    rng = np.random.default_rng(42)
+    n_orders = rng.poisson(0.7, size=len(index))
+
+    return pd.DataFrame({'n_orders': n_orders}, index=index)
+
+
+@pytest.fixture(params=['dataframe', 'cube'])
+def order_history(request, grid, order_totals):
+    """An `OrderHistory` with the synthetic `order_totals` loaded."""
+    order_history = timify.OrderHistory(
+        grid=grid, time_step=60, storage=request.param,
+    )
+    order_history._data = order_totals  # noqa:WPS437
+
+    # Populate the `.cube` outside of the benchmarks.
+    order_history.cube  # noqa:WPS428
+
+    return order_history
+
+
+@pytest.fixture
+def predict_at():
+    """Noon on the `PREDICT_DAY`."""
+    return dt.datetime(
+        PREDICT_DAY.year, PREDICT_DAY.month, PREDICT_DAY.day, 12, 0,
+    )
+
+
+def make_time_series(frequency: int, n_cycles: int = TRAIN_HORIZON) -> pd.Series:
+    """Create a random time series with a daily and weekly pattern.
+
+    Args:
+        frequency: number of observations per week
+        n_cycles: number of weeks
+
+    Returns:
+        time_series: with `frequency * n_cycles` observations
+    """
+    rng = np.random.default_rng(42)
+    pattern = 1 + np.sin(np.linspace(0, 2 * np.pi * 7, frequency)) ** 2
+    values = rng.poisson(np.tile(pattern, n_cycles)).astype(float)
+
+    first_start_at = dt.datetime(
+        FIRST_DAY.year, FIRST_DAY.month, FIRST_DAY.day, config.SERVICE_START,
+    )
+    index = pd.date_range(
+        first_start_at,
+        periods=len(values),
+        freq='H',
+        name='start_at',
+    )
+
+    return pd.Series(values, index=index, name='n_orders')
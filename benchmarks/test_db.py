@@ -0,0 +1,60 @@
+"""Benchmark the conversion of predictions into ORM models and plain rows."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks import conftest
+from urban_meal_delivery import db
+
+
+# A whole day with 15-minute time steps.
+N_TIME_STEPS = 48
+
+
+@pytest.fixture
+def predictions():
+    """A whole day of predictions as returned by a vertical `*Model`."""
+    rng = np.random.default_rng(42)
+
+    return pd.DataFrame(
+        data={
+            'actual': rng.poisson(3, size=N_TIME_STEPS),
+            'prediction': rng.normal(3, size=N_TIME_STEPS),
+            'low80': rng.normal(1, size=N_TIME_STEPS),
+            'high80': rng.normal(5, size=N_TIME_STEPS),
+            'low95': float('NaN'),
+            'high95': float('NaN'),
+        },
+        index=pd.date_range(
+            conftest.PREDICT_DAY, periods=N_TIME_STEPS, freq='15T', name='start_at',
+        ),
+    )
+
+
+def test_forecast_from_dataframe(benchmark, pixel, predictions):
+    """Convert a whole day of predictions into `Forecast` objects."""
+    result = benchmark(
+        db.Forecast.from_dataframe,
+        pixel=pixel,
+        time_step=15,
+        train_horizon=conftest.TRAIN_HORIZON,
+        model='varima',
+        data=predictions,
+    )
+
+    assert len(result) == N_TIME_STEPS
+
+
+def test_forecast_rows_from_dataframe(benchmark, pixel, predictions):
+    """Convert a whole day of predictions into rows for a Core insert."""
+    result = benchmark(
+        db.Forecast.rows_from_dataframe,
+        pixel=pixel,
+        time_step=15,
+        train_horizon=conftest.TRAIN_HORIZON,
+        model='varima',
+        data=predictions,
+    )
+
+    assert len(result) == N_TIME_STEPS
@@ -0,0 +1,93 @@
+"""Benchmark the forecasting `methods`."""
+
+import pandas as pd
+import pytest
+
+from benchmarks import conftest
+from urban_meal_delivery.forecasts.methods import arima
+from urban_meal_delivery.forecasts.methods import decomposition
+from urban_meal_delivery.forecasts.methods import ets
+from urban_meal_delivery.forecasts.methods import extrapolate_season
+
+
+@pytest.fixture(params=conftest.FREQUENCIES)
+def frequency(request):
+    """The `frequency` of the time series to be forecast."""
+    return request.param
+
+
+@pytest.fixture
+def training_ts(frequency):
+    """A random time series with `TRAIN_HORIZON` seasonal cycles."""
+    return conftest.make_time_series(frequency)
+
+
+@pytest.fixture
+def forecast_interval(training_ts, frequency):
+    """The time steps of one day (or one time step for horizontal time series)."""
+    n_steps_ahead = 1 if frequency == 7 else frequency // 7
+
+    return pd.date_range(
+        training_ts.index[-1], periods=n_steps_ahead + 1, freq='H', name='start_at',
+    )[1:]
+
+
+@pytest.mark.r
+def test_arima(benchmark, training_ts, forecast_interval):
+    """Predict with an automatically chosen ARIMA model in R."""
+    result = benchmark(
+        arima.predict,
+        training_ts=training_ts,
+        forecast_interval=forecast_interval,
+        frequency=1,
+    )
+
+    assert len(result) == len(forecast_interval)
+
+
+@pytest.mark.parametrize(
+    'backend', [pytest.param('r', marks=pytest.mark.r), 'python'],
+)
+def test_ets(benchmark, training_ts, forecast_interval, frequency, backend):
+    """Predict with an automatically calibrated ETS model."""
+    result = benchmark(
+        ets.predict,
+        training_ts=training_ts,
+        forecast_interval=forecast_interval,
+        frequency=frequency,
+        seasonal_fit=True,
+        backend=backend,
+    )
+
+    assert len(result) == len(forecast_interval)
+
+
+@pytest.mark.parametrize(
+    'backend', [pytest.param('r', marks=pytest.mark.r), 'python'],
+)
+def test_stl(benchmark, training_ts, frequency, backend):
+    """Decompose a time series with the "periodic" STL method."""
+    if backend == 'python' and frequency % 2:
+        pytest.skip('the "python" backend requires `nl > frequency`')
+
+    result = benchmark(
+        decomposition.stl,
+        time_series=training_ts,
+        frequency=frequency,
+        ns=999,
+        backend=backend,
+    )
+
+    assert len(result) == len(training_ts)
+
+
+def test_extrapolate_season(benchmark, training_ts, forecast_interval, frequency):
+    """Extrapolate a seasonal component linearly."""
+    result = benchmark(
+        extrapolate_season.predict,
+        training_ts=training_ts,
+        forecast_interval=forecast_interval,
+        frequency=frequency,
+    )
+
+    assert len(result) == len(forecast_interval)
@@ -0,0 +1,78 @@
+"""Benchmark the `OrderHistory` class."""
+
+import pytest
+
+from benchmarks import conftest
+
+
+def test_aggregate_orders_zero_fill(benchmark, grid, order_totals, monkeypatch):
+    """Fill in the time steps without orders after the aggregation in SQL."""
+    order_history = conftest.timify.OrderHistory(grid=grid, time_step=60)
+    sparse_totals = order_totals[order_totals['n_orders'] > 0]
+    monkeypatch.setattr(order_history, '_query_totals', lambda: sparse_totals)
+
+    result = benchmark(order_history.aggregate_orders)
+
+    assert len(result) == len(order_totals)
+
+
+@pytest.mark.parametrize(
+    'method', ['make_horizontal_ts', 'make_vertical_ts', 'make_realtime_ts'],
+)
+def test_slice_time_series(benchmark, order_history, pixel, predict_at, method):
+    """Slice out the training time series of one `Pixel`."""
+    if method == 'make_vertical_ts':
+        kwargs = {'predict_day': predict_at.date()}
+    else:
+        kwargs = {'predict_at': predict_at}
+
+    training_ts, _, _ = benchmark(
+        getattr(order_history, method),
+        pixel_id=pixel.id,
+        train_horizon=conftest.TRAIN_HORIZON,
+        **kwargs,
+    )
+
+    assert not training_ts.empty
+
+
+@pytest.mark.parametrize(
+    'method', ['make_horizontal_batch', 'make_vertical_batch', 'make_realtime_batch'],
+)
+def test_slice_time_series_batch(benchmark, order_history, predict_at, method):
+    """Slice out the training time series of all `Pixel`s at once."""
+    pixel_ids = list(range(1, conftest.N_PIXELS + 1))
+    if method == 'make_vertical_batch':
+        kwargs = {'predict_days': [predict_at.date()] * len(pixel_ids)}
+    else:
+        kwargs = {'predict_ats': [predict_at] * len(pixel_ids)}
+
+    training_ts, _, _ = benchmark(
+        getattr(order_history, method),
+        pixel_ids=pixel_ids,
+        train_horizon=conftest.TRAIN_HORIZON,
+        **kwargs,
+    )
+
+    assert len(training_ts) == len(pixel_ids)
+
+
+def test_avg_daily_demand(benchmark, order_history, pixel):
+    """Calculate the average daily demand of one `Pixel` on one day."""
+    result = benchmark(
+        order_history.avg_daily_demand,
+        pixel_id=pixel.id,
+        predict_day=conftest.PREDICT_DAY,
+        train_horizon=conftest.TRAIN_HORIZON,
+    )
+
+    assert result > 0
+
+
+def test_avg_daily_demands(benchmark, order_history):
+    """Calculate the average daily demands of all `Pixel`s on all days."""
+    result = benchmark(
+        order_history.avg_daily_demands, train_horizon=conftest.TRAIN_HORIZON,
+    )
+
+    assert not result.empty
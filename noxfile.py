@@ -25,6 +25,13 @@ as unified tasks to assure the quality of the source code:
   + accepts extra arguments, e.g., `poetry run nox -s test -- --no-cov`,
     that are passed on to `pytest` and `xdoctest` with no changes
     => may be paths or options
+
+- "benchmark" (pytest-benchmark):
+
+  + time the hot paths in the `forecasts` sub-package [not run by default]
+  + accepts extra arguments, e.g.,
+    `poetry run nox -s benchmark -- --benchmark-compare`,
+    that are passed on to `pytest` with no changes
 """
 
 import contextlib
@@ -53,11 +60,16 @@ PACKAGE_SOURCE_LOCATION = 'src/'
 # Path to the test suite.
 PYTEST_LOCATION = 'tests/'
 
+# Path to the benchmarks and where their results are saved as JSON files.
+BENCHMARK_LOCATION = 'benchmarks/'
+BENCHMARK_STORAGE = '.cache/benchmarks/'
+
 # Paths with all *.py files.
 SRC_LOCATIONS = (
     f'{DOCS_SRC}conf.py',
     'migrations/env.py',
     'migrations/versions/',
+    BENCHMARK_LOCATION,
     'noxfile.py',
     PACKAGE_SOURCE_LOCATION,
     PYTEST_LOCATION,
@@ -254,6 +266,40 @@ def test(session):
     session.run('xdoctest', '--quiet', *args)  # --quiet => less verbose output
 
 
+@nox.session(python=PYTHON)
+def benchmark(session):
+    """Benchmark the hot paths in the `forecasts` sub-package.
+
+    The results of every run are saved as JSON files in the
+    ".cache/benchmarks/" folder so that later runs can be compared to them,
+    for example, with the `--benchmark-compare` option.
+
+    If extra arguments are provided, they are forwarded to pytest
+    without any changes. For example, `-- -m "not r"` skips the
+    benchmarks involving R.
+    """
+    if session.virtualenv.reuse_existing:
+        raise RuntimeError(
+            'The "benchmark" session must be run without the "-r" option',
+        )
+
+    _begin(session)
+
+    # The benchmarks require the developed package and its
+    # non-develop dependencies be installed in the virtual environment.
+    session.run('poetry', 'install', '--no-dev', external=True)
+    _install_packages(session, 'pytest', 'pytest-benchmark', 'pytest-env')
+
+    session.run('pytest', '--version')
+    session.run(
+        'pytest',
+        '--benchmark-autosave',
+        f'--benchmark-storage=file://{BENCHMARK_STORAGE}',
+        BENCHMARK_LOCATION,
+        *session.posargs,
+    )
+
+
 @nox.session(python=PYTHON)
 def safety(session):
     """Check the dependencies for known security vulnerabilities."""
@@ -78,6 +78,31 @@ class Config:
 
     R_LIBS_PATH = os.getenv('R_LIBS')
 
+    # Fit the ETS models with R ("r") or `statsmodels` ("python").
+    ETS_BACKEND = os.getenv('ETS_BACKEND') or 'r'
+
+    # Decompose time series with R ("r") or `statsmodels` ("python").
+    STL_BACKEND = os.getenv('STL_BACKEND') or 'r'
+
+    # Re-use the orders of the ARIMA models chosen for a pixel on the following
+    # days and only re-fit the coefficients; `0` chooses the orders for every fit.
+    # The orders are chosen anew if the residuals' variance grows by a share of
+    # more than the tolerance (cf., `forecasts.models.tactical.orders`).
+    ARIMA_ORDER_DAYS = int(os.getenv('ARIMA_ORDER_DAYS') or 0)
+    ARIMA_ORDER_TOLERANCE = 0.1
+
+    # A folder to persist intermediate results (e.g., the aggregated order totals)
+    # across runs; caching on disk is disabled if not set.
+    CACHE_DIR = os.getenv('CACHE_DIR')
+
+    # Number of results of the forecasting `methods` kept in memory
+    # to not fit them again; `0` disables the memoization.
+    FIT_CACHE_SIZE = int(os.getenv('FIT_CACHE_SIZE') or 4096)
+
+    # Number of `Forecast`s inserted into the database in one transaction
+    # (cf., `forecasts.models.writer`).
+    FORECAST_BATCH_SIZE = int(os.getenv('FORECAST_BATCH_SIZE') or 1000)
+
     def __repr__(self) -> str:
         """Non-literal text representation."""
         return '<configuration>'
@@ -97,6 +122,12 @@ class TestingConfig(Config):
     DATABASE_URI = os.getenv('DATABASE_URI_TESTING') or Config.DATABASE_URI
     CLEAN_SCHEMA = os.getenv('CLEAN_SCHEMA_TESTING') or random_schema_name()
 
+    # The test suite must not pick up results cached in other runs.
+    CACHE_DIR = None
+
+    # The test suite must actually run the forecasting `methods`.
+    FIT_CACHE_SIZE = 0
+
 
 def make_config(env: str = 'production') -> Config:
     """Create a new `Config` object.
@@ -5,27 +5,106 @@ with demand predictions such that they can readily be used by the
 predictive routing algorithms.
 """
 
+import collections
 import datetime as dt
+import multiprocessing
+import os
 import sys
+import tempfile
+from concurrent import futures
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import click
-from sqlalchemy import func
 from sqlalchemy.orm import exc as orm_exc
 
 from urban_meal_delivery import config
 from urban_meal_delivery import db
 from urban_meal_delivery.console import decorators
+from urban_meal_delivery.forecasts import cube
+from urban_meal_delivery.forecasts import instrumentation
+from urban_meal_delivery.forecasts import models
+from urban_meal_delivery.forecasts import planning
 from urban_meal_delivery.forecasts import timify
 
 
+def parse_shard(
+    _ctx: click.Context, _param: click.Parameter, value: str,  # noqa:WPS110
+) -> Tuple[int, int]:
+    """Parse the "--shard" option of the form "i/N".
+
+    Args:
+        _ctx: the current click context (not used)
+        _param: the "--shard" option (not used)
+        value: the option's value passed on the command line
+
+    Returns:
+        shard: the `i` and `N` with `1 <= i <= N`
+
+    Raises:
+        BadParameter: if `value` is not of the form "i/N" with `1 <= i <= N`
+    """
+    try:
+        index, n_shards = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise click.BadParameter('must be of the form "i/N", e.g., "2/4"') from None
+
+    if not 1 <= index <= n_shards:
+        raise click.BadParameter('"i" must be between `1` and "N"')
+
+    return index, n_shards
+
+
+def select_shard(pixel_ids: Sequence[int], shard: Tuple[int, int]) -> List[int]:
+    """Select the `Pixel`s to be forecast in a shard.
+
+    The `Pixel`s are sorted by their `.id`s and then dealt out to the shards
+    one after another. So, all shards get the same number of `Pixel`s, give
+    or take one, and no `Pixel` is in more than one shard.
+
+    Args:
+        pixel_ids: of all the `Pixel`s in a `Grid`
+        shard: the `i` and `N` as returned by `parse_shard()`
+
+    Returns:
+        pixel_ids: of the `Pixel`s in the `i`-th shard
+    """
+    index, n_shards = shard
+
+    return sorted(pixel_ids)[index - 1 :: n_shards]
+
+
 @click.command()
 @click.argument('city', default='Paris', type=str)
 @click.argument('side_length', default=1000, type=int)
 @click.argument('time_step', default=60, type=int)
 @click.argument('train_horizon', default=8, type=int)
+@click.option(
+    '--workers',
+    default=1,
+    type=click.IntRange(min=1),
+    help='Number of worker processes.',
+)
+@click.option(
+    '--shard',
+    default='1/1',
+    callback=parse_shard,
+    help='Only forecast the i-th of N shares of the pixels, e.g., "2/4".',
+)
+@click.option(
+    '--report',
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write the timings and counts of the run into a JSON file.',
+)
 @decorators.db_revision('8bfb928a31f8')
-def tactical_heuristic(  # noqa:C901,WPS213,WPS216,WPS231
-    city: str, side_length: int, time_step: int, train_horizon: int,
+def tactical_heuristic(  # noqa:C901,WPS211,WPS213,WPS216,WPS231
+    city: str,
+    side_length: int,
+    time_step: int,
+    train_horizon: int,
+    workers: int,
+    shard: Tuple[int, int],
+    report: Optional[str],
 ) -> None:  # pragma: no cover
     """Predict demand for all pixels and days in a city.
 
@@ -41,10 +120,11 @@ def tactical_heuristic(  # noqa:C901,WPS213,WPS216,WPS231
     All `Forecast`s are persisted to the database so that they can be readily
     used by the predictive routing algorithms.
 
-    This command first checks, which `Forecast`s still need to be made
-    and then does its work. So, it can be interrupted at any point in
-    time and then simply continues where it left off the next time it
-    is executed.
+    This command first plans, which `Forecast`s still need to be made,
+    and reports their total. Then, it does its work and reports its
+    progress with the throughput and an estimated time to completion.
+    So, it can be interrupted at any point in time and then simply
+    continues where it left off the next time it is executed.
 
     Important: In a future revision, this command may need to be adapted such
     that is does not simply obtain the last time step for which a `Forecast`
@@ -52,6 +132,13 @@ def tactical_heuristic(  # noqa:C901,WPS213,WPS216,WPS231
     may make predictions using all available forecasting `*Model`s per `Pixel`
     and time step.
 
+    The `Pixel`s may be split across several worker processes on one machine
+    (cf., the "--workers" option) and across several machines (cf., the
+    "--shard" option). Each worker process has its own database connection
+    and R runtime. As the `Forecast`s are made per `Pixel`, the workers and
+    shards never make the same `Forecast`s, and they all continue where they
+    left off when they are executed again.
+
     Arguments:
 
     CITY: one of "Bordeaux", "Lyon", or "Paris" (=default)
@@ -61,6 +148,19 @@ def tactical_heuristic(  # noqa:C901,WPS213,WPS216,WPS231
     TIME_STEP: length of one time step in minutes; defaults to `60`
 
     TRAIN_HORIZON: length of the training horizon; defaults to `8`
+
+    Options:
+
+    --workers: number of worker processes; defaults to `1`, which makes
+    all `Forecast`s in the current process
+
+    --shard: "i/N" to only forecast the i-th of N equally sized shares
+    of the `Pixel`s (e.g., "2/4"); defaults to "1/1" (= all `Pixel`s)
+
+    --report: a JSON file into which the time spent on slicing time series,
+    fitting models, and looking up and persisting `Forecast`s is written
+    together with the counts of cache hits, fits, re-used fits, and rows written
+    (cf., `urban_meal_delivery.forecasts.instrumentation`)
     """  # noqa:D412,D417,RST215
     # Input validation.
 
@@ -87,63 +187,215 @@ def tactical_heuristic(  # noqa:C901,WPS213,WPS216,WPS231
         click.echo(f'TRAIN_HORIZON must be in {config.TRAIN_HORIZONS}')
         sys.exit(1)
 
+    pixel_ids = select_shard(
+        [pixel.id for pixel in grid.pixels], shard=shard,  # noqa:WPS441
+    )
+
     click.echo(
         'Parameters: '
         + f'city="{city}", grid.side_length={side_length}, '
-        + f'time_step={time_step}, train_horizon={train_horizon}',
+        + f'time_step={time_step}, train_horizon={train_horizon}, '
+        + f'shard={shard[0]}/{shard[1]} ({len(pixel_ids)} pixels), '
+        + f'workers={workers}',
+    )
+
+    # Load the historic order data. The time series are sliced out of a dense
+    # `DemandCube` (cf., `urban_meal_delivery.forecasts.cube`), which is also
+    # aggregated in the database directly.
+    order_history = timify.OrderHistory(
+        grid=grid, time_step=time_step, storage='cube',  # noqa:WPS441
+    )
+    order_history.load()
+
+    # Plan all the work up front: continue with forecasting on the day the
+    # last prediction was made or start `train_horizon` weeks after the first
+    # `Order` if no `Forecast`s are in the database yet.
+    tasks = planning.plan_tactical_forecasts(
+        order_history=order_history,
+        pixel_ids=pixel_ids,
+        train_horizon=train_horizon,
+        last_predict_ats=planning.last_predictions(
+            grid=grid, time_step=time_step, train_horizon=train_horizon,  # noqa:WPS441
+        ),
+    )
+    days_by_pixel: Dict[int, List[dt.date]] = {}
+    for task in tasks:
+        days_by_pixel.setdefault(task.pixel_id, []).append(task.predict_day)
+
+    n_models = collections.Counter(task.model for task in tasks)
+    per_model = ', '.join(
+        f'{name}={count}' for name, count in sorted(n_models.items())
+    )
+    click.echo(
+        f'Planned {len(tasks)} pixel-days in {len(days_by_pixel)} pixels '
+        + f'({per_model})',
+    )
+
+    settings: Dict[str, Any] = {
+        'city': city,
+        'side_length': side_length,
+        'time_step': time_step,
+        'train_horizon': train_horizon,
+    }
+    steps_per_day = (config.SERVICE_END - config.SERVICE_START) * 60 // time_step
+    progress = instrumentation.Progress(n_total=len(tasks) * steps_per_day)
+    run = instrumentation.Metrics()
+
+    # Run the tactical heuristic ...
+
+    # ... in the current process ...
+    if workers == 1:
+        _worker_state['order_history'] = order_history
+        for pixel_id, predict_days in days_by_pixel.items():
+            run.merge(forecast_pixel(pixel_id, predict_days, **settings))
+            progress.update(len(predict_days) * steps_per_day)
+
+    # ... or in several worker processes. They are "spawn"ed and not "fork"ed
+    # so that each of them creates its own database connection and R runtime.
+    # The historic order data are not loaded again in every worker: they are
+    # saved to disk once and memory-mapped by the workers instead.
+    else:
+        tmp_dir = tempfile.TemporaryDirectory()
+        cube_path = save_order_history(order_history, tmp_dir.name)
+
+        with tmp_dir, futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=initialize_worker,
+            initargs=(grid.id, cube_path),  # noqa:WPS441
+        ) as executor:
+            # Each `Pixel` is a task of its own so that the workers
+            # that are done early take over the remaining `Pixel`s.
+            pending = {
+                executor.submit(
+                    forecast_pixel, pixel_id, predict_days, **settings,
+                ): len(predict_days)
+                for pixel_id, predict_days in days_by_pixel.items()
+            }
+            for future in futures.as_completed(pending):
+                # `.result()` re-raises errors in the worker processes.
+                run.merge(future.result())
+                progress.update(pending[future] * steps_per_day)
+
+    seconds = ', '.join(
+        f'{name}={timer["seconds"]:.1f}'
+        for name, timer in run.to_dict()['timers'].items()
+    )
+    click.echo(
+        f'Done in {dt.timedelta(seconds=round(progress.elapsed))} '
+        + f'(seconds spent: {seconds})',
     )
 
-    # Load the historic order data.
-    order_history = timify.OrderHistory(grid=grid, time_step=time_step)  # noqa:WPS441
-    order_history.aggregate_orders()
-
-    # Run the tactical heuristic.
-
-    for pixel in grid.pixels:  # noqa:WPS441
-        # Important: this check may need to be adapted once further
-        # commands are added the make `Forecast`s without the heuristic!
-        # Continue with forecasting on the day the last prediction was made ...
-        last_predict_at = (
-            db.session.query(func.max(db.Forecast.start_at))  # noqa:WPS221
-            .join(db.Pixel, db.Forecast.pixel_id == db.Pixel.id)
-            .join(db.Grid, db.Pixel.grid_id == db.Grid.id)
-            .filter(db.Forecast.pixel == pixel)
-            .filter(db.Grid.side_length == side_length)
-            .filter(db.Forecast.time_step == time_step)
-            .filter(db.Forecast.train_horizon == train_horizon)
-            .first()
-        )[0]
-        # ... or start `train_horizon` weeks after the first `Order`
-        # if no `Forecast`s are in the database yet.
-        if last_predict_at is None:
-            predict_day = order_history.first_order_at(pixel_id=pixel.id).date()
-            predict_day += dt.timedelta(weeks=train_horizon)
-        else:
-            predict_day = last_predict_at.date()
+    if report is not None:
+        instrumentation.write_report(
+            report,
+            run,
+            parameters={**settings, 'workers': workers, 'shard': list(shard)},
+            n_pixel_days=len(tasks),
+            elapsed_seconds=progress.elapsed,
+        )
+
+
+# The historic order data of the `Grid` forecast in a (worker) process.
+_worker_state: Dict[str, Any] = {}
+
+
+def save_order_history(order_history: timify.OrderHistory, path: str) -> str:
+    """Save the historic order data for the worker processes.
+
+    Args:
+        order_history: as loaded in the main process
+        path: folder in which the data are saved
+
+    Returns:
+        cube_path: to be passed on to `initialize_worker()`
+    """
+    cube_path = os.path.join(path, 'order_history')
+    order_history.cube.save(cube_path)
+
+    return cube_path
 
+
+def initialize_worker(grid_id: int, cube_path: str) -> None:
+    """Load the historic order data once per worker process.
+
+    The order totals are not queried from the database again but memory-mapped
+    from where the main process saved them (cf., `save_order_history()`).
+    The time series are sliced out of the memory-mapped `DemandCube` directly,
+    so that the workers never build the `OrderHistory.totals` in memory.
+
+    Args:
+        grid_id: of the `Grid` whose `Pixel`s are forecast
+        cube_path: as returned by `save_order_history()`
+    """
+    grid = db.session.query(db.Grid).get(grid_id)
+
+    _worker_state['order_history'] = timify.OrderHistory.from_cube(
+        grid=grid, cube=cube.DemandCube.load(cube_path), storage='cube',
+    )
+
+
+def forecast_pixel(  # noqa:WPS211
+    pixel_id: int,
+    predict_days: List[dt.date],
+    *,
+    city: str,
+    side_length: int,
+    time_step: int,
+    train_horizon: int,
+) -> Dict[str, Any]:  # pragma: no cover
+    """Make all `Forecast`s missing for a `Pixel` on some days.
+
+    The historic order data must have been loaded before in the same process
+    (cf., `initialize_worker()`).
+
+    Args:
+        pixel_id: of the `Pixel` to be forecast
+        predict_days: consecutive days as planned by
+            `planning.plan_tactical_forecasts()`
+        city: name of the `City` (only used for the output)
+        side_length: of a pixel in the grid (only used for the output)
+        time_step: length of one time step in minutes
+        train_horizon: length of the training horizon in weeks
+
+    Returns:
+        metrics: the timings and counts while forecasting the `Pixel`
+            as returned by `instrumentation.Metrics.to_dict()`
+    """
+    instrumentation.metrics.reset()
+
+    order_history = _worker_state['order_history']
+    pixel = db.session.query(db.Pixel).get(pixel_id)
+
+    # Load the `Forecast`s already made for the `pixel` with one query
+    # instead of checking for them one `predict_at` at a time.
+    forecast_cache = models.ForecastCache()
+    forecast_cache.prefetch(
+        pixel, first_day=predict_days[0], last_day=predict_days[-1],
+    )
+
+    # New `Forecast`s are persisted in batches. At the end of the `with` block,
+    # the remaining ones are persisted as well.
+    with models.ForecastWriter() as forecast_writer:
         # Go over all days in chronological order ...
-        while predict_day <= order_history.last_order_at(pixel_id=pixel.id).date():
+        for predict_day in predict_days:
             # ... and choose the most promising `*Model` for that day.
             model = order_history.choose_tactical_model(
-                pixel_id=pixel.id, predict_day=predict_day, train_horizon=train_horizon,
+                pixel_id=pixel.id,
+                predict_day=predict_day,
+                train_horizon=train_horizon,
+                forecast_cache=forecast_cache,
+                forecast_writer=forecast_writer,
             )
             click.echo(
-                f'Predicting pixel #{pixel.id} in {city} '
+                f'Predicting pixel #{pixel.id} in {city} ({side_length} m) '
                 + f'for {predict_day} with {model.name}',
             )
 
-            # Only loop over the time steps corresponding to working hours.
-            predict_at = dt.datetime(
-                predict_day.year,
-                predict_day.month,
-                predict_day.day,
-                config.SERVICE_START,
+            # All time steps corresponding to working hours are forecast with
+            # one fit per day; the ones already made are taken from the cache.
+            model.make_day_forecasts(
+                pixel=pixel, predict_day=predict_day, train_horizon=train_horizon,
             )
-            while predict_at.hour < config.SERVICE_END:
-                model.make_forecast(
-                    pixel=pixel, predict_at=predict_at, train_horizon=train_horizon,
-                )
-
-                predict_at += dt.timedelta(minutes=time_step)
 
-            predict_day += dt.timedelta(days=1)
+    return instrumentation.metrics.to_dict()
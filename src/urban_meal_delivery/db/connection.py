@@ -23,6 +23,12 @@ if os.getenv('TESTING'):
     session: orm.Session = None
 
 else:  # pragma: no cover
-    engine = sa.create_engine(urban_meal_delivery.config.DATABASE_URI)
+    engine = sa.create_engine(
+        urban_meal_delivery.config.DATABASE_URI,
+        # Insert many rows (e.g., by the `forecasts.models.ForecastWriter`) with
+        # `psycopg2`'s `execute_values()` helper in pages as large as a batch.
+        executemany_mode='values',
+        executemany_values_page_size=urban_meal_delivery.config.FORECAST_BATCH_SIZE,
+    )
     connection = engine.connect()
     session = orm.sessionmaker(bind=connection)()
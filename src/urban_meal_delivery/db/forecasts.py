@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import math
-from typing import List
+from typing import Any, Dict, List
 
 import pandas as pd
 import sqlalchemy as sa
@@ -142,7 +142,7 @@ class Forecast(meta.Base):
         )
 
     @classmethod
-    def from_dataframe(  # noqa:WPS210,WPS211
+    def from_dataframe(  # noqa:WPS211
         cls,
         pixel: db.Pixel,
         time_step: int,
@@ -173,59 +173,105 @@ class Forecast(meta.Base):
 
         Returns:
             forecasts: the `data` as `Forecast` objects
+
+        Raises:
+            ValueError: if an "actual" value is missing
         """  # noqa:RST215
-        forecasts = []
+        columns = cls._columns_from_dataframe(data)
+
+        return [
+            cls(
+                pixel=pixel,
+                time_step=time_step,
+                train_horizon=train_horizon,
+                model=model,
+                **dict(zip(columns.keys(), values)),  # noqa:WPS110
+            )
+            for values in zip(*columns.values())  # noqa:WPS110
+        ]
+
+    @classmethod
+    def rows_from_dataframe(  # noqa:WPS211
+        cls,
+        pixel: db.Pixel,
+        time_step: int,
+        train_horizon: int,
+        model: str,
+        data: pd.Dataframe,
+    ) -> List[Dict[str, Any]]:
+        """Convert results from the forecasting `*Model`s into plain rows.
 
-        for timestamp_idx in data.index:
-            start_at = timestamp_idx.to_pydatetime()
-            actual = int(data.loc[timestamp_idx, 'actual'])
-            prediction = round(data.loc[timestamp_idx, 'prediction'], 5)
+        Same as `Forecast.from_dataframe()` except that the rows are returned
+        as `dict`s with the column names as keys, which can be inserted with
+        SQLAlchemy's Core layer without creating any ORM objects.
 
+        Args:
+            pixel: in which the forecast is made
+            time_step: length of one time step in minutes
+            train_horizon: length of the training horizon in weeks
+            model: name of the forecasting model
+            data: a `pd.Dataframe` as described in `Forecast.from_dataframe()`
+
+        Returns:
+            rows: the `data` as `dict`s with all columns but "id"
+
+        Raises:
+            ValueError: if an "actual" value is missing
+        """
+        columns = cls._columns_from_dataframe(data)
+
+        return [
+            {
+                'pixel_id': pixel.id,
+                'time_step': time_step,
+                'train_horizon': train_horizon,
+                'model': model,
+                **dict(zip(columns.keys(), values)),  # noqa:WPS110
+            }
+            for values in zip(*columns.values())  # noqa:WPS110
+        ]
+
+    @staticmethod
+    def _columns_from_dataframe(data: pd.DataFrame) -> Dict[str, List[Any]]:
+        """Convert the columns of a `*Model`'s results into plain `list`s.
+
+        The conversion is done on entire columns and not row by row. Yet,
+        the values are rounded one by one with `round()` on the `np.float64`
+        scalars as before so that the stored forecasts do not change.
+
+        Args:
+            data: a `pd.Dataframe` as described in `Forecast.from_dataframe()`
+
+        Returns:
+            columns: "start_at" (i.e., the index), "actual", "prediction",
+                "low80", "high80", "low95", and "high95" by name
+
+        Raises:
+            ValueError: if an "actual" value is missing
+        """
+        # Casting a `NaN` into an `int` does not fail but yields a garbage value.
+        if data['actual'].isnull().any():
+            raise ValueError('`data` must not contain missing "actual" values')
+
+        columns: Dict[str, List[Any]] = {
+            'start_at': list(data.index.to_pydatetime()),
+            'actual': data['actual'].to_numpy().astype(int).tolist(),
+            # Unlike the confidence intervals, a `NaN` prediction is kept as is.
+            'prediction': [
+                float(round(value, 5))  # noqa:WPS110
+                for value in data['prediction'].to_numpy(dtype=float)  # noqa:WPS110
+            ],
+        }
+
+        for column in ('low80', 'high80', 'low95', 'high95'):
             # Explicit type casting. SQLAlchemy does not convert
             # `float('NaN')`s into plain `None`s.
+            columns[column] = [
+                None if math.isnan(value) else float(round(value, 5))  # noqa:WPS110
+                for value in data[column].to_numpy(dtype=float)  # noqa:WPS110
+            ]
 
-            low80 = data.loc[timestamp_idx, 'low80']
-            high80 = data.loc[timestamp_idx, 'high80']
-            low95 = data.loc[timestamp_idx, 'low95']
-            high95 = data.loc[timestamp_idx, 'high95']
-
-            if math.isnan(low80):
-                low80 = None
-            else:
-                low80 = round(low80, 5)
-
-            if math.isnan(high80):
-                high80 = None
-            else:
-                high80 = round(high80, 5)
-
-            if math.isnan(low95):
-                low95 = None
-            else:
-                low95 = round(low95, 5)
-
-            if math.isnan(high95):
-                high95 = None
-            else:
-                high95 = round(high95, 5)
-
-            forecasts.append(
-                cls(
-                    pixel=pixel,
-                    start_at=start_at,
-                    time_step=time_step,
-                    train_horizon=train_horizon,
-                    model=model,
-                    actual=actual,
-                    prediction=prediction,
-                    low80=low80,
-                    high80=high80,
-                    low95=low95,
-                    high95=high95,
-                ),
-            )
-
-        return forecasts
+        return columns
 
 
 from urban_meal_delivery import db  # noqa:E402  isort:skip
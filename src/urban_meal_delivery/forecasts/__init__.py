@@ -19,11 +19,24 @@ data is loaded from the database, an `OrderHistory` instance provides various
 ways to slice out, or generate, different kinds of order time series (e.g.,
 "horizontal" vs. "vertical" time series).
 
+`cube` defines a `DemandCube` class that keeps the order totals of an
+`OrderHistory` in a dense `pixel x day x time step` array. It is an alternative
+storage from which the time series are sliced as views of the array.
+
 `models` defines various forecasting `*Model`s that combine a given kind of
 time series with one of the forecasting `methods`. For example, the ETS method
 applied to a horizontal time series is implemented in the `HorizontalETSModel`.
+
+`instrumentation` measures the time spent in the stages of making `Forecast`s
+(e.g., slicing time series or fitting models) and counts what happens.
+
+`planning` lists all the tactical `Forecast`s that still need to be made,
+based on the latest `Forecast`s in the database.
 """
 
+from urban_meal_delivery.forecasts import cube
+from urban_meal_delivery.forecasts import instrumentation
 from urban_meal_delivery.forecasts import methods
 from urban_meal_delivery.forecasts import models
+from urban_meal_delivery.forecasts import planning
 from urban_meal_delivery.forecasts import timify
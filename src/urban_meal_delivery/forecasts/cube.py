@@ -0,0 +1,536 @@
+"""Keep the order totals in a dense `pixel x day x time step` array.
+
+The `OrderHistory` class in the `timify` module stores the order totals in a
+`pd.DataFrame` with a `MultiIndex` of the "pixel_id"s and "start_at"s. That is
+convenient but slicing a time series out of it involves label-based indexing
+that is slow if done hundreds of thousands of times.
+
+The `DemandCube` defined here is an alternative storage for the same data.
+As it includes every day between the first and the last day with orders and
+every time step within the operating hours, a "start_at" maps to a position
+in the array by simple arithmetic. Then, the three kinds of time series
+(i.e., "horizontal", "vertical", and "real-time") become views of the array.
+
+As the time steps of a day are consecutive slots, a `DemandCube` with a
+longer time step is derived by summing up adjacent slots (cf., `.coarsen()`).
+So, the orders need to be aggregated only once at the finest granularity.
+
+A `DemandCube` is also persisted on disk in NumPy's `.npy` format so that
+the order totals can be re-used across runs without aggregating them again.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy import typing as npt
+
+from urban_meal_delivery import config
+
+
+class DemandCube:
+    """The order totals as a dense `pixel x day x time step` array.
+
+    The `.counts` hold one row per `Pixel`, one column per day, and one slot
+    per time step within the operating hours of a day. Rows are sorted by
+    "pixel_id" and columns are consecutive days starting at `.first_day`.
+
+    The rows may also represent other spatial units than `Pixel`s, for example,
+    `Address`es, which are then summed up into `Pixel`s (cf., `.project()`).
+
+    The arrays should not be mutated!
+    """
+
+    def __init__(
+        self,
+        counts: npt.NDArray[np.int64],
+        pixel_ids: npt.NDArray[np.int64],
+        first_day: Optional[dt.date],
+        time_step: int,
+    ) -> None:
+        """Initialize a new `DemandCube` object.
+
+        Args:
+            counts: order totals with shape `(n_pixels, n_days, n_daily_time_steps)`
+            pixel_ids: "pixel_id"s corresponding to the rows in `counts`
+            first_day: day corresponding to the first column in `counts`;
+                only `None` if there are no days in `counts`
+            time_step: interval length (in minutes) into which orders are aggregated
+
+        Raises:
+            ValueError: `counts` does not match `pixel_ids` or `time_step`
+        """
+        n_daily_time_steps = (
+            60 * (config.SERVICE_END - config.SERVICE_START) // time_step
+        )
+
+        if counts.ndim != 3 or counts.shape[2] != n_daily_time_steps:
+            raise ValueError(
+                '`counts` must have one slot per time step of the operating hours',
+            )
+        if counts.shape[0] != len(pixel_ids):
+            raise ValueError('`counts` must have one row per `pixel_id`')
+
+        self._counts = np.ascontiguousarray(counts)
+        self._pixel_ids = np.asarray(pixel_ids)
+        self._first_day = first_day
+        self._time_step = time_step
+        self._n_daily_time_steps = n_daily_time_steps
+
+        # Map the "pixel_id"s to the rows in `.counts`.
+        self._rows = {
+            pixel_id: row for row, pixel_id in enumerate(self._pixel_ids.tolist())
+        }
+
+    @classmethod
+    def from_totals(  # noqa:WPS210
+        cls,
+        totals: pd.DataFrame,
+        time_step: int,
+        *,
+        pixel_ids: Optional[Sequence[int]] = None,
+        first_day: Optional[dt.date] = None,
+        last_day: Optional[dt.date] = None,
+    ) -> DemandCube:
+        """Convert order totals as in `OrderHistory.totals` into a `DemandCube`.
+
+        This is an alternative constructor method.
+
+        "pixel_id"-"start_at" pairs missing in the `totals` are filled with `0`s.
+        The optional `pixel_ids`, `first_day`, and `last_day` extend the cube
+        beyond the `totals`, for example, to the `Pixel`s and days with `Order`s
+        only outside the operating hours.
+
+        Args:
+            totals: a one-column `DataFrame` with a `MultiIndex` of the
+                "pixel_id"s and "start_at"s; the column with data is "n_orders";
+                the first level may also hold the IDs of other spatial units
+            time_step: interval length (in minutes) into which orders are aggregated
+            pixel_ids: rows to be included even without any `totals`
+            first_day: first column to be included even without any `totals`
+            last_day: last column to be included even without any `totals`
+
+        Returns:
+            cube: the `totals` as a dense array
+
+        Raises:
+            ValueError: some "start_at" does not mark the beginning of a time step
+                within the operating hours
+        """
+        n_daily_time_steps = (
+            60 * (config.SERVICE_END - config.SERVICE_START) // time_step
+        )
+
+        if totals.empty:
+            totals_pixel_ids = np.array([], dtype=np.int64)
+            start_ats = pd.DatetimeIndex([])
+        else:
+            totals_pixel_ids = totals.index.get_level_values(0).to_numpy()
+            start_ats = pd.DatetimeIndex(totals.index.get_level_values('start_at'))
+        days = start_ats.normalize()
+
+        bounds = [
+            pd.Timestamp(day) for day in (first_day, last_day) if day is not None
+        ]
+        if len(days):
+            bounds.extend((days.min(), days.max()))
+
+        if not bounds:
+            return cls(
+                counts=np.zeros((0, 0, n_daily_time_steps), dtype=np.int64),
+                pixel_ids=np.array([], dtype=np.int64),
+                first_day=None,
+                time_step=time_step,
+            )
+
+        other_pixel_ids = np.asarray(
+            () if pixel_ids is None else pixel_ids, dtype=np.int64,
+        )
+        all_pixel_ids = np.unique(np.concatenate([totals_pixel_ids, other_pixel_ids]))
+        rows = np.searchsorted(all_pixel_ids, totals_pixel_ids)
+
+        first = min(bounds)
+        n_days = (max(bounds) - first) // pd.Timedelta(days=1) + 1
+        columns = ((days - first) // pd.Timedelta(days=1)).to_numpy()
+
+        # Minutes into the operating hours of a day.
+        minutes = (
+            (start_ats - days) // pd.Timedelta(minutes=1)
+        ).to_numpy() - 60 * config.SERVICE_START
+        if (  # noqa:WPS337
+            (minutes < 0).any()
+            or (minutes >= 60 * (config.SERVICE_END - config.SERVICE_START)).any()
+            or (minutes % time_step).any()
+        ):
+            raise ValueError('all "start_at"s must be time steps in operating hours')
+        slots = minutes // time_step
+
+        counts = np.zeros(
+            (len(all_pixel_ids), n_days, n_daily_time_steps), dtype=np.int64,
+        )
+        if not totals.empty:
+            counts[rows, columns, slots] = totals['n_orders'].to_numpy()
+
+        return cls(
+            counts=counts,
+            pixel_ids=all_pixel_ids,
+            first_day=first.date(),
+            time_step=time_step,
+        )
+
+    def to_totals(self) -> pd.DataFrame:
+        """Convert the `DemandCube` back into order totals.
+
+        Returns:
+            order_totals: a one-column `DataFrame` with a `MultiIndex` of the
+                "pixel_id"s and "start_at"s (i.e., beginnings of the intervals);
+                the column with data is "n_orders"
+        """
+        n_positions = self.n_days * self._n_daily_time_steps
+        index = pd.MultiIndex.from_product(
+            [self._pixel_ids, self.start_ats(np.arange(n_positions))],
+            names=['pixel_id', 'start_at'],
+        )
+
+        return pd.DataFrame(data={'n_orders': self._counts.reshape(-1)}, index=index)
+
+    def coarsen(self, time_step: int) -> DemandCube:
+        """Derive a `DemandCube` with a longer `time_step`.
+
+        The order totals of adjacent slots are summed up.
+
+        Args:
+            time_step: a whole multiple of the current `.time_step` that
+                divides the operating hours into equally long time steps
+
+        Returns:
+            cube: the same order totals aggregated into longer time steps
+
+        Raises:
+            ValueError: `time_step` is not compatible with the current one
+        """
+        if time_step % self._time_step:
+            raise ValueError('`time_step` must be a multiple of the current one')
+        if (60 * (config.SERVICE_END - config.SERVICE_START)) % time_step:
+            raise ValueError('`time_step` must divide the operating hours')
+
+        factor = time_step // self._time_step
+        n_pixels, n_days, _ = self._counts.shape
+        counts = self._counts.reshape(
+            n_pixels, n_days, self._n_daily_time_steps // factor, factor,
+        ).sum(axis=3)
+
+        return DemandCube(
+            counts=counts,
+            pixel_ids=self._pixel_ids,
+            first_day=self._first_day,
+            time_step=time_step,
+        )
+
+    def project(self, mapping: Dict[int, int]) -> DemandCube:
+        """Sum up the rows into groups, for example, `Address`es into `Pixel`s.
+
+        Args:
+            mapping: the new "pixel_id" for each of the current `.pixel_ids`;
+                rows whose "pixel_id" is not mapped are dropped
+
+        Returns:
+            cube: with one row per new "pixel_id" and the same days and time steps
+        """
+        sources, targets = [], []
+        for row, pixel_id in enumerate(self._pixel_ids.tolist()):
+            if pixel_id in mapping:
+                sources.append(row)
+                targets.append(mapping[pixel_id])
+
+        pixel_ids, groups = np.unique(
+            np.array(targets, dtype=np.int64), return_inverse=True,
+        )
+
+        if len(pixel_ids):
+            # Sort the rows by their group and sum up consecutive runs.
+            order = np.argsort(groups, kind='stable')
+            starts = np.flatnonzero(np.diff(groups[order], prepend=-1))
+            counts = np.add.reduceat(
+                self._counts[np.array(sources)[order]], starts, axis=0,
+            )
+        else:
+            counts = np.zeros((0, *self._counts.shape[1:]), dtype=self._counts.dtype)
+
+        return DemandCube(
+            counts=counts,
+            pixel_ids=pixel_ids,
+            first_day=self._first_day,
+            time_step=self._time_step,
+        )
+
+    def save(self, path: str) -> None:
+        """Persist the `DemandCube` in a folder on disk.
+
+        The folder contains the `.counts` and the `.pixel_ids` as `.npy` files
+        and a "meta.json" file with the `.first_day` and the `.time_step`.
+
+        The folder is written under a temporary name first and then renamed.
+        So, a reader never sees a partially written `DemandCube`. If the `path`
+        exists already, it is assumed to hold the same data and left untouched.
+
+        Args:
+            path: folder to be created
+        """
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp_path = tempfile.mkdtemp(dir=parent)
+
+        try:
+            np.save(os.path.join(tmp_path, 'counts.npy'), self._counts)
+            np.save(os.path.join(tmp_path, 'pixel_ids.npy'), self._pixel_ids)
+            with open(os.path.join(tmp_path, 'meta.json'), 'w') as file:
+                json.dump(
+                    {
+                        'first_day': (
+                            self._first_day.isoformat() if self._first_day else None
+                        ),
+                        'time_step': self._time_step,
+                    },
+                    file,
+                )
+            os.rename(tmp_path, path)
+        except OSError:
+            # Another process may have created the `path` in the meantime.
+            if not os.path.isdir(path):
+                raise
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> DemandCube:
+        """Load a `DemandCube` persisted with `.save()`.
+
+        This is an alternative constructor method.
+
+        Args:
+            path: folder created by `.save()`
+            mmap: memory-map the `.counts` (read-only) instead of reading them
+                into memory; then, only the parts actually sliced out are read
+
+        Returns:
+            cube: the persisted `DemandCube`
+        """
+        with open(os.path.join(path, 'meta.json')) as file:
+            meta = json.load(file)
+
+        counts = np.load(
+            os.path.join(path, 'counts.npy'), mmap_mode='r' if mmap else None,
+        )
+        pixel_ids = np.load(os.path.join(path, 'pixel_ids.npy'))
+        first_day = (
+            dt.date.fromisoformat(meta['first_day']) if meta['first_day'] else None
+        )
+
+        return cls(
+            counts=counts,
+            pixel_ids=pixel_ids,
+            first_day=first_day,
+            time_step=meta['time_step'],
+        )
+
+    @property
+    def counts(self) -> npt.NDArray[np.int64]:
+        """The order totals with shape `(n_pixels, n_days, n_daily_time_steps)`."""
+        return self._counts
+
+    @property
+    def pixel_ids(self) -> npt.NDArray[np.int64]:
+        """The "pixel_id"s corresponding to the rows in `.counts`."""
+        return self._pixel_ids
+
+    @property
+    def first_day(self) -> Optional[dt.date]:
+        """The day corresponding to the first column in `.counts`."""
+        return self._first_day
+
+    @property
+    def n_days(self) -> int:
+        """The number of days (i.e., columns) in `.counts`."""
+        return self._counts.shape[1]
+
+    @property
+    def time_step(self) -> int:
+        """The length of one time step."""
+        return self._time_step
+
+    @property
+    def n_daily_time_steps(self) -> int:
+        """The number of time steps (i.e., slots) per day in `.counts`."""
+        return self._n_daily_time_steps
+
+    def row(self, pixel_id: int) -> int:
+        """Map a "pixel_id" to its row in `.counts`.
+
+        Args:
+            pixel_id: pixel to be looked up
+
+        Returns:
+            row index
+
+        Raises:
+            LookupError: `pixel_id` not in `grid`
+        """
+        try:
+            return self._rows[pixel_id]
+        except KeyError:
+            raise LookupError('The `pixel_id` is not in the `grid`') from None
+
+    def column(self, day: dt.date) -> int:
+        """Map a day to its column in `.counts`.
+
+        The column is calculated arithmetically and may lie outside the
+        `.counts` if the `day` is not within the order history.
+
+        Args:
+            day: day to be looked up
+
+        Returns:
+            column index
+        """
+        if self._first_day is None:
+            return (day - config.CUTOFF_DAY.date()).days
+
+        return (day - self._first_day).days
+
+    def position(self, start_at: dt.datetime) -> int:
+        """Map a "start_at" to its position in a flattened row of `.counts`.
+
+        Flattened rows, as obtained with `.counts[row].reshape(-1)`, are
+        vertical time series covering all days in the order history.
+        The position may lie outside a flattened row if `start_at`
+        is not within the order history.
+
+        Args:
+            start_at: beginning of a time step within the operating hours
+
+        Returns:
+            position index
+
+        Raises:
+            LookupError: `start_at` is not the beginning of a time step
+                within the operating hours
+        """
+        minutes = 60 * (start_at.hour - config.SERVICE_START) + start_at.minute
+        if (  # noqa:WPS337
+            start_at.hour < config.SERVICE_START
+            or start_at.hour >= config.SERVICE_END
+            or minutes % self._time_step
+            or start_at.second
+            or start_at.microsecond
+        ):
+            raise LookupError('`start_at` is not a time step in the order history')
+
+        column = self.column(start_at.date())
+
+        return column * self._n_daily_time_steps + minutes // self._time_step
+
+    def positions(
+        self, start_ats: Sequence[dt.datetime],
+    ) -> npt.NDArray[np.int64]:
+        """Map many "start_at"s to their positions at once.
+
+        This is the vectorized version of `.position()`.
+
+        Args:
+            start_ats: beginnings of time steps within the operating hours
+
+        Returns:
+            position indexes
+
+        Raises:
+            LookupError: some `start_at` is not the beginning of a time step
+                within the operating hours
+        """
+        datetime_index = pd.DatetimeIndex(start_ats)
+        days = datetime_index.normalize()
+        first_day = pd.Timestamp(self._first_day or config.CUTOFF_DAY.date())
+
+        columns = ((days - first_day) // pd.Timedelta(days=1)).to_numpy()
+        # Time into the operating hours of a day.
+        seconds = (
+            (datetime_index - days) // pd.Timedelta(seconds=1)
+        ).to_numpy() - 60 * 60 * config.SERVICE_START
+        if (  # noqa:WPS337
+            (seconds < 0).any()
+            or (seconds >= 60 * 60 * (config.SERVICE_END - config.SERVICE_START)).any()
+            or (seconds % (60 * self._time_step)).any()
+            or datetime_index.microsecond.any()
+        ):
+            raise LookupError('`start_at` is not a time step in the order history')
+
+        return columns * self._n_daily_time_steps + seconds // (60 * self._time_step)
+
+    def start_ats(self, positions: npt.NDArray[np.int64]) -> pd.DatetimeIndex:
+        """Map positions in a flattened row of `.counts` to their "start_at"s.
+
+        Args:
+            positions: position indexes as returned by `.position()`
+
+        Returns:
+            start_ats: beginnings of the corresponding time steps
+        """
+        first_day = self._first_day or config.CUTOFF_DAY.date()
+        columns, slots = np.divmod(np.asarray(positions), self._n_daily_time_steps)
+
+        start_ats = (
+            np.datetime64(first_day, 'D')
+            + columns.astype('timedelta64[D]')
+            + np.timedelta64(config.SERVICE_START, 'h')
+            + (slots * self._time_step).astype('timedelta64[m]')
+        )
+
+        return pd.DatetimeIndex(start_ats.astype('datetime64[ns]'), name='start_at')
+
+    def slice_ts(
+        self,
+        row: int,
+        first_start_at: dt.datetime,
+        last_start_at: dt.datetime,
+        step: int = 1,
+    ) -> pd.Series:
+        """Slice a time series out of the `.counts`.
+
+        This method mimics label-based slicing on the order totals of a `Pixel`
+        as with `OrderHistory.totals.loc[pixel_id, 'n_orders']`: `first_start_at`
+        and `last_start_at` are both included, and the time series is cut off
+        without an error where the order history ends. The values are a view
+        of the `.counts` and must not be mutated!
+
+        Args:
+            row: row of the `Pixel` in `.counts` as returned by `.row()`
+            first_start_at: first time step in the time series
+            last_start_at: last time step in the time series
+            step: take only every `step`-th time step
+
+        Returns:
+            time series of order totals named "n_orders"
+        """
+        first = self.position(first_start_at)
+        last = self.position(last_start_at)
+
+        # Cut off the time series where the order history begins or ends.
+        first = max(first, 0)
+        last = min(last, self.n_days * self._n_daily_time_steps - 1)
+
+        if last < first:
+            # A negative `last` must not wrap around to the end of the row.
+            positions = np.arange(0)
+            values = self._counts[row].reshape(-1)[0:0]
+        else:
+            positions = np.arange(first, last + 1, step)
+            values = self._counts[row].reshape(-1)[first : last + 1 : step]
+
+        return pd.Series(values, index=self.start_ats(positions), name='n_orders')
@@ -0,0 +1,208 @@
+"""Measure where the time goes in a forecasting run.
+
+The module-level `metrics` object collects the time spent in the stages of
+making a `Forecast` and counts what happens along the way:
+
+- "slice": slicing the training time series out of an `OrderHistory`
+- "fit": running the forecasting `methods` (i.e., R or `statsmodels`)
+- "predict": `*Model.predict()` as a whole, including slicing and fitting
+- "lookup": looking up `Forecast`s made before (i.e., in a `ForecastCache`
+    or in the database)
+- "persist": inserting new `Forecast`s into the database
+
+Together with the counters (e.g., "cache_hits", "fits", "memo_hits", or
+"rows_written"), these tell if a run is bound by R, `pandas`, or PostgreSQL.
+
+Each process has its own `metrics`. So, worker processes send theirs back to
+the main process, which `.merge()`s them. A `Progress` object reports the
+throughput and an estimated time to completion (ETA) periodically, and
+`write_report()` persists everything as a JSON file at the end of a run.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import datetime as dt
+import functools
+import json
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import click
+
+
+class Metrics:
+    """Timers and counters."""
+
+    def __init__(self) -> None:
+        """Create new metrics with nothing recorded."""
+        self._seconds: Dict[str, float] = collections.defaultdict(float)
+        self._calls: Dict[str, int] = collections.defaultdict(int)
+        self._counters: Dict[str, int] = collections.defaultdict(int)
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Measure the time spent in a `with` block.
+
+        Args:
+            name: of the timer
+
+        Yields:
+            nothing
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._seconds[name] += time.perf_counter() - started_at
+            self._calls[name] += 1
+
+    def count(self, name: str, increment: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name: of the counter
+            increment: added to the counter
+        """
+        self._counters[name] += increment
+
+    def counter(self, name: str) -> int:
+        """The current value of a counter.
+
+        Args:
+            name: of the counter
+
+        Returns:
+            value: `0` if never incremented
+        """
+        return self._counters.get(name, 0)
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        """Add the metrics of another process.
+
+        Args:
+            other: as returned by `.to_dict()`
+        """
+        for name, timer in other['timers'].items():
+            self._seconds[name] += timer['seconds']
+            self._calls[name] += timer['calls']
+        for name, value in other['counters'].items():  # noqa:WPS110
+            self._counters[name] += value
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self._seconds.clear()
+        self._calls.clear()
+        self._counters.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the metrics.
+
+        Returns:
+            metrics: "timers" with the "calls" and total "seconds" and
+                "counters" by name; can be serialized as JSON
+        """
+        return {
+            'timers': {
+                name: {'calls': self._calls[name], 'seconds': self._seconds[name]}
+                for name in sorted(self._seconds)
+            },
+            'counters': dict(sorted(self._counters.items())),
+        }
+
+
+# The metrics of the current process.
+metrics = Metrics()
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator measuring the time spent in a function with `metrics`.
+
+    Args:
+        name: of the timer
+
+    Returns:
+        decorator: wraps a function and keeps its signature
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with metrics.timer(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Progress:
+    """Report the progress of a run periodically."""
+
+    def __init__(self, n_total: int, interval: float = 10) -> None:
+        """Start the clock.
+
+        Args:
+            n_total: number of `Forecast`s to be made in the run
+            interval: minimum number of seconds between two reports
+        """
+        self._n_total = n_total
+        self._n_done = 0
+        self._interval = interval
+        self._started_at = time.monotonic()
+        self._reported_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        """Number of seconds since the start of the run."""
+        return time.monotonic() - self._started_at
+
+    def update(self, n_done: int) -> None:
+        """Add to the `Forecast`s made and report the progress if it is time.
+
+        The last update (i.e., all `Forecast`s are made) is always reported.
+
+        Args:
+            n_done: number of `Forecast`s made since the last update
+        """
+        self._n_done += n_done
+        now = time.monotonic()
+        is_due = self._reported_at is None or (
+            now - self._reported_at >= self._interval
+        )
+
+        if is_due or self._n_done >= self._n_total:
+            self._reported_at = now
+            click.echo(self.line())
+
+    def line(self) -> str:
+        """The current progress in one line of text.
+
+        Returns:
+            progress: including the throughput and the ETA
+        """
+        elapsed = self.elapsed
+        rate = self._n_done / elapsed if elapsed > 0 else 0
+        n_remaining = max(self._n_total - self._n_done, 0)
+        eta = dt.timedelta(seconds=round(n_remaining / rate)) if rate else '?'
+
+        return (
+            f'Progress: {self._n_done}/{self._n_total} forecasts '
+            + f'({rate:.1f}/s), ETA {eta}'
+        )
+
+
+def write_report(path: str, run: Metrics, **details: Any) -> None:
+    """Write the metrics of a run into a JSON file.
+
+    Args:
+        path: of the JSON file
+        run: the metrics of all processes in the run
+        **details: further information on the run, e.g., its parameters;
+            must be serializable as JSON
+    """
+    report = {**details, **run.to_dict()}
+
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2)
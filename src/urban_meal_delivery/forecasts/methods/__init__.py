@@ -1,6 +1,11 @@
-"""Various forecasting methods implemented as functions."""
+"""Various forecasting methods implemented as functions.
+
+The `memoize` module provides decorators to not fit a method again with the
+same time series and arguments.
+"""
 
 from urban_meal_delivery.forecasts.methods import arima
 from urban_meal_delivery.forecasts.methods import decomposition
 from urban_meal_delivery.forecasts.methods import ets
 from urban_meal_delivery.forecasts.methods import extrapolate_season
+from urban_meal_delivery.forecasts.methods import memoize
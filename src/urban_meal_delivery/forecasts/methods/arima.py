@@ -1,19 +1,35 @@
 """A wrapper around R's "auto.arima" function."""
 
+from typing import Optional, Tuple
+
 import pandas as pd
 from rpy2 import robjects
 from rpy2.robjects import pandas2ri
 
+from urban_meal_delivery.forecasts.methods import memoize
+
 
+@memoize.memoize(index_from='forecast_interval')
 def predict(
     training_ts: pd.Series,
     forecast_interval: pd.DatetimeIndex,
     *,
     frequency: int,
     seasonal_fit: bool = False,
+    order: Optional[Tuple[int, int, int]] = None,
+    include_mean: bool = True,
+    include_drift: bool = False,
 ) -> pd.DataFrame:
     """Predict with an automatically chosen ARIMA model.
 
+    Choosing the model's order with "auto.arima" is the expensive part. If
+    the `order` is known (e.g., from a previous fit), only the coefficients are
+    fitted with R's "Arima" function. Should that fail, the order is chosen anew.
+
+    Besides the order, "auto.arima" also chooses if the model has a mean
+    (i.e., an intercept) or a drift term. So, to fit the same model as
+    before, these must be given together with the `order`.
+
     Note: The function does not check if the `forecast_interval`
     extends the `training_ts`'s interval without a gap!
 
@@ -23,13 +39,22 @@ def predict(
             its length becomes the step size `h` in the forecasting model in R
         frequency: frequency of the observations in the `training_ts`
         seasonal_fit: if a seasonal ARIMA model should be fitted
+        order: the (p, d, q) order of a non-seasonal ARIMA model to be fitted
+        include_mean: if the model with the `order` has a mean term;
+            not used without an `order` and ignored by R if `d > 0`
+        include_drift: if the model with the `order` has a drift term;
+            not used without an `order`
 
     Returns:
         predictions: point forecasts (i.e., the "prediction" column) and
-            confidence intervals (i.e, the four "low/high80/95" columns)
+            confidence intervals (i.e, the four "low/high80/95" columns);
+            the `.attrs` hold the fitted model's (non-seasonal) "order",
+            if it "include_mean"s and "include_drift"s, and the variance
+            of its residuals, "sigma2"
 
     Raises:
         ValueError: if `training_ts` contains `NaN` values
+            or an `order` is given for a seasonal fit
     """
     # Initialize R only if it is actually used.
     # For example, the nox session "ci-tests-fast" does not use it.
@@ -40,6 +65,8 @@ def predict(
 
     if training_ts.isnull().any():
         raise ValueError('`training_ts` must not contain `NaN` values')
+    if order is not None and seasonal_fit:
+        raise ValueError('an `order` can only be given for non-seasonal fits')
 
     # Copy the data from Python to R.
     robjects.globalenv['data'] = robjects.r['ts'](
@@ -49,13 +76,137 @@ def predict(
     seasonal = 'TRUE' if bool(seasonal_fit) else 'FALSE'
     n_steps_ahead = len(forecast_interval)
 
+    auto_arima = f'auto.arima(data, approximation = TRUE, seasonal = {seasonal:s})'
+    if order is not None:
+        p, d, q = order  # noqa:WPS111
+        mean = 'TRUE' if include_mean else 'FALSE'
+        drift = 'TRUE' if include_drift else 'FALSE'
+        model = (
+            f'tryCatch(Arima(data, order = c({p:d}, {d:d}, {q:d}), '
+            + f'include.mean = {mean:s}, include.drift = {drift:s}), '
+            + f'error = function(e) {auto_arima:s})'
+        )
+    else:
+        model = auto_arima
+
     # Make the predictions in R.
     result = robjects.r(
         f"""
-        as.data.frame(
-            forecast(
-                auto.arima(data, approximation = TRUE, seasonal = {seasonal:s}),
-                h = {n_steps_ahead:d}
+        fit <- {model:s}
+        list(
+            as.data.frame(forecast(fit, h = {n_steps_ahead:d})),
+            arimaorder(fit),
+            c("intercept", "drift") %in% names(coef(fit)),
+            fit$sigma2
+        )
+        """,
+    )
+
+    # Convert the results into a nice `pd.DataFrame` with the right `.index`.
+    forecasts = pandas2ri.rpy2py(result[0])
+    forecasts.index = forecast_interval
+
+    forecasts = forecasts.round(5).rename(
+        columns={
+            'Point Forecast': 'prediction',
+            'Lo 80': 'low80',
+            'Hi 80': 'high80',
+            'Lo 95': 'low95',
+            'Hi 95': 'high95',
+        },
+    )
+    forecasts.attrs['order'] = tuple(int(number) for number in result[1][:3])
+    forecasts.attrs['include_mean'] = bool(result[2][0])
+    forecasts.attrs['include_drift'] = bool(result[2][1])
+    forecasts.attrs['sigma2'] = float(result[3][0])
+
+    return forecasts
+
+
+@memoize.memoize_batch(batch_from='training_ts')
+def predict_batch(
+    training_ts: pd.DataFrame,
+    n_steps_ahead: int,
+    *,
+    frequency: int,
+    seasonal_fit: bool = False,
+) -> pd.DataFrame:
+    """Predict many time series with automatically chosen ARIMA models.
+
+    Unlike calling `predict()` for each time series, all time series are
+    copied to R at once and fitted in one call to R, which saves the fixed
+    overhead of an R round-trip per time series. The results are the same
+    as the ones of `predict()` because R is re-seeded for each time series.
+
+    Args:
+        training_ts: past observations to be fitted with one time series
+            per row (e.g., the training time series of one of the
+            `OrderHistory.make_*_batch()` methods); the `.index` holds the
+            time series' ids
+        n_steps_ahead: number of time steps to forecast per time series;
+            becomes the step size `h` in the forecasting model in R
+        frequency: frequency of the observations in the `training_ts`
+        seasonal_fit: if seasonal ARIMA models should be fitted
+
+    Returns:
+        predictions: point forecasts (i.e., the "prediction" column) and
+            confidence intervals (i.e, the four "low/high80/95" columns)
+            with a `pd.MultiIndex` of the time series' ids and the
+            time steps ahead, starting at `1`
+
+    Raises:
+        ValueError: if `training_ts` contains `NaN` values
+    """
+    if training_ts.isnull().any(axis=None):
+        raise ValueError('`training_ts` must not contain `NaN` values')
+
+    index = pd.MultiIndex.from_product(
+        [training_ts.index, range(1, n_steps_ahead + 1)],
+        names=[training_ts.index.name or 'series_id', 'step'],
+    )
+    if training_ts.empty:
+        return pd.DataFrame(
+            columns=['prediction', 'low80', 'high80', 'low95', 'high95'],
+            index=index,
+            dtype=float,
+        )
+
+    # Initialize R only if it is actually used.
+    # For example, the nox session "ci-tests-fast" does not use it.
+    from urban_meal_delivery import init_r  # noqa:F401,WPS433
+
+    # Copy the data from Python to R in one go.
+    n_series, n_obs = training_ts.shape
+    robjects.globalenv['data'] = robjects.r['matrix'](
+        robjects.FloatVector(training_ts.to_numpy(dtype=float).ravel()),
+        nrow=n_series,
+        ncol=n_obs,
+        byrow=True,
+    )
+
+    seasonal = 'TRUE' if bool(seasonal_fit) else 'FALSE'
+
+    # Make the predictions in R, re-seeding R for every time series
+    # to obtain the same results as with `predict()`.
+    result = robjects.r(
+        f"""
+        do.call(
+            rbind,
+            lapply(
+                seq_len(nrow(data)),
+                function(i) {{
+                    set.seed(42)
+                    as.data.frame(
+                        forecast(
+                            auto.arima(
+                                ts(data[i, ], frequency = {frequency:d}),
+                                approximation = TRUE,
+                                seasonal = {seasonal:s}
+                            ),
+                            h = {n_steps_ahead:d}
+                        )
+                    )
+                }}
             )
         )
         """,
@@ -63,7 +214,7 @@ def predict(
 
     # Convert the results into a nice `pd.DataFrame` with the right `.index`.
     forecasts = pandas2ri.rpy2py(result)
-    forecasts.index = forecast_interval
+    forecasts.index = index
 
     return forecasts.round(5).rename(
         columns={
@@ -1,7 +1,9 @@
 """Seasonal-trend decomposition procedure based on LOESS (STL).
 
 This module defines a `stl()` function that wraps R's STL decomposition function
-using the `rpy2` library.
+using the `rpy2` library. Alternatively, the decomposition runs natively in
+Python with `statsmodels`, whose STL implementation is a port of the same
+Fortran code R uses (cf., the `backend` argument of `stl()`).
 """
 
 import math
@@ -9,8 +11,12 @@ import math
 import pandas as pd
 from rpy2 import robjects
 from rpy2.robjects import pandas2ri
+from statsmodels.tsa import seasonal as sm_seasonal
 
+from urban_meal_delivery.forecasts.methods import memoize
 
+
+@memoize.memoize(index_from='time_series')
 def stl(  # noqa:C901,WPS210,WPS211,WPS231
     time_series: pd.Series,
     *,
@@ -26,10 +32,12 @@ def stl(  # noqa:C901,WPS210,WPS211,WPS231
     jl: int = None,
     ni: int = 2,
     no: int = 0,  # noqa:WPS110
+    backend: str = 'r',
 ) -> pd.DataFrame:
     """Decompose a time series into seasonal, trend, and residual components.
 
-    This is a Python wrapper around the corresponding R function.
+    This is a Python wrapper around the corresponding R function
+    or, alternatively, the `STL` class in `statsmodels`.
 
     Further info on the STL method:
         https://www.nniiem.ru/file/news/2016/stl-statistical-model.pdf
@@ -83,6 +91,9 @@ def stl(  # noqa:C901,WPS210,WPS211,WPS231
             also known as the "robustness" loop;
             if no outliers need to be handled, set `no=0`;
             otherwise, `no=5` or `no=10` combined with `ni=1` is a good choice
+        backend: either "r" to decompose the `time_series` with R's "stl"
+            function or "python" to do so with `statsmodels`;
+            the latter requires `nl` to be `> frequency`
 
     Returns:
         result: a DataFrame with three columns ("seasonal", "trend", and "residual")
@@ -154,6 +165,38 @@ def stl(  # noqa:C901,WPS210,WPS211,WPS231
     else:
         robust = False
 
+    if backend == 'python':
+        if nl <= frequency:
+            raise ValueError('`nl` must be `> frequency` with the "python" `backend`')
+
+        fit = sm_seasonal.STL(
+            time_series.to_numpy(dtype=float),
+            period=frequency,
+            seasonal=ns,
+            trend=nt,
+            low_pass=nl,
+            seasonal_deg=ds,
+            trend_deg=dt,
+            low_pass_deg=dl,
+            robust=robust,
+            seasonal_jump=js,
+            trend_jump=jt,
+            low_pass_jump=jl,
+        ).fit(inner_iter=ni, outer_iter=no)
+
+        result = pd.DataFrame(
+            data={
+                'seasonal': fit.seasonal,
+                'trend': fit.trend,
+                'residual': fit.resid,
+            },
+            index=time_series.index,
+        )
+
+        return result.round(5)
+    elif backend != 'r':
+        raise ValueError('`backend` must be either "r" or "python"')
+
     # Initialize R only if it is actually used.
     # For example, the nox session "ci-tests-fast" does not use it.
     from urban_meal_delivery import init_r  # noqa:F401,WPS433
@@ -1,16 +1,43 @@
-"""A wrapper around R's "ets" function."""
+"""A wrapper around R's "ets" function.
 
+As an alternative to R, the ETS models may also be fitted with `statsmodels`
+in Python (cf., the `backend` argument of `predict()`). Then, the automatic
+model selection mimics the one of R's "ets" function.
+"""
+
+import statistics
+import warnings
+from typing import List, Optional
+
+import numpy as np
 import pandas as pd
+from numpy import typing as npt
 from rpy2 import robjects
 from rpy2.robjects import pandas2ri
+from statsmodels.tools import eval_measures
+from statsmodels.tsa.exponential_smoothing import ets as sm_ets
+
+from urban_meal_delivery.forecasts.methods import memoize
+
+
+# Number of simulations for the confidence intervals of ETS models
+# with multiplicative seasonality in Python.
+N_SIMULATIONS = 200
+
+# The `factr` argument of `scipy`'s L-BFGS-B optimizer when fitting
+# ETS models in Python, which stops once the likelihood improves
+# relatively by less than about `2e-6` per iteration.
+FIT_TOLERANCE = 1e10
 
 
+@memoize.memoize(index_from='forecast_interval')
 def predict(
     training_ts: pd.Series,
     forecast_interval: pd.DatetimeIndex,
     *,
     frequency: int,
     seasonal_fit: bool = False,
+    backend: str = 'r',
 ) -> pd.DataFrame:
     """Predict with an automatically calibrated ETS model.
 
@@ -24,14 +51,32 @@ def predict(
         frequency: frequency of the observations in the `training_ts`
         seasonal_fit: if a "ZZZ" (seasonal) or a "ZZN" (non-seasonal)
             type ETS model should be fitted
+        backend: either "r" to fit the ETS model with R's "ets" function
+            or "python" to fit it with `statsmodels` (cf., `_predict_in_python()`)
 
     Returns:
         predictions: point forecasts (i.e., the "prediction" column) and
-            confidence intervals (i.e, the four "low/high80/95" columns)
+            confidence intervals (i.e, the four "low/high80/95" columns);
+            the `.attrs` hold the name of the fitted model as R has it,
+            "method" (e.g., "ETS(M,Ad,N)")
 
     Raises:
         ValueError: if `training_ts` contains `NaN` values
+            or `backend` is neither "r" nor "python"
     """
+    if training_ts.isnull().any():
+        raise ValueError('`training_ts` must not contain `NaN` values')
+
+    if backend == 'python':
+        return _predict_in_python(
+            training_ts=training_ts,
+            forecast_interval=forecast_interval,
+            frequency=frequency,
+            seasonal_fit=seasonal_fit,
+        )
+    elif backend != 'r':
+        raise ValueError('`backend` must be either "r" or "python"')
+
     # Initialize R only if it is actually used.
     # For example, the nox session "ci-tests-fast" does not use it.
     from urban_meal_delivery import init_r  # noqa:F401,WPS433
@@ -39,9 +84,6 @@ def predict(
     # Re-seed R every time it is used to ensure reproducibility.
     robjects.r('set.seed(42)')
 
-    if training_ts.isnull().any():
-        raise ValueError('`training_ts` must not contain `NaN` values')
-
     # Copy the data from Python to R.
     robjects.globalenv['data'] = robjects.r['ts'](
         pandas2ri.py2rpy(training_ts), frequency=frequency,
@@ -53,10 +95,139 @@ def predict(
     # Make the predictions in R.
     result = robjects.r(
         f"""
-        as.data.frame(
-            forecast(
-                ets(data, model = "{model:s}"),
-                h = {n_steps_ahead:d}
+        fit <- ets(data, model = "{model:s}")
+        list(
+            as.data.frame(forecast(fit, h = {n_steps_ahead:d})),
+            fit$method
+        )
+        """,
+    )
+
+    # Convert the results into a nice `pd.DataFrame` with the right `.index`.
+    forecasts = pandas2ri.rpy2py(result[0])
+    forecasts.index = forecast_interval
+
+    forecasts = forecasts.round(5).rename(
+        columns={
+            'Point Forecast': 'prediction',
+            'Lo 80': 'low80',
+            'Hi 80': 'high80',
+            'Lo 95': 'low95',
+            'Hi 95': 'high95',
+        },
+    )
+    forecasts.attrs['method'] = str(result[1][0])
+
+    return forecasts
+
+
+@memoize.memoize_batch(batch_from='training_ts')
+def predict_batch(  # noqa:WPS210
+    training_ts: pd.DataFrame,
+    n_steps_ahead: int,
+    *,
+    frequency: int,
+    seasonal_fit: bool = False,
+    backend: str = 'r',
+) -> pd.DataFrame:
+    """Predict many time series with automatically calibrated ETS models.
+
+    Unlike calling `predict()` for each time series, all time series are
+    copied to R at once and fitted in one call to R, which saves the fixed
+    overhead of an R round-trip per time series. The results are the same
+    as the ones of `predict()` because R is re-seeded for each time series.
+
+    Args:
+        training_ts: past observations to be fitted with one time series
+            per row (e.g., the training time series of one of the
+            `OrderHistory.make_*_batch()` methods); the `.index` holds the
+            time series' ids
+        n_steps_ahead: number of time steps to forecast per time series;
+            becomes the step size `h` in the forecasting model in R
+        frequency: frequency of the observations in the `training_ts`
+        seasonal_fit: if "ZZZ" (seasonal) or "ZZN" (non-seasonal)
+            type ETS models should be fitted
+        backend: either "r" to fit the ETS models with R's "ets" function
+            or "python" to fit them with `statsmodels`
+
+    Returns:
+        predictions: point forecasts (i.e., the "prediction" column) and
+            confidence intervals (i.e, the four "low/high80/95" columns)
+            with a `pd.MultiIndex` of the time series' ids and the
+            time steps ahead, starting at `1`
+
+    Raises:
+        ValueError: if `training_ts` contains `NaN` values
+            or `backend` is neither "r" nor "python"
+    """
+    if training_ts.isnull().any(axis=None):
+        raise ValueError('`training_ts` must not contain `NaN` values')
+
+    steps = pd.RangeIndex(1, n_steps_ahead + 1, name='step')
+    index = pd.MultiIndex.from_product(
+        [training_ts.index, steps],
+        names=[training_ts.index.name or 'series_id', 'step'],
+    )
+
+    if backend not in {'r', 'python'}:
+        raise ValueError('`backend` must be either "r" or "python"')
+    elif training_ts.empty:
+        return pd.DataFrame(
+            columns=['prediction', 'low80', 'high80', 'low95', 'high95'],
+            index=index,
+            dtype=float,
+        )
+    elif backend == 'python':
+        forecasts = pd.concat(
+            [
+                _predict_in_python(
+                    training_ts=row,
+                    forecast_interval=steps,
+                    frequency=frequency,
+                    seasonal_fit=seasonal_fit,
+                )
+                for _, row in training_ts.iterrows()
+            ],
+        )
+        forecasts.index = index
+
+        return forecasts
+
+    # Initialize R only if it is actually used.
+    # For example, the nox session "ci-tests-fast" does not use it.
+    from urban_meal_delivery import init_r  # noqa:F401,WPS433
+
+    # Copy the data from Python to R in one go.
+    n_series, n_obs = training_ts.shape
+    robjects.globalenv['data'] = robjects.r['matrix'](
+        robjects.FloatVector(training_ts.to_numpy(dtype=float).ravel()),
+        nrow=n_series,
+        ncol=n_obs,
+        byrow=True,
+    )
+
+    model = 'ZZZ' if bool(seasonal_fit) else 'ZZN'
+
+    # Make the predictions in R, re-seeding R for every time series
+    # to obtain the same results as with `predict()`.
+    result = robjects.r(
+        f"""
+        do.call(
+            rbind,
+            lapply(
+                seq_len(nrow(data)),
+                function(i) {{
+                    set.seed(42)
+                    as.data.frame(
+                        forecast(
+                            ets(
+                                ts(data[i, ], frequency = {frequency:d}),
+                                model = "{model:s}"
+                            ),
+                            h = {n_steps_ahead:d}
+                        )
+                    )
+                }}
             )
         )
         """,
@@ -64,7 +235,7 @@ def predict(
 
     # Convert the results into a nice `pd.DataFrame` with the right `.index`.
     forecasts = pandas2ri.rpy2py(result)
-    forecasts.index = forecast_interval
+    forecasts.index = index
 
     return forecasts.round(5).rename(
         columns={
@@ -75,3 +246,310 @@ def predict(
             'Hi 95': 'high95',
         },
     )
+
+
+def _predict_in_python(
+    training_ts: pd.Series,
+    forecast_interval: pd.DatetimeIndex,
+    *,
+    frequency: int,
+    seasonal_fit: bool,
+) -> pd.DataFrame:
+    """Predict with an automatically calibrated ETS model in Python.
+
+    The ETS model is chosen as with R's "ets" function (cf., `_select_model()`),
+    and, also like R, constant time series are forecast with the constant.
+
+    Like R's "forecast" function, the confidence intervals are calculated
+    analytically (i.e., for the "class 1" and "class 2" models in Hyndman
+    et al. (2008)) and only simulated for multiplicative seasonality.
+
+    Args:
+        training_ts: past observations to be fitted
+        forecast_interval: interval into which the `training_ts` is forecast
+        frequency: frequency of the observations in the `training_ts`
+        seasonal_fit: if a "ZZZ" (seasonal) or a "ZZN" (non-seasonal)
+            type ETS model should be fitted
+
+    Returns:
+        predictions: point forecasts (i.e., the "prediction" column) and
+            confidence intervals (i.e, the four "low/high80/95" columns);
+            the `.attrs` hold the name of the fitted model, "method"
+    """
+    # `statsmodels` needs a `pd.Series` with a regular index.
+    observations = pd.Series(training_ts.to_numpy(dtype=float))
+
+    if observations.min() == observations.max():
+        forecasts = pd.DataFrame(
+            data={
+                column: observations.iloc[0]
+                for column in ('prediction', 'low80', 'high80', 'low95', 'high95')
+            },
+            index=forecast_interval,
+        ).round(5)
+        # R forecasts constant time series with simple exponential smoothing.
+        forecasts.attrs['method'] = 'ETS(A,N,N)'
+
+        return forecasts
+
+    fit = _select_model(observations, frequency=frequency, seasonal_fit=seasonal_fit)
+
+    forecasts = _forecast_fit(fit, forecast_interval)
+    forecasts.attrs['method'] = _method_name(fit)
+
+    return forecasts
+
+
+def _forecast_fit(
+    fit: sm_ets.ETSResults, forecast_interval: pd.DatetimeIndex,
+) -> pd.DataFrame:
+    """Forecast with a fitted ETS model like R's "forecast" function.
+
+    Args:
+        fit: as chosen by `_select_model()`
+        forecast_interval: interval into which the `fit` is forecast
+
+    Returns:
+        predictions: point forecasts (i.e., the "prediction" column) and
+            confidence intervals (i.e, the four "low/high80/95" columns)
+    """
+    n_obs, n_steps_ahead = fit.model.nobs, len(forecast_interval)
+
+    if fit.model.seasonal == 'mul':
+        # Seed the simulations to ensure reproducibility.
+        prediction = fit.get_prediction(
+            start=n_obs,
+            end=n_obs + n_steps_ahead - 1,
+            method='simulated',
+            simulate_repetitions=N_SIMULATIONS,
+            random_state=42,
+        )
+        intervals80 = prediction.summary_frame(alpha=0.2)
+        intervals95 = prediction.summary_frame(alpha=0.05)
+
+        return pd.DataFrame(
+            data={
+                'prediction': intervals80['mean'].to_numpy(),
+                'low80': intervals80['pi_lower'].to_numpy(),
+                'high80': intervals80['pi_upper'].to_numpy(),
+                'low95': intervals95['pi_lower'].to_numpy(),
+                'high95': intervals95['pi_upper'].to_numpy(),
+            },
+            index=forecast_interval,
+        ).round(5)
+
+    means = fit.forecast(n_steps_ahead).to_numpy()
+    std = np.sqrt(_forecast_variance(fit, means))
+    z80 = statistics.NormalDist().inv_cdf(0.9)
+    z95 = statistics.NormalDist().inv_cdf(0.975)
+
+    return pd.DataFrame(
+        data={
+            'prediction': means,
+            'low80': means - z80 * std,
+            'high80': means + z80 * std,
+            'low95': means - z95 * std,
+            'high95': means + z95 * std,
+        },
+        index=forecast_interval,
+    ).round(5)
+
+
+def _select_model(  # noqa:WPS231
+    observations: pd.Series, *, frequency: int, seasonal_fit: bool,
+) -> sm_ets.ETSResults:
+    """Choose an ETS model for some observations like R's "ets" function.
+
+    Like R's "ets" function with its default arguments, all admissible ETS
+    models are fitted and the one with the lowest AICc is chosen:
+    - errors are additive or multiplicative,
+    - trends are none, additive, or additive damped,
+    - seasonality is none, additive, or multiplicative with a "ZZZ" model
+      and the `frequency` is between `2` and `24`, and none otherwise,
+    - multiplicative components require strictly positive observations,
+    - additive errors are not combined with multiplicative seasonality, and
+    - models with too many parameters for the observations are skipped.
+
+    The candidates are fitted for their parameters only with a tolerance
+    that does not change the chosen models in practice. So, the (numerically
+    expensive) statistics are calculated just for the winner.
+
+    Args:
+        observations: past observations to be fitted
+        frequency: frequency of the `observations`
+        seasonal_fit: if a "ZZZ" (seasonal) or a "ZZN" (non-seasonal)
+            type ETS model should be fitted
+
+    Returns:
+        fitted model with the lowest AICc
+
+    Raises:
+        RuntimeError: no ETS model could be fitted
+    """
+    n_obs = len(observations)
+    positive = observations.min() > 0
+    seasonal_types: List[Optional[str]] = [None]
+    if seasonal_fit and 1 < frequency <= 24 and n_obs > frequency:
+        seasonal_types.append('add')
+        if positive:
+            seasonal_types.append('mul')
+
+    best_aicc, best_model, best_params = np.inf, None, None
+    for error in ('add', 'mul') if positive else ('add',):
+        for trend, damped_trend in ((None, False), ('add', False), ('add', True)):
+            for seasonal in seasonal_types:
+                if error == 'add' and seasonal == 'mul':
+                    continue
+
+                # R skips these models as their AICc is not finite.
+                n_params = _n_parameters(
+                    trend=trend,
+                    damped_trend=damped_trend,
+                    seasonal=seasonal,
+                    frequency=frequency,
+                )
+                if n_params >= n_obs - 2:
+                    continue
+
+                model = sm_ets.ETSModel(
+                    observations,
+                    error=error,
+                    trend=trend,
+                    damped_trend=damped_trend,
+                    seasonal=seasonal,
+                    seasonal_periods=frequency if seasonal else None,
+                )
+                params = _fit_ets_model(model)
+                if params is None:
+                    continue
+
+                # The variance of the errors is a parameter as well.
+                aicc = eval_measures.aicc(model.loglike(params), n_obs, n_params + 1)
+                if aicc < best_aicc:
+                    best_aicc, best_model, best_params = aicc, model, params
+
+    if best_model is None:  # pragma: no cover
+        raise RuntimeError('no ETS model could be fitted')
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        return best_model.smooth(best_params)
+
+
+def _fit_ets_model(model: sm_ets.ETSModel) -> Optional[npt.NDArray[np.float64]]:
+    """Fit one ETS model with `statsmodels`.
+
+    Args:
+        model: to be fitted
+
+    Returns:
+        fitted parameters or `None` if the fitting failed
+    """
+    # Like R, models that cannot be fitted are skipped silently.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        try:
+            params = model.fit(disp=False, return_params=True, factr=FIT_TOLERANCE)
+        except (ValueError, ArithmeticError, NotImplementedError):
+            return None
+
+    if not np.isfinite(model.loglike(params)):
+        return None
+
+    return params
+
+
+def _n_parameters(
+    *,
+    trend: Optional[str],
+    damped_trend: bool,
+    seasonal: Optional[str],
+    frequency: int,
+) -> int:
+    """Count the parameters of an ETS model as R's "ets" function does.
+
+    These are the smoothing parameters and the initial states, of which one
+    seasonal state is determined by the others.
+
+    Args:
+        trend: either `None` or "add"
+        damped_trend: if the `trend` is damped
+        seasonal: either `None`, "add", or "mul"
+        frequency: frequency of the observations
+
+    Returns:
+        number of parameters
+    """
+    n_params = 2 + 2 * bool(trend) + int(damped_trend)
+
+    return n_params + frequency if seasonal else n_params
+
+
+def _forecast_variance(
+    fit: sm_ets.ETSResults, means: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Calculate the variances of the point forecasts analytically.
+
+    This implements the formulas of R's "forecast" package for ETS models
+    without multiplicative components (i.e., "class 1") and for ETS models
+    with multiplicative errors only (i.e., "class 2"). Like R, the variance
+    of the errors is estimated with the degrees of freedom taken into account.
+
+    Args:
+        fit: fitted model without multiplicative seasonality
+        means: point forecasts of the `fit`
+
+    Returns:
+        variances: of the point forecasts, one per time step ahead
+    """
+    model = fit.model
+    n_steps_ahead = len(means)
+
+    n_params = _n_parameters(
+        trend=model.trend,
+        damped_trend=model.damped_trend,
+        seasonal=model.seasonal,
+        frequency=model.seasonal_periods,
+    )
+    # The variance of the errors is a parameter as well.
+    sigma2 = np.sum(np.asarray(fit.resid) ** 2) / (model.nobs - (n_params + 1))
+
+    # The impact of an error on the forecast `j` time steps later.
+    steps = np.arange(1, n_steps_ahead)
+    impacts = np.full(len(steps), fit.smoothing_level)
+    if model.has_trend:
+        if model.damped_trend:
+            impacts += fit.smoothing_trend * np.cumsum(fit.damping_trend ** steps)
+        else:
+            impacts += fit.smoothing_trend * steps
+    if model.has_seasonal:
+        impacts += fit.smoothing_seasonal * (steps % model.seasonal_periods == 0)
+
+    if model.error == 'add':
+        return sigma2 * np.concatenate([[1], 1 + np.cumsum(impacts ** 2)])
+
+    thetas = np.empty(n_steps_ahead)
+    for step in range(n_steps_ahead):
+        thetas[step] = means[step] ** 2 + sigma2 * np.sum(
+            impacts[:step] ** 2 * thetas[:step][::-1],
+        )
+
+    return (1 + sigma2) * thetas - means ** 2
+
+
+def _method_name(fit: sm_ets.ETSResults) -> str:
+    """Name a fitted ETS model as R does, e.g., "ETS(M,Ad,N)".
+
+    Args:
+        fit: fitted model
+
+    Returns:
+        name
+    """
+    model = fit.model
+    components = {None: 'N', 'add': 'A', 'mul': 'M'}
+    trend = components[model.trend] + ('d' if model.damped_trend else '')
+
+    error, seasonal = components[model.error], components[model.seasonal]
+
+    return f'ETS({error},{trend},{seasonal})'
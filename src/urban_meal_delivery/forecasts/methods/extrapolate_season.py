@@ -1,6 +1,8 @@
 """Forecast by linear extrapolation of a seasonal component."""
 
+import numpy as np
 import pandas as pd
+from numpy import typing as npt
 from statsmodels.tsa import api as ts_stats
 
 
@@ -36,33 +38,16 @@ def predict(
     if training_ts.isnull().any():
         raise ValueError('`training_ts` must not contain `NaN` values')
 
-    extrapolated_ts = pd.Series(index=forecast_interval, dtype=float)
-    seasonal_lag = frequency * (training_ts.index[1] - training_ts.index[0])
-
-    for lag in range(frequency):
-        # Obtain all `observations` of the same seasonal lag and
-        # fit a straight line through them (= `trend`).
-        observations = training_ts[slice(lag, 999_999_999, frequency)]
-        trend = observations - ts_stats.detrend(observations)
-
-        # Create a point forecast by linear extrapolation
-        # for one or even more time steps ahead.
-        slope = trend[-1] - trend[-2]
-        prediction = trend[-1] + slope
-        idx = observations.index.max() + seasonal_lag
-        while idx <= forecast_interval.max():
-            if idx in forecast_interval:
-                extrapolated_ts.loc[idx] = prediction
-            prediction += slope
-            idx += seasonal_lag
-
-    # Sanity check.
-    if extrapolated_ts.isnull().any():  # pragma: no cover
-        raise ValueError('missing predictions in the `forecast_interval`')
+    extrapolated = _extrapolate(
+        training_ts.to_numpy(dtype=float).reshape(1, -1),
+        times=training_ts.index.asi8,
+        forecast_times=forecast_interval.asi8,
+        frequency=frequency,
+    )
 
     return pd.DataFrame(
         data={
-            'prediction': extrapolated_ts.round(5),
+            'prediction': extrapolated[0].round(5),
             'low80': float('NaN'),
             'high80': float('NaN'),
             'low95': float('NaN'),
@@ -70,3 +55,132 @@ def predict(
         },
         index=forecast_interval,
     )
+
+
+def predict_batch(
+    training_ts: pd.DataFrame, n_steps_ahead: int, *, frequency: int,
+) -> pd.DataFrame:
+    """Extrapolate many seasonal components with linear models.
+
+    This is the same as calling `predict()` for each time series.
+
+    Args:
+        training_ts: past observations to be fitted with one time series
+            per row; assumed to be seasonal components after time series
+            decomposition; the `.index` holds the time series' ids
+        n_steps_ahead: number of time steps to forecast per time series
+        frequency: frequency of the observations in the `training_ts`
+
+    Returns:
+        predictions: point forecasts (i.e., the "prediction" column) and
+            the four "low/high80/95" columns holding only `NaN` values
+            with a `pd.MultiIndex` of the time series' ids and the
+            time steps ahead, starting at `1`
+
+    Raises:
+        ValueError: if `training_ts` contains `NaN` values or some predictions
+            could not be made
+    """
+    if training_ts.isnull().any(axis=None):
+        raise ValueError('`training_ts` must not contain `NaN` values')
+
+    # The time steps are equally spaced and continue without a gap.
+    n_obs = training_ts.shape[1]
+    extrapolated = _extrapolate(
+        training_ts.to_numpy(dtype=float),
+        times=np.arange(n_obs),
+        forecast_times=np.arange(n_obs, n_obs + n_steps_ahead),
+        frequency=frequency,
+    )
+
+    return pd.DataFrame(
+        data={
+            'prediction': extrapolated.ravel().round(5),
+            'low80': float('NaN'),
+            'high80': float('NaN'),
+            'low95': float('NaN'),
+            'high95': float('NaN'),
+        },
+        index=pd.MultiIndex.from_product(
+            [training_ts.index, range(1, n_steps_ahead + 1)],
+            names=[training_ts.index.name or 'series_id', 'step'],
+        ),
+    )
+
+
+def _extrapolate(  # noqa:WPS210
+    observations: npt.NDArray[np.float64],
+    *,
+    times: npt.NDArray[np.int64],
+    forecast_times: npt.NDArray[np.int64],
+    frequency: int,
+) -> npt.NDArray[np.float64]:
+    """Extrapolate the seasonal lags of many time series.
+
+    For each seasonal lag, a straight line (= trend) is fitted through all
+    observations of the same lag. Then, its slope is added to the last trend
+    value once per `frequency` times the distance between two observations
+    ahead of the last observation of the lag. A time step to be forecast gets
+    the prediction of the (last) lag that hits it exactly in this way.
+
+    The lines are fitted with `ts_stats.detrend()` one lag after another and
+    the slopes are added one by one so that the predictions are the same as
+    with the original implementation stepping through the `forecast_times`.
+    Only that stepping is replaced with integer arithmetic on the `times`.
+
+    Note: If the `times` skip the nights, one week ahead may correspond to
+    several seasonal lags, and the slope is added several times.
+
+    Args:
+        observations: time series with shape `(n, n_obs)`
+        times: integer timestamps (e.g., nanoseconds) of the `observations`
+        forecast_times: integer timestamps of the time steps to forecast
+        frequency: frequency of the `observations`
+
+    Returns:
+        predictions with shape `(n, len(forecast_times))`
+
+    Raises:
+        ValueError: if some predictions could not be made (i.e., a seasonal
+            lag has less than two observations or a time step is not hit)
+    """
+    n_series, n_obs = observations.shape
+    lags = np.arange(frequency)
+
+    # The last observation of each seasonal lag.
+    counts = -(-(n_obs - lags) // frequency)  # noqa:WPS432 => ceiling division
+    if (counts < 2).any():
+        raise ValueError('missing predictions in the `forecast_interval`')
+    last_positions = lags + (counts - 1) * frequency
+
+    # Fit a straight line (= trend) through the observations of each lag.
+    last_trends = np.empty((n_series, frequency))
+    slopes = np.empty((n_series, frequency))
+    for series, values in enumerate(observations):  # noqa:WPS110
+        for lag in lags:
+            lag_values = values[lag::frequency]
+            trend = lag_values - ts_stats.detrend(lag_values)
+            last_trends[series, lag] = trend[-1]
+            slopes[series, lag] = trend[-1] - trend[-2]
+
+    # How many seasonal lags each time step is ahead of the last
+    # observation of every lag; the last lag hitting it wins.
+    seasonal_lag = frequency * (times[1] - times[0])
+    distances = forecast_times.reshape(-1, 1) - times[last_positions]
+    hits = (distances > 0) & (distances % seasonal_lag == 0)
+    step_lags = frequency - 1 - hits[:, ::-1].argmax(axis=1)
+    n_lags_ahead = distances[np.arange(len(forecast_times)), step_lags] // seasonal_lag
+
+    # Add the slopes one by one as in `prediction += slope`.
+    predictions = last_trends[:, step_lags]
+    step_slopes = slopes[:, step_lags]
+    for n_lags in range(1, n_lags_ahead.max(initial=0) + 1):
+        np.add(predictions, step_slopes, out=predictions, where=n_lags_ahead >= n_lags)
+
+    predictions[:, ~hits.any(axis=1)] = np.nan
+
+    # Sanity check.
+    if np.isnan(predictions).any():
+        raise ValueError('missing predictions in the `forecast_interval`')
+
+    return predictions
@@ -0,0 +1,305 @@
+"""Memoize the results of the forecasting `methods`.
+
+Many training time series are identical. For example, all `Pixel`s without
+any demand have time series with only `0`s, and the horizontal time series of
+adjacent days share most of their observations. Also, the `methods` are
+deterministic as they re-seed R every time they are used. So, a `method` need
+not be fitted again for the same input.
+
+The `memoize()` decorator keys a `method`'s results by a fingerprint of its
+arguments. A time series (i.e., `pd.Series`) enters the fingerprint with its
+values only, and a `pd.Index` (e.g., the `forecast_interval`) only with its
+length. Then, a result is re-used for time series with the same observations
+at other times, and its `.index` is set to the one the caller asks for.
+The fingerprint also contains the versions of this package and of the library
+fitting the `method` (i.e., R and its "forecast" package or `statsmodels`,
+depending on the `backend`) so that no results survive an upgrade.
+
+The `memoize_batch()` decorator does the same for `methods` fitting many time
+series at once (e.g., `ets.predict_batch()`): every time series is memoized on
+its own and only the ones not memoized yet are passed on to the `method`, each
+distinct time series only once.
+
+The results are kept in memory in a least-recently-used (LRU) fashion with at
+most `config.FIT_CACHE_SIZE` entries; setting it to `0` disables the
+memoization. If `config.CACHE_DIR` is set, the results are also persisted on
+disk so that they are re-used across runs. Every re-used result is counted as
+a "memo_hits" in the `instrumentation.metrics`.
+"""
+
+import collections
+import functools
+import hashlib
+import inspect
+import os
+import pickle  # noqa:S403
+import tempfile
+from typing import Any, Callable, Dict, Optional, OrderedDict
+
+import numpy as np
+import pandas as pd
+import statsmodels
+from rpy2 import robjects
+
+import urban_meal_delivery
+from urban_meal_delivery import config
+from urban_meal_delivery.forecasts import instrumentation
+
+
+Method = Callable[..., pd.DataFrame]
+
+# The results kept in memory across all memoized `methods`.
+_results: OrderedDict[str, pd.DataFrame] = collections.OrderedDict()
+
+
+def memoize(index_from: str) -> Callable[[Method], Method]:
+    """Decorator memoizing a `method` that returns a `pd.DataFrame`.
+
+    Args:
+        index_from: name of the argument from which the `.index` of a
+            re-used result is taken; if this argument is a `pd.Series`,
+            its `.index` is used
+
+    Returns:
+        decorator: wraps a `method` and keeps its signature
+    """
+
+    def decorator(method: Method) -> Method:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> pd.DataFrame:
+            if not config.FIT_CACHE_SIZE:
+                return method(*args, **kwargs)
+
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            key = fingerprint(method, arguments.arguments)
+
+            result = _lookup(key)
+            if result is None:
+                result = method(*args, **kwargs)
+                _store(key, result)
+            else:
+                instrumentation.metrics.count('memo_hits')
+
+            index = arguments.arguments[index_from]
+            if isinstance(index, pd.Series):
+                index = index.index
+
+            # Callers may change the result, so they get a copy.
+            result = result.copy()
+            result.index = index
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def memoize_batch(batch_from: str) -> Callable[[Method], Method]:
+    """Decorator memoizing a `method` that fits many time series at once.
+
+    The `method` must return a `pd.DataFrame` with the same number of rows per
+    time series, ordered like the time series, and with a `pd.MultiIndex` of the
+    time series' ids and the time steps ahead (e.g., `ets.predict_batch()`).
+
+    A batch is counted as one of the "memo_hits" only if none of its
+    time series is fitted. So, a partially memoized batch is still a "fit".
+
+    Args:
+        batch_from: name of the argument holding the time series
+            as a `pd.DataFrame` with one time series per row
+
+    Returns:
+        decorator: wraps a `method` and keeps its signature
+    """
+
+    def decorator(method: Method) -> Method:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(*args: Any, **kwargs: Any) -> pd.DataFrame:  # noqa:WPS210
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            batch = arguments.arguments[batch_from]
+
+            if not config.FIT_CACHE_SIZE or batch.empty:
+                return method(*args, **kwargs)
+
+            # Each time series is fingerprinted as if it were the only one.
+            keys = [
+                fingerprint(method, {**arguments.arguments, batch_from: values})
+                for values in batch.to_numpy(dtype=float)
+            ]
+            results: Dict[str, pd.DataFrame] = {}
+            for key in keys:
+                memoized = _lookup(key)
+                if memoized is not None:
+                    results[key] = memoized
+
+            # Identical time series within the batch are fitted only once.
+            missing: Dict[str, int] = {}
+            for row, key in enumerate(keys):
+                if key not in results:
+                    missing.setdefault(key, row)
+
+            if missing:
+                arguments.arguments[batch_from] = batch.iloc[list(missing.values())]
+                fitted = method(*arguments.args, **arguments.kwargs)
+                n_rows = len(fitted) // len(missing)
+                for position, key in enumerate(missing):
+                    result = fitted.iloc[position * n_rows : (position + 1) * n_rows]
+                    _store(key, result)
+                    results[key] = result
+            else:
+                instrumentation.metrics.count('memo_hits')
+
+            # `pd.concat()` makes a copy as callers may change the result.
+            ordered = [results[key] for key in keys]
+            result = pd.concat(ordered)
+            result.index = pd.MultiIndex.from_arrays(
+                [
+                    batch.index.repeat([len(row_result) for row_result in ordered]),
+                    result.index.get_level_values(-1),
+                ],
+                names=[batch.index.name or 'series_id', result.index.names[-1]],
+            )
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def fingerprint(method: Callable[..., Any], arguments: Dict[str, Any]) -> str:
+    """Hash a `method`, its `arguments`, and the versions of what fits it.
+
+    Args:
+        method: a forecasting `method`
+        arguments: the `method`'s arguments by name
+
+    Returns:
+        fingerprint: SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(f'{method.__module__}.{method.__qualname__}'.encode())
+    # `methods` without a `backend` argument always run in R.
+    digest.update(_versions(backend=arguments.get('backend', 'r')).encode())
+
+    for name, value in sorted(arguments.items()):  # noqa:WPS110
+        digest.update(name.encode())
+        if isinstance(value, (pd.Series, np.ndarray)):
+            digest.update(np.ascontiguousarray(value, dtype=float).tobytes())
+        elif isinstance(value, pd.Index):
+            digest.update(f'len={len(value)}'.encode())
+        else:
+            digest.update(repr(value).encode())
+
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _versions(backend: str) -> str:
+    """The versions of this package and of the library fitting the `methods`.
+
+    Args:
+        backend: either "r" or "python"
+
+    Returns:
+        versions: to be hashed into a fingerprint
+    """
+    versions = f'backend={backend};package={urban_meal_delivery.__version__};'
+
+    if backend == 'r':
+        # Initialize R only if it is actually used.
+        from urban_meal_delivery import init_r  # noqa:F401,WPS433
+
+        r_version = robjects.r('paste(R.version.string, packageVersion("forecast"))')
+        versions += f'r={r_version[0]}'
+    else:
+        versions += f'statsmodels={statsmodels.__version__}'
+
+    return versions
+
+
+def clear() -> None:
+    """Forget all results kept in memory."""
+    _results.clear()
+
+
+def _lookup(key: str) -> Optional[pd.DataFrame]:
+    """Look up a memoized result in memory and, if enabled, on disk.
+
+    Args:
+        key: fingerprint of the `method` call
+
+    Returns:
+        result: `None` if not memoized
+    """
+    if key in _results:
+        _results.move_to_end(key)
+        return _results[key]
+
+    path = _path(key)
+    if path is None or not os.path.exists(path):
+        return None
+
+    with open(path, 'rb') as file:
+        result = pickle.load(file)  # noqa:S301
+
+    _remember(key, result)
+
+    return result
+
+
+def _store(key: str, result: pd.DataFrame) -> None:
+    """Memoize a `method`'s result in memory and, if enabled, on disk.
+
+    Args:
+        key: fingerprint of the `method` call
+        result: what the `method` returned
+    """
+    _remember(key, result)
+
+    path = _path(key)
+    if path is None:
+        return
+
+    # Write to a temporary file first so that concurrent runs
+    # never see half-written results.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    with os.fdopen(file_descriptor, 'wb') as file:
+        pickle.dump(result, file)
+    os.replace(temp_path, path)
+
+
+def _remember(key: str, result: pd.DataFrame) -> None:
+    """Keep a result in memory and evict the least recently used ones.
+
+    Args:
+        key: fingerprint of the `method` call
+        result: what the `method` returned
+    """
+    _results[key] = result
+    _results.move_to_end(key)
+    while len(_results) > config.FIT_CACHE_SIZE:
+        _results.popitem(last=False)
+
+
+def _path(key: str) -> Optional[str]:
+    """The location of a memoized result on disk.
+
+    Args:
+        key: fingerprint of the `method` call
+
+    Returns:
+        path: `None` if `config.CACHE_DIR` is not set
+    """
+    if not config.CACHE_DIR:
+        return None
+
+    return os.path.join(config.CACHE_DIR, 'fits', key[:2], f'{key}.pickle')
@@ -20,7 +20,15 @@ the result of one of the forecasting `methods`, the concrete `.make_forecast()`
 method converts the results into `Forecast` (=ORM) objects.
 Also, `.make_forecast()` implements a caching strategy where already made
 `Forecast`s are loaded from the database instead of calculating them again,
-which could be a heavier computation.
+which could be a heavier computation. To not query the database for every
+`Forecast`, the `cache` module defines a `ForecastCache` that prefetches all
+`Forecast`s of a `Pixel` or `Grid` with one query. Similarly, the `writer`
+module defines a `ForecastWriter` that persists new `Forecast`s in batches.
+Apart from that, the `.predict_day()` method returns the predictions for all
+time steps of a day with one call, which horizontal `*Model`s make at once
+instead of one by one. The `.make_day_forecasts()` method builds on it to make
+the `Forecast`s missing for a day with one fit, and is what the
+"tactical-forecasts" command uses, with the same caching as `.make_forecast()`.
 
 The `tactical` sub-package contains all the `*Model`s used to implement the
 predictive routing strategy employed by the UDP.
@@ -30,8 +38,10 @@ A future `planning` sub-package will contain the `*Model`s used to plan the
 """  # noqa:RST215
 
 from urban_meal_delivery.forecasts.models.base import ForecastingModelABC
+from urban_meal_delivery.forecasts.models.cache import ForecastCache
 from urban_meal_delivery.forecasts.models.tactical.horizontal import HorizontalETSModel
 from urban_meal_delivery.forecasts.models.tactical.horizontal import HorizontalSMAModel
 from urban_meal_delivery.forecasts.models.tactical.other import TrivialModel
 from urban_meal_delivery.forecasts.models.tactical.realtime import RealtimeARIMAModel
 from urban_meal_delivery.forecasts.models.tactical.vertical import VerticalARIMAModel
+from urban_meal_delivery.forecasts.models.writer import ForecastWriter
@@ -2,23 +2,63 @@
 
 import abc
 import datetime as dt
+from typing import Any, Callable, List, Optional
 
 import pandas as pd
+from sqlalchemy.orm import attributes
 
+from urban_meal_delivery import config
 from urban_meal_delivery import db
+from urban_meal_delivery.forecasts import instrumentation
 from urban_meal_delivery.forecasts import timify
+from urban_meal_delivery.forecasts.models import cache
+from urban_meal_delivery.forecasts.models import writer
 
 
 class ForecastingModelABC(abc.ABC):
     """An abstract interface of a forecasting `*Model`."""
 
-    def __init__(self, order_history: timify.OrderHistory) -> None:
+    def __init__(
+        self,
+        order_history: timify.OrderHistory,
+        *,
+        forecast_cache: Optional[cache.ForecastCache] = None,
+        forecast_writer: Optional[writer.ForecastWriter] = None,
+    ) -> None:
         """Initialize a new forecasting model.
 
         Args:
             order_history: an abstraction providing the time series data
+            forecast_cache: `Forecast`s prefetched from the database;
+                if not provided, `.make_forecast()` queries the database
+            forecast_writer: persists the new `Forecast`s in batches;
+                if not provided, `.make_forecast()` commits them right away
         """
         self._order_history = order_history
+        self._forecast_cache = forecast_cache
+        self._forecast_writer = forecast_writer
+
+    def _run_method(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """Run one of the forecasting `methods` and time it as a "fit".
+
+        A result re-used by `methods.memoize` is not counted as one of the "fits".
+
+        Args:
+            method: e.g., `methods.ets.predict`
+            **kwargs: arguments passed on to the `method`
+
+        Returns:
+            the `method`'s result
+        """
+        memo_hits = instrumentation.metrics.counter('memo_hits')
+
+        with instrumentation.metrics.timer('fit'):
+            result = method(**kwargs)
+
+        if instrumentation.metrics.counter('memo_hits') == memo_hits:
+            instrumentation.metrics.count('fits')
+
+        return result
 
     @property
     @abc.abstractmethod
@@ -51,6 +91,64 @@ class ForecastingModelABC(abc.ABC):
                 may contain further rows for other time steps on the same day
         """  # noqa:DAR202
 
+    def predict_day(
+        self, pixel: db.Pixel, predict_day: dt.date, train_horizon: int,
+    ) -> pd.DataFrame:
+        """Make predictions for all time steps on a day.
+
+        By default, `.predict()` is called for the time steps on the
+        `predict_day` one after another, skipping the ones for which an
+        earlier call already made a prediction. So, vertical `*Model`s are
+        trained only once. Horizontal `*Model`s override this method to
+        make the predictions for all time steps at once.
+
+        Args:
+            pixel: pixel in which the predictions are made
+            predict_day: day for whose time steps the predictions are made
+            train_horizon: weeks of historic data used to predict `predict_day`
+
+        Returns:
+            actuals, predictions, and possibly 80%/95% confidence intervals;
+                contains one row for every time step on the `predict_day`
+        """
+        start_ats = self._start_ats(predict_day)
+
+        predictions = []
+        predicted = set()
+        for start_at in start_ats:
+            if start_at not in predicted:
+                step_predictions = self.predict(
+                    pixel, start_at.to_pydatetime(), train_horizon,
+                )
+                predictions.append(step_predictions)
+                predicted.update(step_predictions.index)
+
+        return pd.concat(predictions).loc[start_ats]
+
+    def _start_ats(self, predict_day: dt.date) -> pd.DatetimeIndex:
+        """The time steps on a day within the operating hours.
+
+        Args:
+            predict_day: day whose time steps are generated
+
+        Returns:
+            start_ats: named "start_at"
+        """
+        return pd.date_range(
+            dt.datetime(
+                predict_day.year,
+                predict_day.month,
+                predict_day.day,
+                config.SERVICE_START,
+            ),
+            periods=(
+                60 * (config.SERVICE_END - config.SERVICE_START)
+                // self._order_history.time_step
+            ),
+            freq=f'{self._order_history.time_step}T',
+            name='start_at',
+        )
+
     def make_forecast(
         self, pixel: db.Pixel, predict_at: dt.datetime, train_horizon: int,
     ) -> db.Forecast:
@@ -74,35 +172,20 @@ class ForecastingModelABC(abc.ABC):
 
         # noqa:DAR401 RuntimeError
         """
-        if (  # noqa:WPS337
-            cached_forecast := db.session.query(db.Forecast)  # noqa:WPS221
-            .filter_by(pixel=pixel)
-            .filter_by(start_at=predict_at)
-            .filter_by(time_step=self._order_history.time_step)
-            .filter_by(train_horizon=train_horizon)
-            .filter_by(model=self.name)
-            .first()
-        ) :
+        with instrumentation.metrics.timer('lookup'):
+            cached_forecast = self._lookup_forecast(pixel, predict_at, train_horizon)
+        if cached_forecast:
+            instrumentation.metrics.count('cache_hits')
             return cached_forecast
+        instrumentation.metrics.count('cache_misses')
 
         # Horizontal and real-time `*Model`s return a `pd.DataFrame` with one
         # row corresponding to the time step starting at `predict_at` whereas
         # vertical models return several rows, covering all time steps of a day.
-        predictions = self.predict(pixel, predict_at, train_horizon)
+        with instrumentation.metrics.timer('predict'):
+            predictions = self.predict(pixel, predict_at, train_horizon)
 
-        # Convert the `predictions` into a `list` of `Forecast` objects.
-        forecasts = db.Forecast.from_dataframe(
-            pixel=pixel,
-            time_step=self._order_history.time_step,
-            train_horizon=train_horizon,
-            model=self.name,
-            data=predictions,
-        )
-
-        # We persist all `Forecast`s into the database to
-        # not have to run the same model training again.
-        db.session.add_all(forecasts)
-        db.session.commit()
+        forecasts = self._persist_forecasts(pixel, train_horizon, predictions)
 
         # The one `Forecast` object asked for must be in `forecasts`
         # if the concrete `*Model.predict()` method works correctly; ...
@@ -114,3 +197,173 @@ class ForecastingModelABC(abc.ABC):
         raise RuntimeError(  # pragma: no cover
             '`Forecast` for `predict_at` was not returned by `*Model.predict()`',
         )
+
+    def make_day_forecasts(
+        self, pixel: db.Pixel, predict_day: dt.date, train_horizon: int,
+    ) -> List[db.Forecast]:
+        """Make the forecasts for all time steps on a day.
+
+        This is the same as calling `.make_forecast()` for every time step on
+        the `predict_day`. However, the `Forecast`s still missing are predicted
+        with only one call to `.predict_day()`, which fits horizontal `*Model`s
+        only once for the entire day instead of once per time step.
+
+        Args:
+            pixel: pixel in which the `Forecast`s are made
+            predict_day: day for whose time steps the `Forecast`s are made
+            train_horizon: weeks of historic data used to forecast `predict_day`
+
+        Returns:
+            forecasts: actuals, predictions, and possibly 80%/95% confidence
+                intervals for every time step on the `predict_day`
+
+        # noqa:DAR401 RuntimeError
+        """
+        start_ats = self._start_ats(predict_day)
+
+        forecasts = {}
+        with instrumentation.metrics.timer('lookup'):
+            for start_at in start_ats.to_pydatetime():
+                cached_forecast = self._lookup_forecast(pixel, start_at, train_horizon)
+                if cached_forecast:
+                    forecasts[start_at] = cached_forecast
+        instrumentation.metrics.count('cache_hits', len(forecasts))
+
+        n_missing = len(start_ats) - len(forecasts)
+        if not n_missing:
+            return list(forecasts.values())
+        instrumentation.metrics.count('cache_misses', n_missing)
+
+        with instrumentation.metrics.timer('predict'):
+            predictions = self.predict_day(pixel, predict_day, train_horizon)
+
+        # Only the `Forecast`s not made before are persisted.
+        predictions = predictions[~predictions.index.isin(list(forecasts))]
+        for forecast in self._persist_forecasts(pixel, train_horizon, predictions):
+            forecasts[forecast.start_at] = forecast
+
+        # Sanity check.
+        if len(forecasts) != len(start_ats):  # pragma: no cover
+            raise RuntimeError('some time steps were not returned by `.predict_day()`')
+
+        return [forecasts[start_at] for start_at in start_ats.to_pydatetime()]
+
+    def _persist_forecasts(
+        self, pixel: db.Pixel, train_horizon: int, predictions: pd.DataFrame,
+    ) -> List[db.Forecast]:
+        """Persist new `predictions` as `Forecast`s.
+
+        Args:
+            pixel: in which the `Forecast`s are made
+            train_horizon: weeks of historic data used for the `predictions`
+            predictions: as returned by `*Model.predict()` or `.predict_day()`
+
+        Returns:
+            forecasts: the `predictions` as `Forecast` objects
+        """
+        forecast_writer = self._forecast_writer
+
+        if forecast_writer is None:
+            # Convert the `predictions` into a `list` of `Forecast` objects.
+            forecasts = db.Forecast.from_dataframe(
+                pixel=pixel,
+                time_step=self._order_history.time_step,
+                train_horizon=train_horizon,
+                model=self.name,
+                data=predictions,
+            )
+
+            # We persist all `Forecast`s into the database to
+            # not have to run the same model training again.
+            with instrumentation.metrics.timer('persist'):
+                db.session.add_all(forecasts)
+                db.session.commit()
+            instrumentation.metrics.count('rows_written', len(forecasts))
+
+        else:
+            forecasts = self._write_forecasts(
+                forecast_writer, pixel, train_horizon, predictions,
+            )
+
+        # Keep the `forecast_cache` in sync with the database.
+        if self._forecast_cache is not None:
+            self._forecast_cache.add(forecasts)
+
+        return forecasts
+
+    def _write_forecasts(
+        self,
+        forecast_writer: writer.ForecastWriter,
+        pixel: db.Pixel,
+        train_horizon: int,
+        predictions: pd.DataFrame,
+    ) -> List[db.Forecast]:
+        """Hand the `predictions` to the `forecast_writer`.
+
+        The returned `Forecast` objects are not added to the session as the
+        `forecast_writer` inserts the rows itself. To that end, their `.pixel`
+        is set without the backref to `Pixel.forecasts`, which would add
+        them to the session as well.
+
+        Args:
+            forecast_writer: the `*Model`'s `forecast_writer`
+            pixel: in which the `Forecast`s are made
+            train_horizon: weeks of historic data used for the `predictions`
+            predictions: as returned by `*Model.predict()`
+
+        Returns:
+            forecasts: the `predictions` as `Forecast` objects
+        """
+        rows = db.Forecast.rows_from_dataframe(
+            pixel=pixel,
+            time_step=self._order_history.time_step,
+            train_horizon=train_horizon,
+            model=self.name,
+            data=predictions,
+        )
+        forecast_writer.add(rows)
+
+        forecasts = []
+        for row in rows:
+            forecast = db.Forecast(**row)
+            attributes.set_committed_value(forecast, 'pixel', pixel)
+            forecasts.append(forecast)
+
+        return forecasts
+
+    def _lookup_forecast(
+        self, pixel: db.Pixel, predict_at: dt.datetime, train_horizon: int,
+    ) -> Optional[db.Forecast]:
+        """Look up a `Forecast` made before.
+
+        If the `Forecast`s of the `pixel` on the day of `predict_at` are in
+        the `forecast_cache`, no database query is needed.
+
+        Args:
+            pixel: in which the `Forecast` is made
+            predict_at: time step (i.e., "start_at") of the `Forecast`
+            train_horizon: weeks of historic data used to forecast `predict_at`
+
+        Returns:
+            forecast: `None` if not made before
+        """
+        if self._forecast_cache is not None and self._forecast_cache.covers(
+            pixel, predict_at.date(),
+        ):
+            return self._forecast_cache.get(
+                pixel=pixel,
+                start_at=predict_at,
+                time_step=self._order_history.time_step,
+                train_horizon=train_horizon,
+                model=self.name,
+            )
+
+        return (
+            db.session.query(db.Forecast)  # noqa:WPS221
+            .filter_by(pixel=pixel)
+            .filter_by(start_at=predict_at)
+            .filter_by(time_step=self._order_history.time_step)
+            .filter_by(train_horizon=train_horizon)
+            .filter_by(model=self.name)
+            .first()
+        )
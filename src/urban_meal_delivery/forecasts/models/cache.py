@@ -0,0 +1,148 @@
+"""An in-memory cache of the `Forecast`s already in the database.
+
+`*Model.make_forecast()` first checks if the `Forecast` asked for is already
+in the database. Without a `ForecastCache`, that is one query per `predict_at`.
+With a `ForecastCache`, all `Forecast`s of a `Pixel`, or a whole `Grid`, and
+a range of days are loaded with one query up front (cf., `.prefetch()`), and
+the checks become dictionary look-ups.
+
+A `ForecastCache` is shared by all the `*Model`s that make `Forecast`s for
+the prefetched `Pixel`s and days. So, it outlives the short-lived `*Model`s.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from urban_meal_delivery import db
+
+
+# The columns in the unique constraint of the "forecasts" table: "pixel_id",
+# "start_at", "time_step", "train_horizon", and "model".
+Key = Tuple[int, dt.datetime, int, int, str]
+
+
+class ForecastCache:
+    """The `Forecast`s of some `Pixel`s and days."""
+
+    def __init__(self) -> None:
+        """Create a new and empty cache."""
+        self._forecasts: Dict[Key, db.Forecast] = {}
+
+        # The days prefetched for individual `Pixel`s and entire `Grid`s.
+        self._pixel_days: Dict[int, List[Tuple[dt.date, dt.date]]] = {}
+        self._grid_days: Dict[int, List[Tuple[dt.date, dt.date]]] = {}
+
+    def __len__(self) -> int:
+        """Number of `Forecast`s in the cache."""
+        return len(self._forecasts)
+
+    def prefetch(
+        self,
+        pixel_or_grid: Union[db.Pixel, db.Grid],
+        first_day: dt.date,
+        last_day: dt.date,
+    ) -> int:
+        """Load all `Forecast`s for a `Pixel` or `Grid` from the database.
+
+        Args:
+            pixel_or_grid: the `Forecast`s made in a `Pixel` or
+                in all the `Pixel`s of a `Grid` are loaded
+            first_day: first day of the `Forecast`s to be loaded
+            last_day: last day of the `Forecast`s to be loaded (included)
+
+        Returns:
+            number of `Forecast`s loaded
+        """
+        query = (
+            db.session.query(db.Forecast)
+            .filter(db.Forecast.start_at >= first_day)
+            .filter(db.Forecast.start_at < last_day + dt.timedelta(days=1))
+        )
+
+        if isinstance(pixel_or_grid, db.Grid):
+            query = query.join(db.Pixel, db.Forecast.pixel_id == db.Pixel.id).filter(
+                db.Pixel.grid_id == pixel_or_grid.id,
+            )
+            days = self._grid_days
+        else:
+            query = query.filter(db.Forecast.pixel_id == pixel_or_grid.id)
+            days = self._pixel_days
+
+        forecasts = query.all()
+        self.add(forecasts)
+        days.setdefault(pixel_or_grid.id, []).append((first_day, last_day))
+
+        return len(forecasts)
+
+    def add(self, forecasts: Iterable[db.Forecast]) -> None:
+        """Put `Forecast`s into the cache.
+
+        Args:
+            forecasts: e.g., the ones just made and persisted in the database
+        """
+        for forecast in forecasts:
+            self._forecasts[self._key_of(forecast)] = forecast
+
+    def covers(self, pixel: db.Pixel, day: dt.date) -> bool:
+        """Check if all `Forecast`s of a `Pixel` on a day were prefetched.
+
+        Only then, a `Forecast` missing in the cache is not in the database.
+
+        Args:
+            pixel: in which the `Forecast`s are made
+            day: on which the `Forecast`s are made
+
+        Returns:
+            covered
+        """
+        ranges = self._pixel_days.get(pixel.id, []) + self._grid_days.get(
+            pixel.grid_id, [],
+        )
+
+        return any(first_day <= day <= last_day for first_day, last_day in ranges)
+
+    def get(  # noqa:WPS211
+        self,
+        pixel: db.Pixel,
+        start_at: dt.datetime,
+        time_step: int,
+        train_horizon: int,
+        model: str,
+    ) -> Optional[db.Forecast]:
+        """Look up a `Forecast`.
+
+        Args:
+            pixel: in which the `Forecast` is made
+            start_at: time step the `Forecast` is made for
+            time_step: length of one time step in minutes
+            train_horizon: length of the training horizon in weeks
+            model: name of the forecasting `*Model`
+
+        Returns:
+            forecast: `None` if not in the cache
+        """
+        return self._forecasts.get(
+            (pixel.id, start_at, time_step, train_horizon, model),
+        )
+
+    @staticmethod
+    def _key_of(forecast: db.Forecast) -> Key:
+        """The values of a `Forecast`'s unique constraint.
+
+        Args:
+            forecast: a `Forecast` object
+
+        Returns:
+            key
+        """
+        pixel_id = forecast.pixel_id if forecast.pixel is None else forecast.pixel.id
+
+        return (
+            pixel_id,
+            forecast.start_at,
+            forecast.time_step,
+            forecast.train_horizon,
+            forecast.model,
+        )
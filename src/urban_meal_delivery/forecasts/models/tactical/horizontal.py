@@ -11,6 +11,7 @@ import datetime as dt
 
 import pandas as pd
 
+from urban_meal_delivery import config
 from urban_meal_delivery import db
 from urban_meal_delivery.forecasts import methods
 from urban_meal_delivery.forecasts.models import base
@@ -49,11 +50,13 @@ class HorizontalETSModel(base.ForecastingModelABC):
             raise RuntimeError('`frequency` should be `7`')
 
         # Make `predictions` with the seasonal ETS method ("ZZZ" model).
-        predictions = methods.ets.predict(
+        predictions = self._run_method(
+            methods.ets.predict,
             training_ts=training_ts,
             forecast_interval=pd.DatetimeIndex(actuals_ts.index),
             frequency=frequency,  # `== 7`, the number of weekdays
             seasonal_fit=True,  # because there was no decomposition before
+            backend=config.ETS_BACKEND,
         )
 
         predictions.insert(loc=0, column='actual', value=actuals_ts)
@@ -66,6 +69,55 @@ class HorizontalETSModel(base.ForecastingModelABC):
 
         return predictions
 
+    def predict_day(
+        self, pixel: db.Pixel, predict_day: dt.date, train_horizon: int,
+    ) -> pd.DataFrame:
+        """Predict demand for all time steps on a day.
+
+        The horizontal time series of all time steps are sliced in one pass
+        and fitted with one call to R (cf., `methods.ets.predict_batch()`).
+
+        Args:
+            pixel: pixel in which the predictions are made
+            predict_day: day for whose time steps the predictions are made
+            train_horizon: weeks of historic data used to predict `predict_day`
+
+        Returns:
+            actual order counts (i.e., the "actual" column),
+                point forecasts (i.e., the "prediction" column), and
+                confidence intervals (i.e, the four "low/high/80/95" columns);
+                contains one row for every time step on the `predict_day`
+
+        # noqa:DAR401 RuntimeError
+        """
+        # Generate the historic (and horizontal) order time series.
+        training_ts, frequency, actuals_ts = self._order_history.make_horizontal_day(
+            pixel_id=pixel.id, predict_day=predict_day, train_horizon=train_horizon,
+        )
+
+        # Sanity check.
+        if frequency != 7:  # pragma: no cover
+            raise RuntimeError('`frequency` should be `7`')
+
+        # Make `predictions` with the seasonal ETS method ("ZZZ" model)
+        # one time step ahead for every time step.
+        predictions = self._run_method(
+            methods.ets.predict_batch,
+            training_ts=training_ts,
+            n_steps_ahead=1,
+            frequency=frequency,  # `== 7`, the number of weekdays
+            seasonal_fit=True,  # because there was no decomposition before
+            backend=config.ETS_BACKEND,
+        ).droplevel('step')
+
+        predictions.insert(loc=0, column='actual', value=actuals_ts)
+
+        # Sanity check.
+        if predictions.isnull().sum().any():  # pragma: no cover
+            raise RuntimeError('missing predictions in hets model')
+
+        return predictions
+
 
 class HorizontalSMAModel(base.ForecastingModelABC):
     """A simple moving average model applied on a horizontal time series."""
@@ -128,3 +180,46 @@ class HorizontalSMAModel(base.ForecastingModelABC):
             raise RuntimeError('missing prediction for `predict_at`')
 
         return predictions
+
+    def predict_day(
+        self, pixel: db.Pixel, predict_day: dt.date, train_horizon: int,
+    ) -> pd.DataFrame:
+        """Predict demand for all time steps on a day.
+
+        The averages of the horizontal time series of all time steps
+        are calculated at once.
+
+        Args:
+            pixel: pixel in which the predictions are made
+            predict_day: day for whose time steps the predictions are made
+            train_horizon: weeks of historic data used to predict `predict_day`
+
+        Returns:
+            actual order counts (i.e., the "actual" column) and
+                point forecasts (i.e., the "prediction" column);
+                this model does not support confidence intervals;
+                contains one row for every time step on the `predict_day`
+
+        # noqa:DAR401 RuntimeError
+        """
+        # Generate the historic (and horizontal) order time series.
+        training_ts, frequency, actuals_ts = self._order_history.make_horizontal_day(
+            pixel_id=pixel.id, predict_day=predict_day, train_horizon=train_horizon,
+        )
+
+        # Sanity check.
+        if frequency != 7:  # pragma: no cover
+            raise RuntimeError('`frequency` should be `7`')
+
+        # The "prediction"s are calculated as in `.predict()`.
+        return pd.DataFrame(
+            data={
+                'actual': actuals_ts,
+                'prediction': training_ts.to_numpy().mean(axis=1),
+                'low80': float('NaN'),
+                'high80': float('NaN'),
+                'low95': float('NaN'),
+                'high95': float('NaN'),
+            },
+            index=actuals_ts.index,
+        )
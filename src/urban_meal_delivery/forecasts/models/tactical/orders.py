@@ -0,0 +1,125 @@
+"""Re-use the orders of the ARIMA models selected on previous days.
+
+The `*Model`s that use the ARIMA method (i.e., `RealtimeARIMAModel` and
+`VerticalARIMAModel`) let R's "auto.arima" function choose the (p, d, q) order
+of the model in a stepwise search for every fit, which is the expensive part
+of the fitting. Yet, the chosen order rarely changes from one day to the next
+within a `Pixel`.
+
+So, the `predict()` function below remembers the order chosen for a `Pixel`
+and a `*Model`, together with the mean and drift terms, and only re-fits the
+coefficients on the following days. The
+order is chosen anew after `config.ARIMA_ORDER_DAYS` days or if the fit
+quality degrades, which is when the variance of the residuals grows by more
+than `config.ARIMA_ORDER_TOLERANCE` (i.e., a share) compared to the fit that
+chose the order. A `config.ARIMA_ORDER_DAYS` of `0` disables the re-use.
+
+The chosen orders are kept in memory for the lifetime of the process as the
+`*Model`s themselves are short-lived objects (cf., the tactical CLI command).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any, Callable, Dict, NamedTuple, Tuple
+
+import pandas as pd
+
+from urban_meal_delivery import config
+from urban_meal_delivery.forecasts import methods
+
+
+class _Selection(NamedTuple):
+    """An order chosen by R's "auto.arima" function."""
+
+    order: Tuple[int, int, int]
+    include_mean: bool
+    include_drift: bool
+    day: dt.date
+    sigma2: float
+
+    @classmethod
+    def from_predictions(cls, predictions: pd.DataFrame, day: dt.date) -> _Selection:
+        """Remember the model fitted for some `predictions`.
+
+        This is an alternative constructor method.
+
+        Args:
+            predictions: as returned by `methods.arima.predict()`
+            day: the day on which the `predictions` are made
+
+        Returns:
+            selection
+        """
+        return cls(
+            order=predictions.attrs['order'],
+            include_mean=predictions.attrs['include_mean'],
+            include_drift=predictions.attrs['include_drift'],
+            day=day,
+            sigma2=predictions.attrs['sigma2'],
+        )
+
+    @property
+    def model(self) -> Dict[str, Any]:
+        """The arguments to fit the same model with `methods.arima.predict()`."""
+        return {
+            'order': self.order,
+            'include_mean': self.include_mean,
+            'include_drift': self.include_drift,
+        }
+
+
+# The chosen orders by `*Model.name`, `Pixel.id`,
+# time step, and training horizon.
+_selections: Dict[Tuple[str, int, int, int], _Selection] = {}
+
+
+def predict(
+    run_method: Callable[..., pd.DataFrame],
+    key: Tuple[str, int, int, int],
+    day: dt.date,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Predict with the ARIMA method, re-using a previously chosen order.
+
+    Args:
+        run_method: runs `methods.arima.predict()` with the given arguments
+            (e.g., the `*Model`'s `._run_method()`)
+        key: `*Model.name`, `Pixel.id`, time step, and training horizon
+        day: the day on which the prediction is made
+        **kwargs: arguments passed on to `methods.arima.predict()`
+
+    Returns:
+        predictions: as returned by `methods.arima.predict()`
+    """
+    if config.ARIMA_ORDER_DAYS <= 0:
+        return run_method(methods.arima.predict, **kwargs)
+
+    selection = _selections.get(key)
+
+    if (
+        selection is not None
+        and 0 <= (day - selection.day).days < config.ARIMA_ORDER_DAYS
+    ):
+        predictions = run_method(methods.arima.predict, **selection.model, **kwargs)
+        fit_is_good = predictions.attrs['sigma2'] <= selection.sigma2 * (
+            1 + config.ARIMA_ORDER_TOLERANCE
+        )
+
+        # R chooses the order anew if the old one cannot be fitted.
+        new_selection = _Selection.from_predictions(predictions, day)
+        if new_selection.model != selection.model:
+            _selections[key] = new_selection
+            return predictions
+        elif fit_is_good:
+            return predictions
+
+    predictions = run_method(methods.arima.predict, **kwargs)
+    _selections[key] = _Selection.from_predictions(predictions, day)
+
+    return predictions
+
+
+def clear() -> None:
+    """Forget all chosen orders."""
+    _selections.clear()
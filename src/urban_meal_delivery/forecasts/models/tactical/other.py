@@ -73,3 +73,44 @@ class TrivialModel(base.ForecastingModelABC):
             raise RuntimeError('missing prediction for `predict_at`')
 
         return predictions
+
+    def predict_day(
+        self, pixel: db.Pixel, predict_day: dt.date, train_horizon: int,
+    ) -> pd.DataFrame:
+        """Predict demand for all time steps on a day.
+
+        Args:
+            pixel: pixel in which the predictions are made
+            predict_day: day for whose time steps the predictions are made
+            train_horizon: weeks of historic data used to predict `predict_day`
+
+        Returns:
+            actual order counts (i.e., the "actual" column) and
+                point forecasts (i.e., the "prediction" column);
+                this model does not support confidence intervals;
+                contains one row for every time step on the `predict_day`
+
+        # noqa:DAR401 RuntimeError
+        """
+        # As in `.predict()`, the time series are generated mainly to check
+        # if valid training time series exist.
+        _, frequency, actuals_ts = self._order_history.make_horizontal_day(
+            pixel_id=pixel.id, predict_day=predict_day, train_horizon=train_horizon,
+        )
+
+        # Sanity check.
+        if frequency != 7:  # pragma: no cover
+            raise RuntimeError('`frequency` should be `7`')
+
+        # The "prediction"s are simply `0.0`.
+        return pd.DataFrame(
+            data={
+                'actual': actuals_ts,
+                'prediction': 0.0,
+                'low80': float('NaN'),
+                'high80': float('NaN'),
+                'low95': float('NaN'),
+                'high95': float('NaN'),
+            },
+            index=actuals_ts.index,
+        )
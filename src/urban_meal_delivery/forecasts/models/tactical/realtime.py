@@ -13,9 +13,11 @@ import datetime as dt
 
 import pandas as pd
 
+from urban_meal_delivery import config
 from urban_meal_delivery import db
 from urban_meal_delivery.forecasts import methods
 from urban_meal_delivery.forecasts.models import base
+from urban_meal_delivery.forecasts.models.tactical import orders
 
 
 class RealtimeARIMAModel(base.ForecastingModelABC):
@@ -48,12 +50,14 @@ class RealtimeARIMAModel(base.ForecastingModelABC):
 
         # Decompose the `training_ts` to make predictions for the seasonal
         # component and the seasonally adjusted observations separately.
-        decomposed_training_ts = methods.decomposition.stl(
+        decomposed_training_ts = self._run_method(
+            methods.decomposition.stl,
             time_series=training_ts,
             frequency=frequency,
             # "Periodic" `ns` parameter => same seasonal component value
             # for observations of the same lag.
             ns=999,
+            backend=config.STL_BACKEND,
         )
 
         # Make predictions for the seasonal component by linear extrapolation.
@@ -64,7 +68,11 @@ class RealtimeARIMAModel(base.ForecastingModelABC):
         )
 
         # Make predictions with the ARIMA model on the seasonally adjusted time series.
-        seasonally_adjusted_predictions = methods.arima.predict(
+        # The model's order chosen on a previous day may be re-used.
+        seasonally_adjusted_predictions = orders.predict(
+            self._run_method,
+            key=(self.name, pixel.id, self._order_history.time_step, train_horizon),
+            day=predict_at.date(),
             training_ts=(
                 decomposed_training_ts['trend'] + decomposed_training_ts['residual']
             ),
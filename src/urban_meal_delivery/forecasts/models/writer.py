@@ -0,0 +1,128 @@
+"""A buffered writer that persists `Forecast`s in batches.
+
+Without a `ForecastWriter`, `*Model.make_forecast()` adds the `Forecast` (=ORM)
+objects it makes to the session and commits them right away. That is one
+transaction per call, and a tactical run makes hundreds of thousands of calls.
+
+With a `ForecastWriter`, the `Forecast`s are buffered as plain rows and
+inserted with one Core `INSERT` statement per batch of
+`config.FORECAST_BATCH_SIZE` rows. As the `db.engine` is created with the
+"values" `executemany_mode`, SQLAlchemy passes the many rows on to `psycopg2`'s
+`execute_values()` helper, which sends them as one multi-row `VALUES` list per
+batch instead of one `INSERT` per row. Each batch is committed in its own
+transaction. So, a crash loses at most the `Forecast`s buffered in one batch,
+which are then simply made again in the next run.
+
+`Forecast`s that are already in the database (e.g., inserted concurrently by
+another process) are skipped by the `ON CONFLICT DO NOTHING` clause on the
+unique constraint of the "forecasts" table.
+
+As the buffered `Forecast`s are not yet in the database, a `ForecastWriter`
+should be used together with a `ForecastCache` that keeps track of them.
+"""
+
+from __future__ import annotations
+
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from sqlalchemy.dialects import postgresql
+
+from urban_meal_delivery import config
+from urban_meal_delivery import db
+from urban_meal_delivery.forecasts import instrumentation
+
+
+# The columns in the unique constraint of the "forecasts" table.
+UNIQUE_COLUMNS = ('pixel_id', 'start_at', 'time_step', 'train_horizon', 'model')
+
+
+class ForecastWriter:
+    """Buffer `Forecast` rows and insert them in batches."""
+
+    def __init__(self, batch_size: Optional[int] = None) -> None:
+        """Create a new writer with an empty buffer.
+
+        Args:
+            batch_size: number of rows inserted at once;
+                defaults to `config.FORECAST_BATCH_SIZE`
+
+        Raises:
+            ValueError: if `batch_size` is not positive
+        """
+        if batch_size is None:
+            batch_size = config.FORECAST_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError('`batch_size` must be positive')
+
+        self._batch_size = batch_size
+        self._rows: List[Dict[str, Any]] = []
+        self._n_written = 0
+
+    def __len__(self) -> int:
+        """Number of rows buffered but not yet written."""
+        return len(self._rows)
+
+    def __enter__(self) -> ForecastWriter:
+        """Use the writer as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Write the remaining rows if no error occurred."""
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def n_written(self) -> int:
+        """Number of rows written so far, including the skipped ones."""
+        return self._n_written
+
+    def add(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Buffer rows and write them once a batch is full.
+
+        Args:
+            rows: as returned by `Forecast.rows_from_dataframe()`
+        """
+        self._rows.extend(rows)
+
+        if len(self._rows) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered rows in one transaction.
+
+        If the transaction fails, it is rolled back and the rows stay
+        in the buffer so that a later `.flush()` writes them again.
+
+        Returns:
+            number of rows written
+
+        Raises:
+            Exception: whatever the database raised, after the rollback
+        """
+        if not self._rows:
+            return 0
+
+        statement = (
+            postgresql.insert(db.Forecast.__table__)  # noqa:WPS609
+            .on_conflict_do_nothing(index_elements=UNIQUE_COLUMNS)
+        )
+        with instrumentation.metrics.timer('persist'):
+            try:
+                db.session.execute(statement, self._rows)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+        n_rows = len(self._rows)
+        instrumentation.metrics.count('rows_written', n_rows)
+        self._n_written += n_rows
+        self._rows = []
+
+        return n_rows
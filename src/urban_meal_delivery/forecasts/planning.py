@@ -0,0 +1,113 @@
+"""Plan the tactical `Forecast`s still to be made.
+
+The tactical forecasts are made for every `Pixel` of a `Grid` and every day,
+starting `train_horizon` weeks after the `Pixel`'s first order, or, if some
+`Forecast`s are already in the database, on the day of the latest of them.
+
+`last_predictions()` obtains these latest `Forecast`s for all `Pixel`s of a
+`Grid` with one grouped query, and `plan_tactical_forecasts()` turns them into
+the full list of work that remains to be done. So, the total amount of work is
+known before the first `Forecast` is made.
+"""
+
+import datetime as dt
+from typing import Dict, Iterable, List, NamedTuple
+
+from sqlalchemy import func
+
+from urban_meal_delivery import db
+from urban_meal_delivery.forecasts import timify
+
+
+class Task(NamedTuple):
+    """The `Forecast`s for one `Pixel` and day made with one `*Model`."""
+
+    pixel_id: int
+    predict_day: dt.date
+    model: str
+
+
+def last_predictions(
+    grid: db.Grid, time_step: int, train_horizon: int,
+) -> Dict[int, dt.datetime]:  # pragma: no cover
+    """Look up the latest `Forecast` of every `Pixel` in a `Grid`.
+
+    Important: This may need to be adapted once further commands are added
+    that make `Forecast`s without the tactical heuristic!
+
+    Args:
+        grid: whose `Pixel`s are looked up
+        time_step: length of one time step in minutes
+        train_horizon: length of the training horizon in weeks
+
+    Returns:
+        last_predict_ats: the latest "start_at" by `Pixel.id`;
+            `Pixel`s without any `Forecast`s are not included
+    """
+    query = (
+        db.session.query(db.Forecast.pixel_id, func.max(db.Forecast.start_at))
+        .join(db.Pixel, db.Forecast.pixel_id == db.Pixel.id)
+        .filter(db.Pixel.grid_id == grid.id)
+        .filter(db.Forecast.time_step == time_step)
+        .filter(db.Forecast.train_horizon == train_horizon)
+        .group_by(db.Forecast.pixel_id)
+    )
+
+    return dict(query.all())
+
+
+def plan_tactical_forecasts(
+    order_history: timify.OrderHistory,
+    pixel_ids: Iterable[int],
+    train_horizon: int,
+    last_predict_ats: Dict[int, dt.datetime],
+) -> List[Task]:
+    """List all the days to be forecast for some `Pixel`s.
+
+    A `Pixel`'s days start on the day of its latest `Forecast` as
+    some `Forecast`s on that day may be missing, or, without any
+    `Forecast`s yet, `train_horizon` weeks after its first order.
+    They end on the day of the `Pixel`'s last order.
+
+    Args:
+        order_history: with the historic order data loaded
+        pixel_ids: of the `Pixel`s to be forecast
+        train_horizon: length of the training horizon in weeks
+        last_predict_ats: as returned by `last_predictions()`
+
+    Returns:
+        tasks: ordered by `Pixel` and day with the `*Model` chosen by
+            `OrderHistory.choose_tactical_model()`
+    """
+    # The `*Model`s are looked up by name in the `.tactical_schedule()`,
+    # which is calculated only once for all `Pixel`s and days, without
+    # instantiating any of them.
+    schedule = order_history.tactical_schedule(train_horizon=train_horizon)
+    model_names = schedule['model'].to_dict()
+    tasks = []
+
+    for pixel_id in pixel_ids:
+        last_predict_at = last_predict_ats.get(pixel_id)
+        if last_predict_at is None:
+            predict_day = order_history.first_order_at(pixel_id=pixel_id).date()
+            predict_day += dt.timedelta(weeks=train_horizon)
+        else:
+            predict_day = last_predict_at.date()
+        last_day = order_history.last_order_at(pixel_id=pixel_id).date()
+
+        while predict_day <= last_day:
+            try:
+                model_name = model_names[pixel_id, predict_day]
+            except KeyError:
+                # Raises the appropriate error for days not in the schedule.
+                model_name = order_history.choose_tactical_model(
+                    pixel_id=pixel_id,
+                    predict_day=predict_day,
+                    train_horizon=train_horizon,
+                ).name
+            tasks.append(
+                Task(pixel_id=pixel_id, predict_day=predict_day, model=model_name),
+            )
+            predict_day += dt.timedelta(days=1)
+
+    return tasks
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Tuple
+import os
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
 
+import numpy as np
 import pandas as pd
 import sqlalchemy as sa
+from numpy import typing as npt
 
 from urban_meal_delivery import config
 from urban_meal_delivery import db
+from urban_meal_delivery.forecasts import instrumentation
 from urban_meal_delivery.forecasts import models
+from urban_meal_delivery.forecasts.cube import DemandCube
 
 
 class OrderHistory:
@@ -18,19 +23,41 @@ class OrderHistory:
 
     The purpose of this class is to abstract away the managing of the order data
     in memory and the slicing the data into various kinds of time series.
+
+    The order totals are always available as a `pd.DataFrame` (cf., `.totals`).
+    With the "cube" `storage`, time series are sliced out of a dense copy of them
+    (cf., `.cube`) instead, which is a lot faster if many time series are needed.
+
+    To work with several time steps, the orders should be aggregated only once
+    with the shortest one (e.g., quarters of an hour) and the `OrderHistory`s
+    with the longer time steps are derived from that in memory (cf., `.coarsen()`).
+
+    If `config.CACHE_DIR` is set, the order totals are cached on disk and
+    only aggregated again if the `Order`s in the database change (cf., `.load()`).
     """
 
-    def __init__(self, grid: db.Grid, time_step: int) -> None:
+    def __init__(
+        self, grid: db.Grid, time_step: int, *, storage: str = 'dataframe',
+    ) -> None:
         """Initialize a new `OrderHistory` object.
 
         Args:
             grid: pixel grid used to aggregate orders spatially
             time_step: interval length (in minutes) into which orders are aggregated
+            storage: either "dataframe" or "cube"; the data structure
+                from which the time series are sliced
+
+        Raises:
+            ValueError: `storage` is neither "dataframe" nor "cube"
 
         # noqa:DAR401 RuntimeError
         """
+        if storage not in {'dataframe', 'cube'}:
+            raise ValueError('`storage` must be either "dataframe" or "cube"')
+
         self._grid = grid
         self._time_step = time_step
+        self._storage = storage
 
         # Number of daily time steps must be a whole multiple of `time_step` length.
         n_daily_time_steps = (
@@ -40,8 +67,20 @@ class OrderHistory:
             raise RuntimeError('Internal error: configuration has invalid TIME_STEPS')
         self._n_daily_time_steps = int(n_daily_time_steps)
 
-        # The `_data` are populated by `.aggregate_orders()`.
+        # Either the `_data` or the `_cube` are populated by `.load()`
+        # and the other one is derived from them on demand.
         self._data = None
+        self._cube: Optional[DemandCube] = None
+
+        # The latest `Order.placed_at` aggregated into the `_data`.
+        self._last_placed_at: Optional[dt.datetime] = None
+
+        # Summaries derived from the order totals on demand
+        # (cf., `.activity` and `.tactical_schedule()`);
+        # the `_activity_by_pixel` is filled in together with the `_activity`.
+        self._activity: Optional[pd.DataFrame] = None
+        self._activity_by_pixel: Dict[int, Tuple[pd.Timestamp, pd.Timestamp]] = {}
+        self._schedules: Dict[int, pd.DataFrame] = {}
 
     @property
     def time_step(self) -> int:
@@ -60,28 +99,445 @@ class OrderHistory:
                 the column with data is "n_orders"
         """
         if self._data is None:
-            self._data = self.aggregate_orders()
+            if self._cube is None:
+                self.load()
+            if self._data is None:
+                self._data = self.cube.to_totals()
 
         return self._data
 
+    @property
+    def cube(self) -> DemandCube:
+        """The `.totals` as a dense `pixel x day x time step` array.
+
+        The returned object should not be mutated!
+
+        Returns:
+            order_totals: a `DemandCube` with the same data as the `.totals`
+        """
+        if self._cube is None:
+            if self._data is None:
+                self.load()
+            if self._cube is None:
+                self._cube = DemandCube.from_totals(
+                    self._data, time_step=self._time_step,
+                )
+
+        return self._cube
+
+    @property
+    def activity(self) -> pd.DataFrame:
+        """When the `Pixel`s have orders.
+
+        The returned object should not be mutated!
+
+        Returns:
+            activity: a `DataFrame` indexed by "pixel_id" with the first and last
+                "start_at"s with orders ("first_order_at" and "last_order_at")
+                and the number of days with orders ("n_active_days");
+                "start_at"s are `NaT` for `Pixel`s without orders
+        """
+        if self._activity is None:
+            cube = self.cube
+            has_orders = (
+                cube.counts.reshape(
+                    len(cube.pixel_ids), cube.n_days * cube.n_daily_time_steps,
+                )
+                > 0
+            )
+            active = has_orders.any(axis=1)
+
+            if has_orders.size:
+                # `argmax()` finds the first `True` value in each row.
+                first_positions = has_orders.argmax(axis=1)
+                last_positions = (
+                    has_orders.shape[1] - 1 - has_orders[:, ::-1].argmax(axis=1)
+                )
+            else:  # no `Order`s at all
+                first_positions = last_positions = np.zeros(0, dtype=np.int64)
+
+            self._activity = pd.DataFrame(
+                data={
+                    'first_order_at': cube.start_ats(first_positions).where(active),
+                    'last_order_at': cube.start_ats(last_positions).where(active),
+                    'n_active_days': (cube.counts.sum(axis=2) > 0).sum(axis=1),
+                },
+                index=pd.Index(cube.pixel_ids, name='pixel_id'),
+            )
+            # Look up individual `Pixel`s without `pandas`' indexing overhead.
+            self._activity_by_pixel = {
+                pixel_id: (first_order_at, last_order_at)
+                for pixel_id, first_order_at, last_order_at in zip(
+                    cube.pixel_ids.tolist(),
+                    self._activity['first_order_at'],
+                    self._activity['last_order_at'],
+                )
+            }
+
+        return self._activity
+
+    def load(self) -> None:
+        """Load all order totals into memory.
+
+        Without a `config.CACHE_DIR`, this is the same as `.aggregate_orders()`,
+        or `.aggregate_cube()` with the "cube" `storage`.
+
+        Otherwise, the order totals are read from a cache on disk that is keyed
+        by the `grid`, the `.time_step`, and a fingerprint of the `Order`s in the
+        database (i.e., their number and the latest `Order.placed_at`). Then,
+        the order totals are memory-mapped into a `DemandCube` (cf., `.cube`).
+        If there is no cache entry, the order totals are aggregated and cached.
+
+        `.totals` and `.cube` call this method implicitly when first accessed.
+        """
+        self._data = self._cube = None
+        self._clear_derived()
+
+        path = None
+        if config.CACHE_DIR is not None:
+            n_orders, last_placed_at = self._fingerprint()
+            if last_placed_at is not None:  # there are `Order`s at all
+                path = os.path.join(
+                    config.CACHE_DIR,
+                    'totals',
+                    f'{self._grid.id}-{self._time_step}-{n_orders}-'
+                    + last_placed_at.strftime('%Y%m%d%H%M%S%f'),
+                )
+
+        if path is not None and os.path.isdir(path):
+            self._cube = DemandCube.load(path)
+            # All `Order`s up to the fingerprint's `last_placed_at` are aggregated.
+            self._last_placed_at = last_placed_at
+            return
+
+        if self._storage == 'cube':
+            self._cube = self.aggregate_cube()
+        else:
+            self._data = self.aggregate_orders()
+
+        if path is not None:
+            self.cube.save(path)
+
+    def _clear_derived(self) -> None:
+        """Discard the summaries derived from the order totals."""
+        self._activity = None
+        self._activity_by_pixel = {}
+        # The `.tactical_schedule()`s keyed by the `train_horizon`.
+        self._schedules = {}
+
+    def _fingerprint(self) -> Tuple[int, dt.datetime]:  # pragma: no cover
+        """Summarize the state of the `Order`s in the database.
+
+        Returns:
+            n_orders, last_placed_at
+        """
+        query = sa.select(
+            [sa.func.count(db.Order.id), sa.func.max(db.Order.placed_at)],
+        )
+        n_orders, last_placed_at = db.connection.execute(query).first()
+
+        return n_orders, last_placed_at
+
+    @classmethod
+    def from_cube(
+        cls, grid: db.Grid, cube: DemandCube, *, storage: str = 'dataframe',
+    ) -> OrderHistory:
+        """Create an `OrderHistory` from order totals already in a `DemandCube`.
+
+        This is an alternative constructor method that does not query the
+        database (e.g., with a `DemandCube.load()`ed from disk).
+
+        Args:
+            grid: pixel grid the order totals were aggregated with
+            cube: the order totals; its `.time_step` becomes the `.time_step`
+            storage: either "dataframe" or "cube"; cf., `.__init__()`
+
+        Returns:
+            order_history: with the `cube` as its `.cube`
+        """
+        order_history = cls(grid=grid, time_step=cube.time_step, storage=storage)
+        order_history._cube = cube  # noqa:WPS437
+
+        return order_history
+
+    def coarsen(self, time_step: int) -> OrderHistory:
+        """Derive an `OrderHistory` with a longer `time_step`.
+
+        The order totals are summed up over adjacent time steps in memory
+        instead of aggregating them from the database again.
+
+        Args:
+            time_step: a whole multiple of the current `.time_step` that
+                divides the operating hours into equally long time steps
+
+        Returns:
+            order_history: with the same `grid` and `storage`
+
+        Raises:
+            ValueError: `time_step` is not compatible with the current one
+
+        # noqa:DAR402 ValueError
+        """
+        order_history = OrderHistory.from_cube(
+            grid=self._grid, cube=self.cube.coarsen(time_step), storage=self._storage,
+        )
+        # The derived order totals may be `.refresh()`ed as well.
+        order_history._last_placed_at = self._last_placed_at  # noqa:WPS437
+
+        return order_history
+
     def aggregate_orders(self) -> pd.DataFrame:  # pragma: no cover
         """Generate and load all order totals from the database."""
         # `data` is probably missing "pixel_id"-"start_at" pairs.
         # This happens when there is no demand in the `Pixel` in the given `time_step`.
+        data = self._query_totals()
+
+        if data.empty:
+            return data
+
+        # Re-index `data` filling in `0`s where there is no demand.
+        index = self._make_complete_index(
+            pixel_ids=data.index.levels[0],
+            first_day=data.index.levels[1].min().date(),
+            last_day=data.index.levels[1].max().date(),
+        )
+
+        return data.reindex(index, fill_value=0)
+
+    def aggregate_cube(self) -> DemandCube:  # pragma: no cover
+        """Generate and load all order totals from the database as a `DemandCube`.
+
+        Other than with `.aggregate_orders()`, the `Order`s are binned into the
+        time steps with integer arithmetic on epoch seconds and the `0`s are
+        filled in by the database. The result is streamed through a server-side
+        cursor with one row per `Pixel` holding all its order totals in an array.
+
+        As with `.aggregate_orders()`, the days and `Pixel`s with `Order`s only
+        outside the operating hours are included with `0`s.
+
+        Returns:
+            order_totals: the same data as `.aggregate_orders()` in a `DemandCube`
+        """
+        n_daily_time_steps = self._n_daily_time_steps
+        seconds_per_day = 24 * 60 * 60
+        service_start = config.SERVICE_START * 60 * 60
+        service_end = config.SERVICE_END * 60 * 60
+
+        result = db.connection.execution_options(stream_results=True).execute(
+            sa.text(
+                f"""  -- # noqa:WPS221
+                WITH orders_with_epochs AS (
+                    SELECT
+                        {config.CLEAN_SCHEMA}.addresses_pixels.pixel_id,
+                        {config.CLEAN_SCHEMA}.orders.placed_at,
+                        FLOOR(
+                            EXTRACT(EPOCH FROM {config.CLEAN_SCHEMA}.orders.placed_at)
+                        )::BIGINT AS epoch
+                    FROM
+                        {config.CLEAN_SCHEMA}.orders
+                    INNER JOIN
+                        {config.CLEAN_SCHEMA}.addresses_pixels
+                            ON {config.CLEAN_SCHEMA}.orders.pickup_address_id
+                                = {config.CLEAN_SCHEMA}.addresses_pixels.address_id
+                    WHERE
+                        {config.CLEAN_SCHEMA}.orders.ad_hoc IS TRUE
+                        AND
+                        {config.CLEAN_SCHEMA}.addresses_pixels.grid_id
+                            = {self._grid.id}
+                        AND
+                        {config.CLEAN_SCHEMA}.addresses_pixels.city_id
+                            = {self._grid.city.id}
+                ),
+                bounds AS (
+                    SELECT
+                        MIN(epoch / {seconds_per_day}) AS first_day,
+                        MAX(epoch / {seconds_per_day}) AS last_day,
+                        MAX(placed_at) AS last_placed_at
+                    FROM
+                        orders_with_epochs
+                ),
+                binned_orders AS (
+                    SELECT
+                        pixel_id,
+                        epoch / {seconds_per_day} AS day,
+                        (
+                            epoch % {seconds_per_day} - {service_start}
+                        ) / {60 * self._time_step} AS slot
+                    FROM
+                        orders_with_epochs
+                    WHERE
+                        epoch % {seconds_per_day} >= {service_start}
+                        AND
+                        epoch % {seconds_per_day} < {service_end}
+                ),
+                cells AS (
+                    SELECT
+                        pixel_id,
+                        (day - bounds.first_day) * {n_daily_time_steps} + slot
+                            AS position,
+                        COUNT(*) AS n_orders
+                    FROM
+                        binned_orders
+                    CROSS JOIN
+                        bounds
+                    GROUP BY
+                        pixel_id,
+                        position
+                )
+                SELECT
+                    pixels.pixel_id,
+                    bounds.first_day,
+                    bounds.last_placed_at,
+                    ARRAY_AGG(
+                        COALESCE(cells.n_orders, 0) ORDER BY positions.position
+                    ) AS counts
+                FROM (
+                    SELECT DISTINCT
+                        pixel_id
+                    FROM
+                        orders_with_epochs
+                ) AS pixels
+                CROSS JOIN
+                    bounds
+                CROSS JOIN LATERAL
+                    GENERATE_SERIES(
+                        0,
+                        (bounds.last_day - bounds.first_day + 1)
+                            * {n_daily_time_steps} - 1
+                    ) AS positions(position)
+                LEFT OUTER JOIN
+                    cells
+                        ON pixels.pixel_id = cells.pixel_id
+                        AND positions.position = cells.position
+                GROUP BY
+                    pixels.pixel_id,
+                    bounds.first_day,
+                    bounds.last_placed_at
+                ORDER BY
+                    pixels.pixel_id;
+                """,
+            ),  # noqa:WPS355
+        )
+
+        pixel_ids, counts = [], []
+        first_day = last_placed_at = None
+        for pixel_id, first_day, last_placed_at, pixel_counts in result:
+            pixel_ids.append(pixel_id)
+            counts.append(np.array(pixel_counts, dtype=np.int64))
+
+        if first_day is None:  # no `Order`s at all
+            return DemandCube(
+                counts=np.zeros((0, 0, n_daily_time_steps), dtype=np.int64),
+                pixel_ids=np.array([], dtype=np.int64),
+                first_day=None,
+                time_step=self._time_step,
+            )
+
+        # Remember the latest `Order` aggregated so far.
+        self._last_placed_at = last_placed_at
+
+        return DemandCube(
+            counts=np.stack(counts).reshape(len(pixel_ids), -1, n_daily_time_steps),
+            pixel_ids=np.array(pixel_ids, dtype=np.int64),
+            first_day=dt.date(1970, 1, 1) + dt.timedelta(days=first_day),
+            time_step=self._time_step,
+        )
+
+    def refresh(self) -> pd.DataFrame:
+        """Add the orders placed since the last aggregation to the `.totals`.
+
+        The `OrderHistory` remembers the latest `Order.placed_at` it aggregated
+        so far. Only `Order`s placed after that are loaded from the database,
+        which makes refreshing a long order history as expensive as the number
+        of new orders. Their totals are added to the ones in memory, and days
+        and `Pixel`s not seen before are filled in with `0`s.
+
+        If no order totals were aggregated so far, they are all aggregated.
+
+        Returns:
+            order_totals: the updated `.totals`
+        """
+        if (self._data is None and self._cube is None) or self._last_placed_at is None:
+            self._data = self.aggregate_orders()
+            self._cube = None
+            self._clear_derived()
+        else:
+            new_data = self._query_totals(since=self._last_placed_at)
+            if not new_data.empty:
+                self._data = self._merge_totals(new_data)
+                # The `_cube` is derived from the `_data` again on demand.
+                self._cube = None
+                self._clear_derived()
+
+        return self.totals
+
+    def _merge_totals(self, new_data: pd.DataFrame) -> pd.DataFrame:
+        """Add the order totals of newly placed `Order`s to the `.totals`.
+
+        Args:
+            new_data: sparse order totals with the same structure as the `.totals`
+
+        Returns:
+            order_totals: like the `.totals` but with the `new_data` added
+                and extended by the days and `Pixel`s in the `new_data`
+        """
+        # `new_data` may overlap with the `.totals` in the time step
+        # in which the latest aggregated `Order` was placed.
+        totals = self.totals
+        n_orders = totals['n_orders'].add(new_data['n_orders'], fill_value=0)
+
+        # Fill in `0`s for new days and `Pixel`s (i.e., the ones without any
+        # demand in the `.totals` so far) as well as for the new time steps
+        # without any demand.
+        index = self._make_complete_index(
+            pixel_ids=n_orders.index.get_level_values('pixel_id').unique(),
+            first_day=totals.index.get_level_values('start_at').min().date(),
+            last_day=n_orders.index.get_level_values('start_at').max().date(),
+        )
+
+        return (
+            n_orders.reindex(index, fill_value=0).astype(np.int64).to_frame('n_orders')
+        )
+
+    def _query_totals(
+        self, since: Optional[dt.datetime] = None,
+    ) -> pd.DataFrame:  # pragma: no cover
+        """Load the order totals from the database.
+
+        The returned order totals are sparse, meaning that "pixel_id"-"start_at"
+        pairs without any demand are missing. Also, the latest `Order.placed_at`
+        is remembered for subsequent `.refresh()`es.
+
+        Args:
+            since: if provided, aggregate only `Order`s placed after that
+
+        Returns:
+            order_totals: a one-column `DataFrame` with a `MultiIndex` of the
+                "pixel_id"s and "start_at"s; the column with data is "n_orders"
+        """
+        placed_after = (
+            f'AND {config.CLEAN_SCHEMA}.orders.placed_at > :since'
+            if since is not None
+            else ''
+        )
+
         data = pd.read_sql_query(
             sa.text(
                 f"""  -- # noqa:WPS221
                 SELECT
                     pixel_id,
                     start_at,
-                    COUNT(*) AS n_orders
+                    COUNT(*) AS n_orders,
+                    MAX(placed_at) AS last_placed_at
                 FROM (
                     SELECT
                         pixel_id,
+                        placed_at,
                         placed_at_without_seconds - minutes_to_be_cut AS start_at
                     FROM (
                         SELECT
                             pixels.pixel_id,
+                            orders.placed_at,
                             DATE_TRUNC('MINUTE', orders.placed_at)
                                 AS placed_at_without_seconds,
                             (
@@ -114,6 +570,7 @@ class OrderHistory:
                                     = in_city.address_id
                             WHERE
                                 {config.CLEAN_SCHEMA}.orders.ad_hoc IS TRUE
+                                {placed_after}
                         ) AS
                             orders
                         INNER JOIN (
@@ -142,32 +599,93 @@ class OrderHistory:
             ),  # noqa:WPS355
             con=db.connection,
             index_col=['pixel_id', 'start_at'],
+            params={'since': since} if since is not None else None,
         )
 
-        if data.empty:
-            return data
+        # Remember the latest `Order` aggregated so far.
+        last_placed_at = data.pop('last_placed_at')
+        if not data.empty:
+            self._last_placed_at = last_placed_at.max().to_pydatetime()
 
-        # Calculate the first and last "start_at" value ...
-        start_day = data.index.levels[1].min().date()
-        start = dt.datetime(
-            start_day.year, start_day.month, start_day.day, config.SERVICE_START,
-        )
-        end_day = data.index.levels[1].max().date()
-        end = dt.datetime(end_day.year, end_day.month, end_day.day, config.SERVICE_END)
-        # ... and all possible `tuple`s of "pixel_id"-"start_at" combinations.
-        # The "start_at" values must lie within the operating hours.
-        gen = (
-            (pixel_id, start_at)
-            for pixel_id in sorted(data.index.levels[0])
-            for start_at in pd.date_range(start, end, freq=f'{self._time_step}T')
-            if config.SERVICE_START <= start_at.hour < config.SERVICE_END
+        return data
+
+    def _make_complete_index(
+        self, pixel_ids: Sequence[int], first_day: dt.date, last_day: dt.date,
+    ) -> pd.MultiIndex:
+        """Create all possible "pixel_id"-"start_at" combinations.
+
+        The "start_at" values lie within the operating hours of all days
+        from `first_day` to `last_day`. The index is created as the Cartesian
+        product of the `pixel_ids` and the "start_at" values with array
+        operations only as a Python loop over all combinations is too slow
+        for large grids and long order histories.
+
+        Args:
+            pixel_ids: pixels to be included
+            first_day: first day to be included
+            last_day: last day to be included
+
+        Returns:
+            index: a `MultiIndex` with the levels "pixel_id" and "start_at"
+        """
+        n_days = (last_day - first_day).days + 1
+        days = pd.date_range(first_day, periods=n_days, freq='D').to_numpy()
+        daily_start_ats = pd.to_timedelta(
+            60 * config.SERVICE_START
+            + self._time_step * np.arange(self._n_daily_time_steps),
+            unit='minutes',
+        ).to_numpy()
+
+        start_ats = (days[:, np.newaxis] + daily_start_ats[np.newaxis, :]).reshape(-1)
+
+        return pd.MultiIndex.from_product(
+            [np.sort(np.asarray(pixel_ids)), start_ats],
+            names=['pixel_id', 'start_at'],
         )
 
-        # Re-index `data` filling in `0`s where there is no demand.
-        index = pd.MultiIndex.from_tuples(gen)
-        index.names = ['pixel_id', 'start_at']
+    def _intra_pixel(self, pixel_id: int) -> Union[pd.Series, int]:
+        """Look up the order totals of a `Pixel`.
 
-        return data.reindex(index, fill_value=0)
+        Args:
+            pixel_id: pixel whose order totals are looked up
+
+        Returns:
+            intra_pixel: the "n_orders" in the `.totals` of the `Pixel`
+                or, with the "cube" `storage`, its row in the `.cube`
+
+        Raises:
+            LookupError: `pixel_id` not in `grid`
+        """
+        if self._storage == 'cube':
+            return self.cube.row(pixel_id)
+
+        try:
+            return self.totals.loc[pixel_id, 'n_orders']
+        except KeyError:
+            raise LookupError('The `pixel_id` is not in the `grid`') from None
+
+    def _slice_totals(
+        self,
+        intra_pixel: Union[pd.Series, int],
+        first_start_at: dt.datetime,
+        last_start_at: dt.datetime,
+        step: int = 1,
+    ) -> pd.Series:
+        """Slice a time series out of the order totals of a `Pixel`.
+
+        Args:
+            intra_pixel: as returned by `._intra_pixel()`
+            first_start_at: first time step in the time series
+            last_start_at: last time step in the time series (included)
+            step: take only every `step`-th time step
+
+        Returns:
+            time series of order totals named "n_orders"
+        """
+        if self._storage == 'cube':
+            return self.cube.slice_ts(intra_pixel, first_start_at, last_start_at, step)
+
+        return intra_pixel.loc[first_start_at:last_start_at:step]  # type:ignore
 
     def first_order_at(self, pixel_id: int) -> dt.datetime:
         """Get the time step with the first order in a pixel.
@@ -183,25 +701,14 @@ class OrderHistory:
 
         # noqa:DAR401 RuntimeError
         """
-        try:
-            intra_pixel = self.totals.loc[pixel_id]
-        except KeyError:
-            raise LookupError('The `pixel_id` is not in the `grid`') from None
-
-        first_order = intra_pixel[intra_pixel['n_orders'] > 0].index.min()
+        first_order, _ = self._activity_of(pixel_id)
 
         # Sanity check: without an `Order`, the `Pixel` should not exist.
         if first_order is pd.NaT:  # pragma: no cover
             raise RuntimeError('no orders in the pixel')
 
         # Return a proper `datetime.datetime` object.
-        return dt.datetime(
-            first_order.year,
-            first_order.month,
-            first_order.day,
-            first_order.hour,
-            first_order.minute,
-        )
+        return first_order.to_pydatetime()
 
     def last_order_at(self, pixel_id: int) -> dt.datetime:
         """Get the time step with the last order in a pixel.
@@ -217,26 +724,36 @@ class OrderHistory:
 
         # noqa:DAR401 RuntimeError
         """
-        try:
-            intra_pixel = self.totals.loc[pixel_id]
-        except KeyError:
-            raise LookupError('The `pixel_id` is not in the `grid`') from None
-
-        last_order = intra_pixel[intra_pixel['n_orders'] > 0].index.max()
+        _, last_order = self._activity_of(pixel_id)
 
         # Sanity check: without an `Order`, the `Pixel` should not exist.
         if last_order is pd.NaT:  # pragma: no cover
             raise RuntimeError('no orders in the pixel')
 
         # Return a proper `datetime.datetime` object.
-        return dt.datetime(
-            last_order.year,
-            last_order.month,
-            last_order.day,
-            last_order.hour,
-            last_order.minute,
-        )
+        return last_order.to_pydatetime()
+
+    def _activity_of(self, pixel_id: int) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Look up the first and last "start_at" with orders in the `.activity`.
+
+        Args:
+            pixel_id: pixel to be looked up
+
+        Returns:
+            first_order_at, last_order_at
+
+        Raises:
+            LookupError: `pixel_id` not in `grid`
+        """
+        if not self._activity_by_pixel:
+            self.activity  # noqa:WPS428  populates the lookup table
 
+        try:
+            return self._activity_by_pixel[pixel_id]
+        except KeyError:
+            raise LookupError('The `pixel_id` is not in the `grid`') from None
+
+    @instrumentation.timed('slice')
     def make_horizontal_ts(  # noqa:WPS210
         self, pixel_id: int, predict_at: dt.datetime, train_horizon: int,
     ) -> Tuple[pd.Series, int, pd.Series]:
@@ -261,10 +778,7 @@ class OrderHistory:
             LookupError: `pixel_id` not in `grid` or `predict_at` not in `.totals`
             RuntimeError: desired time series slice is not entirely in `.totals`
         """
-        try:
-            intra_pixel = self.totals.loc[pixel_id]
-        except KeyError:
-            raise LookupError('The `pixel_id` is not in the `grid`') from None
+        intra_pixel = self._intra_pixel(pixel_id)
 
         if predict_at >= config.CUTOFF_DAY:  # pragma: no cover
             raise RuntimeError('Internal error: cannot predict beyond the given data')
@@ -293,19 +807,19 @@ class OrderHistory:
         frequency = 7
 
         # Take only the counts at the `predict_at` time.
-        training_ts = intra_pixel.loc[
-            first_start_at : last_start_at : self._n_daily_time_steps,  # type:ignore
-            'n_orders',
-        ]
+        training_ts = self._slice_totals(
+            intra_pixel, first_start_at, last_start_at, self._n_daily_time_steps,
+        )
         if len(training_ts) != frequency * train_horizon:
             raise RuntimeError('Not enough historic data for `predict_at`')
 
-        actuals_ts = intra_pixel.loc[[predict_at], 'n_orders']
+        actuals_ts = self._slice_totals(intra_pixel, predict_at, predict_at)
         if not len(actuals_ts):  # pragma: no cover
             raise LookupError('`predict_at` is not in the order history')
 
         return training_ts, frequency, actuals_ts
 
+    @instrumentation.timed('slice')
     def make_vertical_ts(  # noqa:WPS210
         self, pixel_id: int, predict_day: dt.date, train_horizon: int,
     ) -> Tuple[pd.Series, int, pd.Series]:
@@ -330,10 +844,7 @@ class OrderHistory:
             LookupError: `pixel_id` not in `grid` or `predict_day` not in `.totals`
             RuntimeError: desired time series slice is not entirely in `.totals`
         """
-        try:
-            intra_pixel = self.totals.loc[pixel_id]
-        except KeyError:
-            raise LookupError('The `pixel_id` is not in the `grid`') from None
+        intra_pixel = self._intra_pixel(pixel_id)
 
         if predict_day >= config.CUTOFF_DAY.date():  # pragma: no cover
             raise RuntimeError('Internal error: cannot predict beyond the given data')
@@ -361,10 +872,7 @@ class OrderHistory:
         frequency = 7 * self._n_daily_time_steps
 
         # Take all the counts between `first_train_day` and `last_train_day`.
-        training_ts = intra_pixel.loc[
-            first_start_at:last_start_at,  # type:ignore
-            'n_orders',
-        ]
+        training_ts = self._slice_totals(intra_pixel, first_start_at, last_start_at)
         if len(training_ts) != frequency * train_horizon:
             raise RuntimeError('Not enough historic data for `predict_day`')
 
@@ -383,15 +891,15 @@ class OrderHistory:
             0,
         ) - dt.timedelta(minutes=self._time_step)
 
-        actuals_ts = intra_pixel.loc[
-            first_prediction_at:last_prediction_at,  # type:ignore
-            'n_orders',
-        ]
+        actuals_ts = self._slice_totals(
+            intra_pixel, first_prediction_at, last_prediction_at,
+        )
         if not len(actuals_ts):  # pragma: no cover
             raise LookupError('`predict_day` is not in the order history')
 
         return training_ts, frequency, actuals_ts
 
+    @instrumentation.timed('slice')
     def make_realtime_ts(  # noqa:WPS210
         self, pixel_id: int, predict_at: dt.datetime, train_horizon: int,
     ) -> Tuple[pd.Series, int, pd.Series]:
@@ -416,10 +924,7 @@ class OrderHistory:
             LookupError: `pixel_id` not in `grid` or `predict_at` not in `.totals`
             RuntimeError: desired time series slice is not entirely in `.totals`
         """
-        try:
-            intra_pixel = self.totals.loc[pixel_id]
-        except KeyError:
-            raise LookupError('The `pixel_id` is not in the `grid`') from None
+        intra_pixel = self._intra_pixel(pixel_id)
 
         if predict_at >= config.CUTOFF_DAY:  # pragma: no cover
             raise RuntimeError('Internal error: cannot predict beyond the given data')
@@ -458,10 +963,7 @@ class OrderHistory:
 
         # Take all the counts between `first_train_day` and `last_train_day`,
         # including the ones on the `predict_at` day prior to `predict_at`.
-        training_ts = intra_pixel.loc[
-            first_start_at:last_start_at,  # type:ignore
-            'n_orders',
-        ]
+        training_ts = self._slice_totals(intra_pixel, first_start_at, last_start_at)
         n_time_steps_on_predict_day = (
             (
                 predict_at
@@ -479,12 +981,252 @@ class OrderHistory:
         if len(training_ts) != frequency * train_horizon + n_time_steps_on_predict_day:
             raise RuntimeError('Not enough historic data for `predict_day`')
 
-        actuals_ts = intra_pixel.loc[[predict_at], 'n_orders']
+        actuals_ts = self._slice_totals(intra_pixel, predict_at, predict_at)
         if not len(actuals_ts):  # pragma: no cover
             raise LookupError('`predict_at` is not in the order history')
 
         return training_ts, frequency, actuals_ts
 
+    @instrumentation.timed('slice')
+    def make_horizontal_batch(
+        self,
+        pixel_ids: Sequence[int],
+        predict_ats: Sequence[dt.datetime],
+        train_horizon: int,
+    ) -> Tuple[npt.NDArray[np.int64], int, npt.NDArray[np.int64]]:
+        """Slice many horizontal time series out of the `.cube` at once.
+
+        This is the vectorized version of `.make_horizontal_ts()`: the `i`-th
+        training time series and actual order count correspond to the `i`-th
+        pair of `pixel_ids` and `predict_ats`.
+
+        Args:
+            pixel_ids: pixels in which the time series are aggregated
+            predict_ats: time steps (i.e., "start_at"s) for which predictions are made
+            train_horizon: weeks of historic data used to predict the `predict_ats`
+
+        Returns:
+            training time series with shape `(n, 7 * train_horizon)`,
+                frequency, actual order counts with shape `(n,)`
+
+        Raises:
+            LookupError: some `pixel_id` not in `grid` or some `predict_at`
+                not in `.totals`
+            RuntimeError: some desired time series slice is not entirely in `.totals`
+        """
+        cube = self.cube
+        rows, positions = self._locate_batch(pixel_ids, predict_ats)
+        columns, slots = np.divmod(positions, self._n_daily_time_steps)
+        first_columns = columns - 7 * train_horizon
+
+        if (first_columns < 0).any() or (columns > cube.n_days).any():
+            raise RuntimeError('Not enough historic data for `predict_at`')
+        if (columns >= cube.n_days).any():  # pragma: no cover
+            raise LookupError('`predict_at` is not in the order history')
+
+        if len(rows):
+            # A strided view holding the preceding `train_horizon` weeks
+            # for every `Pixel`, day, and time step.
+            windows = np.lib.stride_tricks.sliding_window_view(
+                cube.counts, 7 * train_horizon, axis=1,
+            )
+            training = windows[rows, first_columns, slots]
+        else:
+            training = np.zeros((0, 7 * train_horizon), dtype=np.int64)
+
+        return training, 7, cube.counts[rows, columns, slots]
+
+    def make_horizontal_day(
+        self, pixel_id: int, predict_day: dt.date, train_horizon: int,
+    ) -> Tuple[pd.DataFrame, int, pd.Series]:
+        """Slice the horizontal time series of all time steps on a day at once.
+
+        This is the same as calling `.make_horizontal_ts()` for every time step
+        on the `predict_day`, but the time series are sliced out of the `.cube`
+        with one call to `.make_horizontal_batch()`.
+
+        Args:
+            pixel_id: pixel in which the time series are aggregated
+            predict_day: day for whose time steps predictions are made
+            train_horizon: weeks of historic data used to predict the time steps
+
+        Returns:
+            training time series with one row per time step, frequency,
+                actual order counts; both indexed by the time steps' "start_at"
+
+        Raises:
+            LookupError: `pixel_id` not in `grid` or `predict_day` not in `.totals`
+            RuntimeError: desired time series slices are not entirely in `.totals`
+        """
+        start_ats = pd.date_range(
+            dt.datetime(
+                predict_day.year,
+                predict_day.month,
+                predict_day.day,
+                config.SERVICE_START,
+            ),
+            periods=self._n_daily_time_steps,
+            freq=f'{self._time_step}T',
+            name='start_at',
+        )
+
+        training, frequency, actuals = self.make_horizontal_batch(
+            pixel_ids=[pixel_id] * len(start_ats),
+            predict_ats=list(start_ats.to_pydatetime()),
+            train_horizon=train_horizon,
+        )
+
+        return (
+            pd.DataFrame(training, index=start_ats),
+            frequency,
+            pd.Series(actuals, index=start_ats, name='n_orders'),
+        )
+
+    @instrumentation.timed('slice')
+    def make_vertical_batch(
+        self,
+        pixel_ids: Sequence[int],
+        predict_days: Sequence[dt.date],
+        train_horizon: int,
+    ) -> Tuple[npt.NDArray[np.int64], int, npt.NDArray[np.int64]]:
+        """Slice many vertical time series out of the `.cube` at once.
+
+        This is the vectorized version of `.make_vertical_ts()`: the `i`-th
+        training time series and row of actual order counts correspond to the
+        `i`-th pair of `pixel_ids` and `predict_days`.
+
+        Args:
+            pixel_ids: pixels in which the time series are aggregated
+            predict_days: days for which predictions are made
+            train_horizon: weeks of historic data used to predict the `predict_days`
+
+        Returns:
+            training time series with shape `(n, frequency * train_horizon)`,
+                frequency, actual order counts with shape `(n, n_daily_time_steps)`
+
+        Raises:
+            LookupError: some `pixel_id` not in `grid` or some `predict_day`
+                not in `.totals`
+            RuntimeError: some desired time series slice is not entirely in `.totals`
+        """
+        cube = self.cube
+        frequency = 7 * self._n_daily_time_steps
+        rows, positions = self._locate_batch(
+            pixel_ids,
+            [
+                dt.datetime(day.year, day.month, day.day, config.SERVICE_START)
+                for day in predict_days
+            ],
+        )
+        columns = positions // self._n_daily_time_steps
+        first_columns = columns - 7 * train_horizon
+
+        if (first_columns < 0).any() or (columns > cube.n_days).any():
+            raise RuntimeError('Not enough historic data for `predict_day`')
+        if (columns >= cube.n_days).any():  # pragma: no cover
+            raise LookupError('`predict_day` is not in the order history')
+
+        if len(rows):
+            # A strided view holding the preceding `train_horizon` weeks
+            # for every `Pixel` and time step.
+            windows = np.lib.stride_tricks.sliding_window_view(
+                cube.counts.reshape(
+                    len(cube.pixel_ids), cube.n_days * self._n_daily_time_steps,
+                ),
+                frequency * train_horizon,
+                axis=1,
+            )
+            training = windows[rows, first_columns * self._n_daily_time_steps]
+        else:
+            training = np.zeros((0, frequency * train_horizon), dtype=np.int64)
+
+        return training, frequency, cube.counts[rows, columns]
+
+    @instrumentation.timed('slice')
+    def make_realtime_batch(
+        self,
+        pixel_ids: Sequence[int],
+        predict_ats: Sequence[dt.datetime],
+        train_horizon: int,
+    ) -> Tuple[npt.NDArray[np.int64], int, npt.NDArray[np.int64]]:
+        """Slice many vertical real-time time series out of the `.cube` at once.
+
+        This is the vectorized version of `.make_realtime_ts()`: the `i`-th
+        training time series and actual order count correspond to the `i`-th
+        pair of `pixel_ids` and `predict_ats`.
+
+        As real-time time series include the time steps on the `predict_at` day
+        prior to `predict_at`, they differ in length. To fit into one array,
+        shorter time series are padded on the left with `NaN`s.
+
+        Args:
+            pixel_ids: pixels in which the time series are aggregated
+            predict_ats: time steps (i.e., "start_at"s) for which predictions are made
+            train_horizon: weeks of historic data used to predict the `predict_ats`
+
+        Returns:
+            training time series with shape
+                `(n, frequency * train_horizon + n_daily_time_steps - 1)`,
+                frequency, actual order counts with shape `(n,)`
+
+        Raises:
+            LookupError: some `pixel_id` not in `grid` or some `predict_at`
+                not in `.totals`
+            RuntimeError: some desired time series slice is not entirely in `.totals`
+        """
+        cube = self.cube
+        frequency = 7 * self._n_daily_time_steps
+        rows, positions = self._locate_batch(pixel_ids, predict_ats)
+        columns = positions // self._n_daily_time_steps
+        first_positions = (columns - 7 * train_horizon) * self._n_daily_time_steps
+        n_positions = cube.n_days * self._n_daily_time_steps
+
+        if (first_positions < 0).any() or (positions > n_positions).any():
+            raise RuntimeError('Not enough historic data for `predict_day`')
+        if (positions >= n_positions).any():  # pragma: no cover
+            raise LookupError('`predict_at` is not in the order history')
+
+        # The training time series end just before the `positions`.
+        length = frequency * train_horizon + self._n_daily_time_steps - 1
+        window = positions[:, np.newaxis] - length + np.arange(length)
+        flat_counts = cube.counts.reshape(len(cube.pixel_ids), n_positions)
+        training = np.where(
+            window >= first_positions[:, np.newaxis],
+            flat_counts[rows[:, np.newaxis], np.maximum(window, 0)],
+            np.nan,
+        )
+
+        return training, frequency, flat_counts[rows, positions]
+
+    def _locate_batch(
+        self, pixel_ids: Sequence[int], start_ats: Sequence[dt.datetime],
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Look up the rows and positions in the `.cube` for many time steps.
+
+        Args:
+            pixel_ids: pixels to be looked up
+            start_ats: time steps to be looked up
+
+        Returns:
+            rows, positions
+
+        Raises:
+            LookupError: some `pixel_id` not in `grid`
+            ValueError: `pixel_ids` and `start_ats` differ in length
+
+        # noqa:DAR401 RuntimeError
+        """
+        if len(pixel_ids) != len(start_ats):
+            raise ValueError('`pixel_ids` and `predict_ats` must be of the same length')
+        beyond_cutoff = any(start_at >= config.CUTOFF_DAY for start_at in start_ats)
+        if beyond_cutoff:  # pragma: no cover
+            raise RuntimeError('Internal error: cannot predict beyond the given data')
+
+        cube = self.cube
+        rows = np.array([cube.row(pixel_id) for pixel_id in pixel_ids], dtype=np.int64)
+
+        return rows, cube.positions(start_ats).astype(np.int64)
+
     def avg_daily_demand(
         self, pixel_id: int, predict_day: dt.date, train_horizon: int,
     ) -> float:
@@ -521,7 +1263,7 @@ class OrderHistory:
         return round(training_ts.sum() / n_days, 1)
 
     def choose_tactical_model(
-        self, pixel_id: int, predict_day: dt.date, train_horizon: int,
+        self, pixel_id: int, predict_day: dt.date, train_horizon: int, **kwargs: Any,
     ) -> models.ForecastingModelABC:
         """Choose the most promising forecasting `*Model` for tactical purposes.
 
@@ -541,29 +1283,342 @@ class OrderHistory:
             pixel_id: pixel for which a forecasting `*Model` is chosen
             predict_day: day for which demand is to be predicted with the `*Model`
             train_horizon: time horizon available for training the `*Model`
+            **kwargs: passed on to the `*Model`'s constructor
+                (e.g., a `forecast_cache`)
 
         Returns:
             most promising forecasting `*Model`
 
         # noqa:DAR401 RuntimeError
         """  # noqa:RST215
-        add = self.avg_daily_demand(
-            pixel_id=pixel_id, predict_day=predict_day, train_horizon=train_horizon,
-        )
+        # Look up the ADD in the `.tactical_schedule()` that is calculated
+        # only once for all `Pixel`s and days. If it is not in there,
+        # `.avg_daily_demand()` raises the appropriate error.
+        schedule = self.tactical_schedule(train_horizon=train_horizon)
+        try:
+            add = schedule.at[(pixel_id, predict_day), 'avg_daily_demand']
+        except KeyError:
+            add = self.avg_daily_demand(
+                pixel_id=pixel_id, predict_day=predict_day, train_horizon=train_horizon,
+            )
+
+        model_cls = self._tactical_model_cls(add=add, train_horizon=train_horizon)
+
+        return model_cls(order_history=self, **kwargs)
+
+    @staticmethod
+    def _tactical_model_cls(
+        add: float, train_horizon: int,
+    ) -> Type[models.ForecastingModelABC]:
+        """The rule-based heuristic behind `.choose_tactical_model()`.
+
+        Args:
+            add: average daily demand in a `Pixel`
+            train_horizon: time horizon available for training the `*Model`
+
+        Returns:
+            most promising forecasting `*Model` class
 
+        Raises:
+            RuntimeError: no rule for the given `add` and `train_horizon`
+        """
         # For now, we only make forecasts with 7 and 8 weeks
         # as the training horizon (note:4f79e8fa).
         if train_horizon in {7, 8}:
             if add >= 25:  # = "high demand"
-                return models.HorizontalETSModel(order_history=self)
+                return models.HorizontalETSModel
             elif add >= 10:  # = "medium demand"
-                return models.HorizontalETSModel(order_history=self)
+                return models.HorizontalETSModel
             elif add >= 2.5:  # = "low demand"
-                return models.HorizontalSMAModel(order_history=self)
+                return models.HorizontalSMAModel
 
             # = "no demand"
-            return models.TrivialModel(order_history=self)
+            return models.TrivialModel
 
         raise RuntimeError(
             'no rule for the given average daily demand and training horizon',
         )
+
+    def avg_daily_demands(self, train_horizon: int) -> pd.Series:
+        """Calculate the average daily demand (ADD) for all `Pixel`s and days.
+
+        This is the same as calling `.avg_daily_demand()` for every `Pixel` and
+        every day for which there are `train_horizon` weeks of data before it.
+        Instead of slicing a time series for each of them, the ADDs are obtained
+        from a cumulative sum over the daily order totals of the `.cube`.
+
+        Args:
+            train_horizon: time horizon over which the ADD is calculated
+
+        Returns:
+            average number of orders per day, indexed by "pixel_id" and
+                "predict_day", and named "avg_daily_demand"
+        """
+        cube = self.cube
+        n_train_days = 7 * train_horizon
+
+        # Cumulative daily totals with a leading `0` column such that the totals
+        # of the days `[first, last)` are `cumulative[:, last] - cumulative[:, first]`.
+        cumulative = np.zeros((len(cube.pixel_ids), cube.n_days + 1), dtype=np.int64)
+        np.cumsum(cube.counts.sum(axis=2), axis=1, out=cumulative[:, 1:])
+
+        # The `predict_day`s are preceded by `train_horizon` weeks
+        # and must lie within both the order history and the given data.
+        last_column = min(cube.n_days, cube.column(config.CUTOFF_DAY.date()))
+        n_predict_days = max(last_column - n_train_days, 0)
+
+        totals = (
+            cumulative[:, n_train_days : n_train_days + n_predict_days]
+            - cumulative[:, :n_predict_days]
+        )
+
+        # Without any days in the `cube`, there are no `predict_day`s either.
+        first_day = cube.first_day or config.CUTOFF_DAY.date()
+        index = pd.MultiIndex.from_product(
+            [
+                cube.pixel_ids,
+                [
+                    first_day + dt.timedelta(days=column)
+                    for column in range(n_train_days, n_train_days + n_predict_days)
+                ],
+            ],
+            names=['pixel_id', 'predict_day'],
+        )
+
+        # Use Python's `round()` as in `.avg_daily_demand()`.
+        return pd.Series(
+            [round(total / n_train_days, 1) for total in totals.reshape(-1).tolist()],
+            index=index,
+            dtype=float,
+            name='avg_daily_demand',
+        )
+
+    def tactical_schedule(self, train_horizon: int) -> pd.DataFrame:
+        """Choose the tactical forecasting `*Model` for all `Pixel`s and days.
+
+        This is the same as calling `.choose_tactical_model()` for every `Pixel`
+        and every day for which there are `train_horizon` weeks of data before it.
+        So, all the work to be done for tactical purposes is known up front.
+
+        The returned object should not be mutated!
+
+        Args:
+            train_horizon: time horizon available for training the `*Model`s
+
+        Returns:
+            schedule: a `DataFrame` indexed by "pixel_id" and "predict_day" with the
+                "avg_daily_demand" and the chosen "model" (i.e., its `.name`)
+
+        # noqa:DAR401 RuntimeError
+        """
+        if train_horizon not in self._schedules:
+            adds = self.avg_daily_demands(train_horizon=train_horizon)
+            model_names = {
+                add: self._tactical_model_cls(add=add, train_horizon=train_horizon).name
+                for add in adds.unique()
+            }
+            self._schedules[train_horizon] = pd.DataFrame(
+                data={'avg_daily_demand': adds, 'model': adds.map(model_names)},
+            )
+
+        return self._schedules[train_horizon]
+
+
+class CityOrderHistory:
+    """Share one aggregation of the `Order`s among all `Grid`s of a `City`.
+
+    The `Grid`s of a `City` only differ in how the `Address`es are assigned to
+    `Pixel`s. So, the orders are aggregated once per pickup `Address` (cf., `.cube`)
+    and then summed up into the `Pixel`s of each `Grid` in memory.
+    """
+
+    def __init__(self, city: db.City, time_step: int) -> None:
+        """Initialize a new `CityOrderHistory` object.
+
+        Args:
+            city: city whose orders are aggregated
+            time_step: interval length (in minutes) into which orders are aggregated
+        """
+        self._city = city
+        self._time_step = time_step
+
+        # The `_cube` is populated by `.aggregate_cube()`.
+        self._cube: Optional[DemandCube] = None
+
+        # The latest `Order.placed_at` aggregated into the `_cube`.
+        self._last_placed_at: Optional[dt.datetime] = None
+
+    @property
+    def time_step(self) -> int:
+        """The length of one time step."""
+        return self._time_step
+
+    @property
+    def cube(self) -> DemandCube:
+        """The order totals by pickup `Address` and `.time_step`.
+
+        The returned object should not be mutated!
+
+        Returns:
+            order_totals: a `DemandCube` whose rows are `Address`es
+        """
+        if self._cube is None:
+            self._cube = self.aggregate_cube()
+
+        return self._cube
+
+    def aggregate_cube(self) -> DemandCube:  # pragma: no cover
+        """Generate and load all order totals by pickup `Address` from the database.
+
+        As with `OrderHistory.aggregate_cube()`, the days and `Address`es with
+        `Order`s only outside the operating hours are included with `0`s.
+
+        Returns:
+            order_totals: a `DemandCube` whose rows are `Address`es
+        """
+        seconds_per_day = 24 * 60 * 60
+        service_start = config.SERVICE_START * 60 * 60
+        service_end = config.SERVICE_END * 60 * 60
+
+        data = pd.read_sql_query(
+            sa.text(
+                f"""  -- # noqa:WPS221
+                WITH orders_with_epochs AS (
+                    SELECT
+                        {config.CLEAN_SCHEMA}.orders.pickup_address_id AS address_id,
+                        {config.CLEAN_SCHEMA}.orders.placed_at,
+                        FLOOR(
+                            EXTRACT(EPOCH FROM {config.CLEAN_SCHEMA}.orders.placed_at)
+                        )::BIGINT AS epoch
+                    FROM
+                        {config.CLEAN_SCHEMA}.orders
+                    INNER JOIN
+                        {config.CLEAN_SCHEMA}.addresses
+                            ON {config.CLEAN_SCHEMA}.orders.pickup_address_id
+                                = {config.CLEAN_SCHEMA}.addresses.id
+                    WHERE
+                        {config.CLEAN_SCHEMA}.orders.ad_hoc IS TRUE
+                        AND
+                        {config.CLEAN_SCHEMA}.addresses.city_id = {self._city.id}
+                ),
+                addresses AS (
+                    SELECT
+                        address_id,
+                        MIN(epoch / {seconds_per_day}) AS first_day,
+                        MAX(epoch / {seconds_per_day}) AS last_day,
+                        MAX(placed_at) AS last_placed_at
+                    FROM
+                        orders_with_epochs
+                    GROUP BY
+                        address_id
+                ),
+                binned_orders AS (
+                    SELECT
+                        address_id,
+                        TIMESTAMP 'EPOCH' + (
+                            epoch
+                            - (epoch % {seconds_per_day} - {service_start})
+                                % {60 * self._time_step}
+                        ) * INTERVAL '1 SECOND' AS start_at,
+                        COUNT(*) AS n_orders
+                    FROM
+                        orders_with_epochs
+                    WHERE
+                        epoch % {seconds_per_day} >= {service_start}
+                        AND
+                        epoch % {seconds_per_day} < {service_end}
+                    GROUP BY
+                        address_id,
+                        start_at
+                )
+                SELECT
+                    addresses.address_id,
+                    addresses.first_day,
+                    addresses.last_day,
+                    addresses.last_placed_at,
+                    binned_orders.start_at,
+                    binned_orders.n_orders
+                FROM
+                    addresses
+                LEFT OUTER JOIN
+                    binned_orders
+                        ON addresses.address_id = binned_orders.address_id
+                ORDER BY
+                    addresses.address_id,
+                    binned_orders.start_at;
+                """,
+            ),  # noqa:WPS355
+            con=db.connection,
+        )
+
+        if data.empty:  # no `Order`s at all
+            return DemandCube.from_totals(
+                data.set_index(['address_id', 'start_at'])[['n_orders']],
+                time_step=self._time_step,
+            )
+
+        # Remember the latest `Order` aggregated so far.
+        self._last_placed_at = data['last_placed_at'].max().to_pydatetime()
+
+        # The days and `Address`es are taken from all `Order`s
+        # and only the totals from the ones within the operating hours.
+        totals = data.dropna(subset=['start_at']).set_index(['address_id', 'start_at'])
+        unix_epoch = dt.date(1970, 1, 1)
+
+        return DemandCube.from_totals(
+            totals[['n_orders']].astype(int),
+            time_step=self._time_step,
+            pixel_ids=data['address_id'].unique().tolist(),
+            first_day=unix_epoch + dt.timedelta(days=int(data['first_day'].min())),
+            last_day=unix_epoch + dt.timedelta(days=int(data['last_day'].max())),
+        )
+
+    def _address_pixels(self, grid: db.Grid) -> Dict[int, int]:  # pragma: no cover
+        """Look up the `Pixel` of every `Address` in a `Grid`.
+
+        This takes one query instead of loading the `Address`es
+        of each `Pixel` one after another.
+
+        Args:
+            grid: whose `Pixel`s are looked up
+
+        Returns:
+            mapping: the "pixel_id" by "address_id"
+        """
+        query = db.session.query(
+            db.AddressPixelAssociation.address_id, db.AddressPixelAssociation.pixel_id,
+        ).filter(db.AddressPixelAssociation.grid_id == grid.id)
+
+        return dict(query.all())
+
+    def order_history(
+        self, grid: db.Grid, *, storage: str = 'dataframe',
+    ) -> OrderHistory:
+        """Derive the `OrderHistory` for a `Grid` of the `City`.
+
+        The order totals of the `Address`es are summed up into the `grid`'s
+        `Pixel`s without querying the database for orders again.
+
+        Args:
+            grid: pixel grid used to aggregate orders spatially
+            storage: see `OrderHistory`
+
+        Returns:
+            order_history: as if the orders were aggregated for the `grid`
+
+        Raises:
+            ValueError: `grid` is not in the `City`
+        """
+        if grid.city is not self._city:
+            raise ValueError('`grid` must be in the `city`')
+
+        order_history = OrderHistory(
+            grid=grid, time_step=self._time_step, storage=storage,
+        )
+        order_history._cube = self.cube.project(  # noqa:WPS437
+            self._address_pixels(grid),
+        )
+        # The derived order totals may be `.refresh()`ed.
+        order_history._last_placed_at = self._last_placed_at  # noqa:WPS437
+
+        return order_history
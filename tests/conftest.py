@@ -45,7 +45,11 @@ def db_connection(request):
     """
     # We need a fresh database connection for each of the two `params`.
     # Otherwise, the first test of the parameter run second will fail.
-    engine = sa.create_engine(config.DATABASE_URI)
+    engine = sa.create_engine(
+        config.DATABASE_URI,
+        executemany_mode='values',
+        executemany_values_page_size=config.FORECAST_BATCH_SIZE,
+    )
     connection = engine.connect()
 
     # Monkey patch the package's global `engine` and `connection` objects,
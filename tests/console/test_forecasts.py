@@ -0,0 +1,166 @@
+"""Test the `urban_meal_delivery.console.forecasts` module.
+
+The `tactical_heuristic()` command itself needs a database with real data.
+So, only its options are tested here.
+"""
+
+import datetime as dt
+import sys
+
+import click
+import numpy as np
+import pytest
+
+from tests import config as test_config
+from urban_meal_delivery import config
+from urban_meal_delivery import db
+from urban_meal_delivery.console import forecasts
+from urban_meal_delivery.forecasts import cube
+from urban_meal_delivery.forecasts import timify
+
+
+class TestParseShard:
+    """Test the `parse_shard()` callback of the "--shard" option."""
+
+    @pytest.mark.parametrize(
+        'value, shard', [('1/1', (1, 1)), ('2/4', (2, 4)), ('4/4', (4, 4))],
+    )
+    def test_valid_shard(self, value, shard):
+        """"i/N" is parsed into a `tuple`."""
+        result = forecasts.parse_shard(None, None, value)
+
+        assert result == shard
+
+    @pytest.mark.parametrize('value', ['1', '1/2/3', 'a/b', '0/4', '5/4', '-1/4'])
+    def test_invalid_shard(self, value):
+        """"i" must be a number between `1` and "N"."""
+        with pytest.raises(click.BadParameter):
+            forecasts.parse_shard(None, None, value)
+
+    def test_invalid_shard_on_command_line(self, cli):
+        """The command is not run with an invalid "--shard" option."""
+        result = cli.invoke(forecasts.tactical_heuristic, ['--shard', '5/4'])
+
+        assert result.exit_code == 2
+        assert '--shard' in result.output
+
+    def test_invalid_workers_on_command_line(self, cli):
+        """The command is not run without any worker processes."""
+        result = cli.invoke(forecasts.tactical_heuristic, ['--workers', '0'])
+
+        assert result.exit_code == 2
+        assert '--workers' in result.output
+
+
+class TestSelectShard:
+    """Test the `select_shard()` function."""
+
+    @pytest.fixture
+    def pixel_ids(self):
+        """The `Pixel.id`s of a `Grid` in no particular order."""
+        return [7, 3, 1, 6, 2, 5, 4]
+
+    def test_one_shard(self, pixel_ids):
+        """With one shard, all `Pixel`s are forecast."""
+        result = forecasts.select_shard(pixel_ids, shard=(1, 1))
+
+        assert result == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_several_shards(self, pixel_ids):
+        """The `Pixel`s are dealt out to the shards."""
+        result = forecasts.select_shard(pixel_ids, shard=(2, 3))
+
+        assert result == [2, 5]
+
+    def test_shards_partition_the_pixels(self, pixel_ids):
+        """Every `Pixel` is in exactly one shard."""
+        n_shards = 3
+
+        result = [
+            pixel_id
+            for index in range(1, n_shards + 1)
+            for pixel_id in forecasts.select_shard(pixel_ids, shard=(index, n_shards))
+        ]
+
+        assert sorted(result) == sorted(pixel_ids)
+
+
+class TestSaveOrderHistory:
+    """Test the `save_order_history()` function."""
+
+    def test_round_trip(self, tmp_path):
+        """The workers memory-map the order totals of the main process."""
+        time_step = test_config.LONG_TIME_STEP
+        n_daily_time_steps = (
+            60 * (config.SERVICE_END - config.SERVICE_START) // time_step
+        )
+        counts = np.arange(2 * 3 * n_daily_time_steps).reshape(2, 3, -1)
+        order_history = timify.OrderHistory.from_cube(
+            grid=None,
+            cube=cube.DemandCube(
+                counts=counts,
+                pixel_ids=np.array([1, 2]),
+                first_day=dt.date(2016, 7, 1),
+                time_step=time_step,
+            ),
+        )
+
+        cube_path = forecasts.save_order_history(order_history, str(tmp_path))
+        result = cube.DemandCube.load(cube_path)
+
+        np.testing.assert_array_equal(result.counts, counts)
+        assert result.time_step == time_step
+
+
+class TestInitializeWorker:
+    """Test the `initialize_worker()` function."""
+
+    @pytest.fixture
+    def cube_path(self, tmp_path):
+        """The order totals of one `Pixel` from `START` to `END` saved to disk."""
+        time_step = test_config.LONG_TIME_STEP
+        n_daily_time_steps = (
+            60 * (config.SERVICE_END - config.SERVICE_START) // time_step
+        )
+        n_days = (test_config.END - test_config.START).days + 1
+        order_history = timify.OrderHistory.from_cube(
+            grid=None,
+            cube=cube.DemandCube(
+                counts=np.ones((1, n_days, n_daily_time_steps), dtype=np.int64),
+                pixel_ids=np.array([1]),
+                first_day=test_config.START.date(),
+                time_step=time_step,
+            ),
+        )
+
+        return forecasts.save_order_history(order_history, str(tmp_path))
+
+    def test_order_totals_are_not_built(self, cube_path, mocker):
+        """The workers slice the time series out of the memory-mapped cube ...
+
+        ... and never convert it into the `OrderHistory.totals`.
+        """
+        mocker.patch.object(db, 'session')
+        # R is not needed to test the order data.
+        mocker.patch.dict(sys.modules, {'urban_meal_delivery.init_r': mocker.Mock()})
+        mocker.patch.dict(forecasts._worker_state)  # noqa:WPS437
+        to_totals = mocker.patch.object(cube.DemandCube, 'to_totals')
+        predict_at = dt.datetime(
+            test_config.END.year,
+            test_config.END.month,
+            test_config.END.day,
+            test_config.NOON,
+        )
+
+        forecasts.initialize_worker(grid_id=1, cube_path=cube_path)
+
+        order_history = forecasts._worker_state['order_history']  # noqa:WPS437
+        training_ts, _, actuals_ts = order_history.make_horizontal_ts(
+            pixel_id=1,
+            predict_at=predict_at,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+        assert len(training_ts) == 7 * test_config.LONG_TRAIN_HORIZON
+        assert actuals_ts.sum() == 1
+        assert order_history._data is None  # noqa:WPS437
+        to_totals.assert_not_called()
@@ -1,7 +1,9 @@
 """Test the ORM's `Forecast` model."""
 
 import datetime as dt
+import math
 
+import numpy as np
 import pandas as pd
 import pytest
 import sqlalchemy as sqla
@@ -503,3 +505,165 @@ class TestFromDataFrameConstructor:
 
         db_session.add_all(forecasts)
         db_session.commit()
+
+    def test_convert_dataframe_into_rows(self, pixel, prediction_data):
+        """Call `Forecast.rows_from_dataframe()`."""
+        rows = db.Forecast.rows_from_dataframe(
+            pixel=pixel,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model=MODEL,
+            data=prediction_data,
+        )
+
+        assert len(rows) == 3
+        for row in rows:
+            assert row['pixel_id'] == pixel.id
+
+    def test_rows_hold_the_same_values_as_orm_objects(self, pixel, prediction_data):
+        """`Forecast.rows_from_dataframe()` is `Forecast.from_dataframe()` ...
+
+        ... without creating the ORM objects.
+        """
+        kwargs = {
+            'pixel': pixel,
+            'time_step': test_config.LONG_TIME_STEP,
+            'train_horizon': test_config.LONG_TRAIN_HORIZON,
+            'model': MODEL,
+            'data': prediction_data,
+        }
+        forecasts = db.Forecast.from_dataframe(**kwargs)
+
+        rows = db.Forecast.rows_from_dataframe(**kwargs)
+
+        for forecast, row in zip(forecasts, rows):
+            assert forecast.pixel is pixel
+            for column, value in row.items():  # noqa:WPS110
+                if column != 'pixel_id':
+                    assert getattr(forecast, column) == value
+
+    def test_rows_hold_plain_rounded_values(self, pixel, prediction_data):
+        """The values are rounded and `NaN`s become `None`s."""
+        prediction_data['prediction'] = (11.123456, 12.3, 13.3)
+        prediction_data[['low80', 'high80']] = float('NaN')
+
+        rows = db.Forecast.rows_from_dataframe(
+            pixel=pixel,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model=MODEL,
+            data=prediction_data,
+        )
+
+        assert rows[0]['start_at'] == prediction_data.index[0].to_pydatetime()
+        assert type(rows[0]['actual']) is int  # noqa:WPS516
+        assert rows[0]['prediction'] == 11.12346
+        assert rows[0]['low80'] is None
+        assert rows[0]['high80'] is None
+        assert rows[0]['low95'] == 0.1123
+        assert rows[0]['high95'] == 1123.45
+
+    def test_nan_prediction_is_not_converted(self, pixel, prediction_data):
+        """Unlike in the confidence intervals, a `NaN` prediction stays a `NaN`.
+
+        So, it is not silently stored as `NULL`.
+        """
+        prediction_data['prediction'] = float('NaN')
+
+        rows = db.Forecast.rows_from_dataframe(
+            pixel=pixel,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model=MODEL,
+            data=prediction_data,
+        )
+        forecasts = db.Forecast.from_dataframe(
+            pixel=pixel,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model=MODEL,
+            data=prediction_data,
+        )
+
+        assert math.isnan(rows[0]['prediction'])
+        assert math.isnan(forecasts[0].prediction)
+
+    @pytest.mark.parametrize(
+        'constructor', ['from_dataframe', 'rows_from_dataframe'],
+    )
+    def test_missing_actual_is_not_converted(
+        self, pixel, prediction_data, constructor,
+    ):
+        """A `NaN` actual is not cast into some garbage integer."""
+        prediction_data['actual'] = (11, float('NaN'), 13)
+
+        with pytest.raises(ValueError, match='actual'):
+            getattr(db.Forecast, constructor)(
+                pixel=pixel,
+                time_step=test_config.LONG_TIME_STEP,
+                train_horizon=test_config.LONG_TRAIN_HORIZON,
+                model=MODEL,
+                data=prediction_data,
+            )
+
+    @pytest.mark.parametrize(
+        'constructor', ['from_dataframe', 'rows_from_dataframe'],
+    )
+    def test_same_values_as_row_by_row_conversion(self, pixel, constructor):
+        """The values are the same as with the former row-by-row conversion.
+
+        The predictions are half-way values with six decimals, for which
+        rounding to five decimals is most likely to differ.
+        """
+        rng = np.random.default_rng(seed=42)
+        index = pd.date_range(
+            dt.datetime(test_config.END.year, test_config.END.month, 1),
+            periods=500,
+            freq='H',
+            name='start_at',
+        )
+        half_way_values = (rng.integers(0, 10 ** 7, size=500) * 2 + 1) / 2e5
+        prediction_data = pd.DataFrame(
+            data={
+                'actual': rng.integers(0, 20, size=500),
+                'prediction': half_way_values,
+                'low80': half_way_values - 1,
+                'high80': half_way_values + 1,
+                'low95': half_way_values - 2,
+                'high95': half_way_values + 2,
+            },
+            index=index,
+        )
+        prediction_data.iloc[::7, 1:] = float('NaN')
+
+        # The conversion in `Forecast.from_dataframe()` before it was vectorized.
+        expected = []
+        for start_at in prediction_data.index:
+            row = {
+                'start_at': start_at,
+                'actual': int(prediction_data.loc[start_at, 'actual']),
+                'prediction': round(prediction_data.loc[start_at, 'prediction'], 5),
+            }
+            for column in ('low80', 'high80', 'low95', 'high95'):
+                value = prediction_data.loc[start_at, column]  # noqa:WPS110
+                row[column] = None if math.isnan(value) else round(value, 5)
+            expected.append(row)
+
+        results = getattr(db.Forecast, constructor)(
+            pixel=pixel,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model=MODEL,
+            data=prediction_data,
+        )
+
+        for result, row in zip(results, expected):
+            for column, value in row.items():  # noqa:WPS110
+                if isinstance(result, dict):
+                    actual = result[column]
+                else:
+                    actual = getattr(result, column)
+                if column == 'prediction' and math.isnan(value):
+                    assert math.isnan(actual)
+                else:
+                    assert actual == value
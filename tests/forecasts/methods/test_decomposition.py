@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -189,6 +190,45 @@ class TestInvalidArguments:
                 no=-1,
             )
 
+    def test_invalid_backend(self, vertical_no_demand):
+        """There are only two `backend`s."""
+        with pytest.raises(ValueError, match='`backend` must be either'):
+            decomposition.stl(
+                vertical_no_demand,
+                frequency=test_config.VERTICAL_FREQUENCY_LONG,
+                ns=NS,
+                backend='invalid',
+            )
+
+    def test_nl_greater_than_the_frequency_in_python(self, vertical_no_demand):
+        """`nl` must be strictly greater than the `frequency` ...
+
+        ... with the "python" `backend`.
+        """
+        with pytest.raises(ValueError, match='`> frequency`'):
+            decomposition.stl(
+                vertical_no_demand, frequency=7, ns=NS, backend='python',
+            )
+
+
+@pytest.fixture
+def vertical_demand(vertical_datetime_index):
+    """A vertical time series with order totals: daily seasonal demand.
+
+    The demand has a slight trend and some noise.
+    """
+    rng = np.random.default_rng(42)
+    daily_pattern = np.array([2, 5, 7, 4, 2, 1, 1, 2, 4, 6, 5, 3])
+    n_obs = len(vertical_datetime_index)
+
+    values = (
+        np.resize(daily_pattern, n_obs)
+        + np.linspace(0, 3, n_obs).round()
+        + rng.poisson(1, size=n_obs)
+    )
+
+    return pd.Series(values, index=vertical_datetime_index, name='n_orders')
+
 
 @pytest.mark.r
 class TestValidArguments:
@@ -241,3 +281,96 @@ class TestValidArguments:
         result = decomposed.sum().sum()
 
         assert result == 0
+
+
+class TestPythonBackend:
+    """Test `stl()` with the "python" `backend`."""
+
+    def test_structure_of_returned_dataframe(self, vertical_demand):
+        """`stl()` returns a `pd.DataFrame` with three columns."""
+        result = decomposition.stl(
+            vertical_demand,
+            frequency=test_config.VERTICAL_FREQUENCY_LONG,
+            ns=NS,
+            backend='python',
+        )
+
+        assert isinstance(result, pd.DataFrame)
+        assert list(result.columns) == ['seasonal', 'trend', 'residual']
+        assert result.index.equals(vertical_demand.index)
+
+    @pytest.mark.parametrize('no', [0, 1])
+    @pytest.mark.parametrize('ns', [7, NS])
+    def test_components_add_up(self, vertical_demand, ns, no):  # noqa:WPS110
+        """The three components add up to the decomposed time series."""
+        result = decomposition.stl(
+            vertical_demand,
+            frequency=test_config.VERTICAL_FREQUENCY_LONG,
+            ns=ns,
+            no=no,  # noqa:WPS110
+            backend='python',
+        )
+
+        np.testing.assert_allclose(
+            result.sum(axis=1).to_numpy(), vertical_demand.to_numpy(), atol=1e-4,
+        )
+
+    @pytest.mark.parametrize('nl', [None, 777])
+    @pytest.mark.parametrize('ds', [0, 1])
+    @pytest.mark.parametrize('js', [None, 1])
+    @pytest.mark.parametrize('no', [0, 1])
+    def test_decompose_time_series_with_no_demand(  # noqa:WPS211
+        self, vertical_no_demand, nl, ds, js, no,  # noqa:WPS110
+    ):
+        """Decomposing a time series with no demand ...
+
+        ... returns a `pd.DataFrame` with three columns holding only `0.0` values.
+        """
+        decomposed = decomposition.stl(
+            vertical_no_demand,
+            frequency=test_config.VERTICAL_FREQUENCY_LONG,
+            ns=NS,
+            nl=nl,
+            ds=ds,
+            js=js,
+            no=no,  # noqa:WPS110
+            backend='python',
+        )
+
+        result = decomposed.sum().sum()
+
+        assert result == 0
+
+
+@pytest.mark.r
+class TestBackendsAreEquivalent:
+    """The "python" `backend` of `stl()` yields the same components as R."""
+
+    @pytest.mark.parametrize('ns', [7, NS])
+    @pytest.mark.parametrize('nt', [None, 163])
+    @pytest.mark.parametrize('ds', [0, 1])
+    @pytest.mark.parametrize('js', [None, 1])
+    @pytest.mark.parametrize('ni', [2, 3])
+    @pytest.mark.parametrize('no', [0, 1])
+    def test_same_components(  # noqa:WPS211,WPS216
+        self, vertical_demand, ns, nt, ds, js, ni, no,  # noqa:WPS110
+    ):
+        """The components differ only by rounding errors."""
+        results = [
+            decomposition.stl(
+                vertical_demand,
+                frequency=test_config.VERTICAL_FREQUENCY_LONG,
+                ns=ns,
+                nt=nt,
+                ds=ds,
+                js=js,
+                ni=ni,
+                no=no,  # noqa:WPS110
+                backend=backend,
+            )
+            for backend in ('r', 'python')
+        ]
+
+        pd.testing.assert_frame_equal(
+            results[0], results[1], check_exact=False, atol=1e-3,
+        )
@@ -0,0 +1,335 @@
+"""Test the memoization of the forecasting `methods`."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import urban_meal_delivery
+from tests import config as test_config
+from urban_meal_delivery import config
+from urban_meal_delivery.forecasts import instrumentation
+from urban_meal_delivery.forecasts.methods import decomposition
+from urban_meal_delivery.forecasts.methods import ets
+from urban_meal_delivery.forecasts.methods import memoize
+
+
+@pytest.fixture(autouse=True)
+def enable_memoization(monkeypatch):
+    """Memoize the results of the `methods` in memory only."""
+    monkeypatch.setattr(config, 'FIT_CACHE_SIZE', 3)
+    monkeypatch.setattr(config, 'CACHE_DIR', None)
+    memoize.clear()
+    memoize._versions.cache_clear()  # noqa:WPS437
+
+    yield
+
+    memoize.clear()
+    memoize._versions.cache_clear()  # noqa:WPS437
+
+
+@pytest.fixture
+def training_ts(horizontal_datetime_index):
+    """A horizontal time series with some random demand."""
+    rng = np.random.default_rng(42)
+    values = rng.poisson(3, size=len(horizontal_datetime_index))
+
+    return pd.Series(values, index=horizontal_datetime_index, name='n_orders')
+
+
+@pytest.fixture
+def forecast_interval(horizontal_datetime_index):
+    """The day after the `training_ts`."""
+    return pd.date_range(
+        horizontal_datetime_index[-1] + pd.Timedelta(days=1),
+        periods=1,
+        freq='D',
+        name='start_at',
+    )
+
+
+@pytest.fixture
+def training_batch(training_ts):
+    """Three horizontal time series, one per row, with ids as the `.index`."""
+    return pd.DataFrame(
+        [training_ts.to_numpy(), training_ts.to_numpy() + 1, training_ts.to_numpy()],
+        index=pd.Index([3, 1, 2], name='pixel_id'),
+    )
+
+
+@pytest.fixture
+def fit(mocker):
+    """Spy on how often an ETS model is actually fitted."""
+    return mocker.spy(ets, '_predict_in_python')
+
+
+def predict_batch(training_batch, **kwargs):
+    """Shortcut to make batch predictions with the "python" `backend`."""
+    return ets.predict_batch(
+        training_ts=training_batch,
+        n_steps_ahead=1,
+        frequency=7,
+        backend='python',
+        **kwargs,
+    )
+
+
+def predict(training_ts, forecast_interval, **kwargs):
+    """Shortcut to make predictions with the "python" `backend`."""
+    return ets.predict(
+        training_ts=training_ts,
+        forecast_interval=forecast_interval,
+        frequency=7,
+        backend='python',
+        **kwargs,
+    )
+
+
+class TestMemoize:
+    """Test the `memoize()` decorator."""
+
+    def test_same_arguments_are_fitted_once(
+        self, training_ts, forecast_interval, fit,
+    ):
+        """Making the same prediction again re-uses the first result."""
+        result1 = predict(training_ts, forecast_interval)
+        result2 = predict(training_ts, forecast_interval)
+
+        assert fit.call_count == 1
+        pd.testing.assert_frame_equal(result1, result2)
+
+    def test_hits_are_counted(self, training_ts, forecast_interval, mocker):
+        """Re-used results are counted in the `instrumentation.metrics`."""
+        mocker.patch.object(instrumentation, 'metrics', instrumentation.Metrics())
+
+        predict(training_ts, forecast_interval)
+        predict(training_ts, forecast_interval)
+
+        assert instrumentation.metrics.counter('memo_hits') == 1
+
+    def test_disabled(self, training_ts, forecast_interval, fit, monkeypatch):
+        """A `FIT_CACHE_SIZE` of `0` disables the memoization."""
+        monkeypatch.setattr(config, 'FIT_CACHE_SIZE', 0)
+
+        predict(training_ts, forecast_interval)
+        predict(training_ts, forecast_interval)
+
+        assert fit.call_count == 2
+
+    def test_different_options_are_fitted_again(
+        self, training_ts, forecast_interval, fit,
+    ):
+        """Other arguments result in a new fit."""
+        predict(training_ts, forecast_interval, seasonal_fit=False)
+        predict(training_ts, forecast_interval, seasonal_fit=True)
+
+        assert fit.call_count == 2
+
+    def test_default_arguments_are_the_same(
+        self, training_ts, forecast_interval, fit,
+    ):
+        """Passing a default argument explicitly does not matter."""
+        predict(training_ts, forecast_interval)
+        predict(training_ts, forecast_interval, seasonal_fit=False)
+
+        assert fit.call_count == 1
+
+    def test_different_values_are_fitted_again(
+        self, training_ts, forecast_interval, fit,
+    ):
+        """Another time series results in a new fit."""
+        predict(training_ts, forecast_interval)
+        predict(training_ts + 1, forecast_interval)
+
+        assert fit.call_count == 2
+
+    def test_same_values_at_other_times(self, training_ts, forecast_interval, fit):
+        """The same observations at other times re-use the result ...
+
+        ... but with the `.index` asked for.
+        """
+        one_week = pd.Timedelta(days=7)
+        later_ts = training_ts.copy()
+        later_ts.index = training_ts.index + one_week
+
+        result1 = predict(training_ts, forecast_interval)
+        result2 = predict(later_ts, forecast_interval + one_week)
+
+        assert fit.call_count == 1
+        assert result2.index.equals(forecast_interval + one_week)
+        np.testing.assert_array_equal(result1.to_numpy(), result2.to_numpy())
+
+    def test_results_are_copies(self, training_ts, forecast_interval):
+        """Changing a returned result does not change the memoized one."""
+        result1 = predict(training_ts, forecast_interval)
+        result1.insert(loc=0, column='actual', value=0)
+
+        result2 = predict(training_ts, forecast_interval)
+
+        assert 'actual' not in result2.columns
+
+    def test_least_recently_used_results_are_evicted(
+        self, training_ts, forecast_interval, fit,
+    ):
+        """At most `FIT_CACHE_SIZE` results are kept in memory."""
+        for offset in range(4):
+            predict(training_ts + offset, forecast_interval)
+
+        predict(training_ts + 3, forecast_interval)  # still memoized
+        predict(training_ts, forecast_interval)  # evicted
+
+        assert fit.call_count == 5
+
+    def test_persist_on_disk(
+        self, training_ts, forecast_interval, fit, monkeypatch, tmp_path,
+    ):
+        """With a `CACHE_DIR`, the results survive the in-memory cache."""
+        monkeypatch.setattr(config, 'CACHE_DIR', str(tmp_path))
+
+        result1 = predict(training_ts, forecast_interval)
+        memoize.clear()
+        result2 = predict(training_ts, forecast_interval)
+
+        assert fit.call_count == 1
+        assert os.listdir(tmp_path / 'fits')
+        pd.testing.assert_frame_equal(result1, result2)
+
+    def test_package_upgrade_is_fitted_again(
+        self, training_ts, forecast_interval, fit, monkeypatch,
+    ):
+        """Results of another version of this package are not re-used."""
+        predict(training_ts, forecast_interval)
+        monkeypatch.setattr(urban_meal_delivery, '__version__', 'upgraded')
+        memoize._versions.cache_clear()  # noqa:WPS437
+
+        predict(training_ts, forecast_interval)
+
+        assert fit.call_count == 2
+
+    def test_library_upgrade_is_fitted_again(
+        self, training_ts, forecast_interval, fit, monkeypatch,
+    ):
+        """Results of another version of `statsmodels` are not re-used."""
+        predict(training_ts, forecast_interval)
+        monkeypatch.setattr(memoize.statsmodels, '__version__', 'upgraded')
+        memoize._versions.cache_clear()  # noqa:WPS437
+
+        predict(training_ts, forecast_interval)
+
+        assert fit.call_count == 2
+
+    def test_backend_is_in_fingerprint(self, training_ts):
+        """The same arguments fitted with another `backend` differ."""
+        arguments = {'training_ts': training_ts}
+
+        result1 = memoize.fingerprint(ets.predict, {**arguments, 'backend': 'r'})
+        result2 = memoize.fingerprint(ets.predict, {**arguments, 'backend': 'python'})
+
+        assert result1 != result2
+
+    def test_errors_are_not_memoized(self, training_ts, forecast_interval):
+        """Invalid arguments raise an error every time."""
+        training_ts = training_ts.astype(float)
+        training_ts.iloc[0] = pd.NA
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match='must not contain `NaN`'):
+                predict(training_ts, forecast_interval)
+
+    def test_decomposition_keeps_the_index(self, vertical_no_demand, mocker):
+        """`stl()` returns the `.index` of the `time_series` decomposed."""
+        spy = mocker.spy(decomposition.sm_seasonal, 'STL')
+        shifted_ts = vertical_no_demand.copy()
+        shifted_ts.index = vertical_no_demand.index + pd.Timedelta(days=7)
+
+        for time_series in (vertical_no_demand, shifted_ts):
+            result = decomposition.stl(
+                time_series,
+                frequency=test_config.VERTICAL_FREQUENCY_LONG,
+                ns=999,
+                backend='python',
+            )
+
+            assert result.index.equals(time_series.index)
+
+        assert spy.call_count == 1
+
+
+class TestMemoizeBatch:
+    """Test the `memoize_batch()` decorator."""
+
+    def test_same_results_as_without_memoization(self, training_batch, monkeypatch):
+        """The memoization does not change the results, including the `.index`."""
+        result = predict_batch(training_batch)
+        monkeypatch.setattr(config, 'FIT_CACHE_SIZE', 0)
+
+        expected = predict_batch(training_batch)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_identical_time_series_are_fitted_once(self, training_batch, fit):
+        """The first and the last time series are the same."""
+        predict_batch(training_batch)
+
+        assert fit.call_count == 2
+
+    def test_same_batch_is_fitted_once(self, training_batch, fit):
+        """Making the same predictions again re-uses the first results."""
+        result1 = predict_batch(training_batch)
+        result2 = predict_batch(training_batch)
+
+        assert fit.call_count == 2
+        pd.testing.assert_frame_equal(result1, result2)
+
+    def test_only_new_time_series_are_fitted(self, training_batch, fit):
+        """Time series memoized with another batch are not fitted again ...
+
+        ... and keep their ids in the new batch.
+        """
+        predict_batch(training_batch.iloc[:1])
+        fit.reset_mock()
+
+        result = predict_batch(training_batch)
+
+        assert fit.call_count == 1
+        assert list(result.index) == [(3, 1), (1, 1), (2, 1)]
+        assert result.index.names == ['pixel_id', 'step']
+
+    def test_time_series_of_single_predictions_are_not_shared(
+        self, training_ts, training_batch, forecast_interval, fit,
+    ):
+        """`predict()` and `predict_batch()` are memoized separately."""
+        predict(training_ts, forecast_interval)
+
+        predict_batch(training_batch)
+
+        assert fit.call_count == 3
+
+    def test_hits_are_counted_for_whole_batches(self, training_batch, mocker):
+        """A batch is a hit only if none of its time series is fitted."""
+        mocker.patch.object(instrumentation, 'metrics', instrumentation.Metrics())
+
+        predict_batch(training_batch.iloc[:1])
+        predict_batch(training_batch)
+        predict_batch(training_batch)
+
+        assert instrumentation.metrics.counter('memo_hits') == 1
+
+    def test_results_are_copies(self, training_batch):
+        """Changing a returned result does not change the memoized ones."""
+        result1 = predict_batch(training_batch)
+        result1['prediction'] = -1.0
+
+        result2 = predict_batch(training_batch)
+
+        assert (result2['prediction'] != -1.0).all()
+
+    def test_errors_are_not_memoized(self, training_batch):
+        """Time series with `NaN` values raise an error every time."""
+        training_batch = training_batch.astype(float)
+        training_batch.iloc[1, 0] = pd.NA
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match='must not contain `NaN`'):
+                predict_batch(training_batch)
@@ -2,8 +2,11 @@
 
 import datetime as dt
 
+import numpy as np
 import pandas as pd
 import pytest
+from statsmodels.tsa import api as ts_stats
+from statsmodels.tsa.exponential_smoothing import ets as sm_ets
 
 from tests import config as test_config
 from urban_meal_delivery import config
@@ -12,6 +15,27 @@ from urban_meal_delivery.forecasts.methods import ets
 from urban_meal_delivery.forecasts.methods import extrapolate_season
 
 
+def _predict_with_loop_over_lags(training_ts, forecast_interval, *, frequency):
+    """The original `extrapolate_season.predict()` before it was vectorized."""
+    extrapolated_ts = pd.Series(index=forecast_interval, dtype=float)
+    seasonal_lag = frequency * (training_ts.index[1] - training_ts.index[0])
+
+    for lag in range(frequency):
+        observations = training_ts[slice(lag, 999_999_999, frequency)]
+        trend = observations - ts_stats.detrend(observations)
+
+        slope = trend[-1] - trend[-2]
+        prediction = trend[-1] + slope
+        idx = observations.index.max() + seasonal_lag
+        while idx <= forecast_interval.max():
+            if idx in forecast_interval:
+                extrapolated_ts.loc[idx] = prediction
+            prediction += slope
+            idx += seasonal_lag
+
+    return extrapolated_ts.round(5)
+
+
 @pytest.fixture
 def forecast_interval():
     """A `pd.Index` with `DateTime` values ...
@@ -56,6 +80,43 @@ def forecast_time_step():
     return index
 
 
+@pytest.fixture
+def horizontal_demand(horizontal_datetime_index):
+    """A horizontal time series with order totals: weekly seasonal demand.
+
+    The demand is always positive but has some noise.
+    """
+    rng = np.random.default_rng(42)
+    weekly_pattern = np.array([4, 5, 5, 6, 9, 12, 8])
+    n_obs = len(horizontal_datetime_index)
+
+    values = np.resize(weekly_pattern, n_obs) + rng.integers(0, 3, size=n_obs)
+
+    return pd.Series(values, index=horizontal_datetime_index, name='n_orders')
+
+
+@pytest.fixture
+def horizontal_sparse_demand(horizontal_datetime_index):
+    """A horizontal time series with order totals: random demand with `0`s."""
+    rng = np.random.default_rng(42)
+    values = rng.poisson(1.5, size=len(horizontal_datetime_index))
+
+    return pd.Series(values, index=horizontal_datetime_index, name='n_orders')
+
+
+@pytest.fixture
+def horizontal_batch(horizontal_no_demand, horizontal_demand, horizontal_sparse_demand):
+    """Three horizontal time series, one per row, with ids as the `.index`."""
+    return pd.DataFrame(
+        [
+            horizontal_no_demand.to_numpy(),
+            horizontal_demand.to_numpy(),
+            horizontal_sparse_demand.to_numpy(),
+        ],
+        index=pd.Index([3, 1, 2], name='pixel_id'),
+    )
+
+
 @pytest.mark.r
 @pytest.mark.parametrize(
     'func', [arima.predict, ets.predict, extrapolate_season.predict],
@@ -128,3 +189,638 @@ class TestMakePredictions:
         result = predictions.sum().sum()
 
         assert result == 0
+
+
+class TestETSInPython:
+    """Make predictions with `ets.predict()` and the "python" `backend`."""
+
+    def test_training_data_contains_nan_values(
+        self, horizontal_demand, forecast_time_step,
+    ):
+        """`training_ts` must not contain `NaN` values."""
+        horizontal_demand = horizontal_demand.astype(float)
+        horizontal_demand.iloc[0] = pd.NA
+
+        with pytest.raises(ValueError, match='must not contain `NaN`'):
+            ets.predict(
+                training_ts=horizontal_demand,
+                forecast_interval=forecast_time_step,
+                frequency=7,
+                backend='python',
+            )
+
+    def test_invalid_backend(self, horizontal_demand, forecast_time_step):
+        """There are only two `backend`s."""
+        with pytest.raises(ValueError, match='`backend` must be either'):
+            ets.predict(
+                training_ts=horizontal_demand,
+                forecast_interval=forecast_time_step,
+                frequency=7,
+                backend='invalid',
+            )
+
+    @pytest.mark.parametrize('seasonal_fit', [True, False])
+    def test_structure_of_returned_dataframe(
+        self, horizontal_demand, forecast_interval, seasonal_fit,
+    ):
+        """`ets.predict()` returns a `pd.DataFrame` with five columns."""
+        result = ets.predict(
+            training_ts=horizontal_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+            seasonal_fit=seasonal_fit,
+            backend='python',
+        )
+
+        assert isinstance(result, pd.DataFrame)
+        assert list(result.columns) == [
+            'prediction',
+            'low80',
+            'high80',
+            'low95',
+            'high95',
+        ]
+        assert result.index.equals(forecast_interval)
+
+    @pytest.mark.parametrize('seasonal_fit', [True, False])
+    def test_intervals_are_nested(
+        self, horizontal_sparse_demand, forecast_interval, seasonal_fit,
+    ):
+        """The 95% intervals contain the 80% intervals ...
+
+        ... which contain the point forecasts.
+        """
+        result = ets.predict(
+            training_ts=horizontal_sparse_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+            seasonal_fit=seasonal_fit,
+            backend='python',
+        )
+
+        assert (result['low95'] < result['low80']).all()
+        assert (result['low80'] < result['prediction']).all()
+        assert (result['prediction'] < result['high80']).all()
+        assert (result['high80'] < result['high95']).all()
+
+    def test_seasonality_is_captured(self, horizontal_demand, forecast_interval):
+        """The forecasts continue the weekly pattern."""
+        # One week into the future.
+        forecast_interval = pd.date_range(
+            forecast_interval[0], periods=7, freq='D', name='start_at',
+        )
+
+        result = ets.predict(
+            training_ts=horizontal_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+            seasonal_fit=True,
+            backend='python',
+        )
+
+        # The days with the lowest and highest demand are the same as in the past.
+        n_obs = len(horizontal_demand)
+        expected = np.resize(np.array([4, 5, 5, 6, 9, 12, 8]), n_obs + 7)[n_obs:]
+        assert result['prediction'].to_numpy().argmin() == expected.argmin()
+        assert result['prediction'].to_numpy().argmax() == expected.argmax()
+
+    def test_predict_horizontal_time_series_with_no_demand(
+        self, horizontal_no_demand, forecast_time_step,
+    ):
+        """Predicting a horizontal time series with no demand ...
+
+        ... returns a `pd.DataFrame` with five columns holding only `0.0` values.
+        """
+        predictions = ets.predict(
+            training_ts=horizontal_no_demand,
+            forecast_interval=forecast_time_step,
+            frequency=7,
+            backend='python',
+        )
+
+        result = predictions.sum().sum()
+
+        assert result == 0
+
+    def test_predictions_are_reproducible(
+        self, horizontal_demand, forecast_interval,
+    ):
+        """Simulated intervals are seeded."""
+        results = [
+            ets.predict(
+                training_ts=horizontal_demand,
+                forecast_interval=forecast_interval,
+                frequency=7,
+                seasonal_fit=True,
+                backend='python',
+            )
+            for _ in range(2)
+        ]
+
+        pd.testing.assert_frame_equal(results[0], results[1])
+
+    def test_short_time_series(self, horizontal_demand, forecast_interval):
+        """Two weeks suffice for a seasonal fit.
+
+        The models with the most parameters are skipped.
+        """
+        result = ets.predict(
+            training_ts=horizontal_demand.iloc[-14:],
+            forecast_interval=forecast_interval,
+            frequency=7,
+            seasonal_fit=True,
+            backend='python',
+        )
+
+        assert not result.isnull().any(axis=None)
+
+    @pytest.mark.parametrize(
+        ['trend', 'damped_trend', 'seasonal'],
+        [(None, False, None), ('add', True, None), ('add', False, 'add')],
+    )
+    def test_analytic_intervals(
+        self, horizontal_demand, trend, damped_trend, seasonal,
+    ):
+        """The variances are the same as the exact ones in `statsmodels` ...
+
+        ... except that R corrects them for the degrees of freedom,
+        which include the variance of the errors.
+        """
+        observations = horizontal_demand.astype(float).reset_index(drop=True)
+        model = sm_ets.ETSModel(
+            observations,
+            error='add',
+            trend=trend,
+            damped_trend=damped_trend,
+            seasonal=seasonal,
+            seasonal_periods=7 if seasonal else None,
+        )
+        fit = model.fit(disp=False)
+        n_obs = len(observations)
+        n_params = ets._n_parameters(  # noqa:WPS437
+            trend=trend, damped_trend=damped_trend, seasonal=seasonal, frequency=7,
+        )
+
+        result = ets._forecast_variance(  # noqa:WPS437
+            fit, fit.forecast(12).to_numpy(),
+        )
+
+        prediction = fit.get_prediction(start=n_obs, end=n_obs + 11)
+        expected = prediction.var_pred_mean * n_obs / (n_obs - (n_params + 1))
+        np.testing.assert_allclose(result, expected)
+
+    @pytest.mark.parametrize(
+        ['error', 'trend', 'damped_trend', 'seasonal', 'name'],
+        [
+            ('add', None, False, None, 'ETS(A,N,N)'),
+            ('mul', 'add', True, None, 'ETS(M,Ad,N)'),
+            ('mul', 'add', False, 'mul', 'ETS(M,A,M)'),
+        ],
+    )
+    def test_method_name(  # noqa:WPS211
+        self, horizontal_demand, error, trend, damped_trend, seasonal, name,
+    ):
+        """The fitted models are named like in R."""
+        model = sm_ets.ETSModel(
+            horizontal_demand.astype(float).reset_index(drop=True),
+            error=error,
+            trend=trend,
+            damped_trend=damped_trend,
+            seasonal=seasonal,
+            seasonal_periods=7 if seasonal else None,
+        )
+
+        result = ets._method_name(model.fit(disp=False))  # noqa:WPS437
+
+        assert result == name
+
+    def test_method_in_attrs(self, horizontal_demand, forecast_interval):
+        """The `.attrs` hold the name of the chosen model."""
+        fit = ets._select_model(  # noqa:WPS437
+            horizontal_demand.astype(float).reset_index(drop=True),
+            frequency=7,
+            seasonal_fit=True,
+        )
+
+        result = ets.predict(
+            training_ts=horizontal_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+            seasonal_fit=True,
+            backend='python',
+        )
+
+        assert result.attrs['method'] == ets._method_name(fit)  # noqa:WPS437
+
+
+@pytest.mark.r
+class TestETSBackendsAreEquivalent:
+    """The "python" `backend` of `ets.predict()` yields results close to R's."""
+
+    @pytest.mark.parametrize('seasonal_fit', [True, False])
+    @pytest.mark.parametrize(
+        'training_ts', ['horizontal_demand', 'horizontal_sparse_demand'],
+    )
+    def test_same_model(
+        self, request, training_ts, forecast_interval, seasonal_fit,
+    ):
+        """Both `backend`s choose the same ETS model."""
+        training_ts = request.getfixturevalue(training_ts)
+        results = [
+            ets.predict(
+                training_ts=training_ts,
+                forecast_interval=forecast_interval,
+                frequency=7,
+                seasonal_fit=seasonal_fit,
+                backend=backend,
+            )
+            for backend in ('r', 'python')
+        ]
+
+        assert results[0].attrs['method'] == results[1].attrs['method']
+
+    @pytest.mark.parametrize('seasonal_fit', [True, False])
+    @pytest.mark.parametrize(
+        'training_ts',
+        ['horizontal_no_demand', 'horizontal_demand', 'horizontal_sparse_demand'],
+    )
+    def test_same_predictions(  # noqa:WPS210
+        self, request, training_ts, forecast_interval, seasonal_fit,
+    ):
+        """The point forecasts and intervals differ by less than half an order."""
+        training_ts = request.getfixturevalue(training_ts)
+        results = [
+            ets.predict(
+                training_ts=training_ts,
+                forecast_interval=forecast_interval,
+                frequency=7,
+                seasonal_fit=seasonal_fit,
+                backend=backend,
+            )
+            for backend in ('r', 'python')
+        ]
+
+        pd.testing.assert_frame_equal(
+            results[0], results[1], check_exact=False, atol=0.5,
+        )
+
+
+class TestPredictBatch:
+    """Make predictions with `arima.predict_batch()` and `ets.predict_batch()`.
+
+    The test cases that do not call R use the "python" `backend` of
+    `ets.predict_batch()`.
+    """
+
+    @pytest.mark.parametrize('func', [arima.predict_batch, ets.predict_batch])
+    def test_training_data_contains_nan_values(self, func, horizontal_batch):
+        """`training_ts` must not contain `NaN` values."""
+        horizontal_batch = horizontal_batch.astype(float)
+        horizontal_batch.iloc[1, 0] = pd.NA
+
+        with pytest.raises(ValueError, match='must not contain `NaN`'):
+            func(training_ts=horizontal_batch, n_steps_ahead=1, frequency=7)
+
+    def test_invalid_backend(self, horizontal_batch):
+        """There are only two `backend`s."""
+        with pytest.raises(ValueError, match='`backend` must be either'):
+            ets.predict_batch(
+                training_ts=horizontal_batch,
+                n_steps_ahead=1,
+                frequency=7,
+                backend='invalid',
+            )
+
+    def test_structure_of_returned_dataframe(self, horizontal_batch):
+        """`.predict_batch()` returns a `pd.DataFrame` with five columns ...
+
+        ... and one row per time series and time step ahead.
+        """
+        result = ets.predict_batch(
+            training_ts=horizontal_batch,
+            n_steps_ahead=2,
+            frequency=7,
+            seasonal_fit=True,
+            backend='python',
+        )
+
+        assert list(result.columns) == [
+            'prediction',
+            'low80',
+            'high80',
+            'low95',
+            'high95',
+        ]
+        assert result.index.names == ['pixel_id', 'step']
+        assert list(result.index) == [(3, 1), (3, 2), (1, 1), (1, 2), (2, 1), (2, 2)]
+
+    def test_empty_batch(self, horizontal_batch):
+        """An empty batch results in no predictions."""
+        result = ets.predict_batch(
+            training_ts=horizontal_batch.iloc[:0],
+            n_steps_ahead=2,
+            frequency=7,
+            backend='python',
+        )
+
+        assert result.empty
+        assert result.index.names == ['pixel_id', 'step']
+
+    def test_same_predictions_as_one_by_one(
+        self, horizontal_batch, forecast_time_step,
+    ):
+        """`.predict_batch()` predicts the same as `.predict()` per time series."""
+        results = ets.predict_batch(
+            training_ts=horizontal_batch,
+            n_steps_ahead=1,
+            frequency=7,
+            seasonal_fit=True,
+            backend='python',
+        )
+
+        for pixel_id, row in horizontal_batch.iterrows():
+            expected = ets.predict(
+                training_ts=row,
+                forecast_interval=forecast_time_step,
+                frequency=7,
+                seasonal_fit=True,
+                backend='python',
+            )
+
+            np.testing.assert_array_equal(
+                results.loc[pixel_id].to_numpy(), expected.to_numpy(),
+            )
+
+    @pytest.mark.r
+    @pytest.mark.parametrize('seasonal_fit', [True, False])
+    @pytest.mark.parametrize(
+        'batch_func, func',
+        [(arima.predict_batch, arima.predict), (ets.predict_batch, ets.predict)],
+    )
+    def test_same_predictions_as_one_by_one_in_r(  # noqa:WPS211
+        self, batch_func, func, seasonal_fit, horizontal_batch, forecast_interval,
+    ):
+        """`.predict_batch()` predicts the same as `.predict()` per time series.
+
+        The whole batch is fitted with one call to R.
+        """
+        results = batch_func(
+            training_ts=horizontal_batch,
+            n_steps_ahead=len(forecast_interval),
+            frequency=7,
+            seasonal_fit=seasonal_fit,
+        )
+
+        for pixel_id, row in horizontal_batch.iterrows():
+            expected = func(
+                training_ts=row,
+                forecast_interval=forecast_interval,
+                frequency=7,
+                seasonal_fit=seasonal_fit,
+            )
+
+            np.testing.assert_array_equal(
+                results.loc[pixel_id].to_numpy(), expected.to_numpy(),
+            )
+
+
+class TestExtrapolateSeason:
+    """Make predictions with `extrapolate_season.predict(_batch)()`."""
+
+    @pytest.fixture
+    def vertical_trending_demand(self, vertical_datetime_index):
+        """A vertical time series with a linear trend per seasonal lag.
+
+        Each seasonal lag has its own intercept and slope.
+        """
+        frequency = test_config.VERTICAL_FREQUENCY_LONG
+        n_obs = len(vertical_datetime_index)
+        positions = np.arange(n_obs)
+
+        values = (
+            positions % frequency  # = intercept
+            + (positions // frequency) * ((positions % frequency) % 5 - 2)  # slope
+        )
+
+        return pd.Series(values, index=vertical_datetime_index, name='n_orders')
+
+    def test_extrapolate_linear_trends(
+        self, vertical_trending_demand, forecast_interval,
+    ):
+        """Linear trends per seasonal lag are continued.
+
+        As the nights are not in the vertical time series, one week ahead
+        corresponds to two seasonal lags of `84` hours, and the slope is
+        added twice.
+        """
+        frequency = test_config.VERTICAL_FREQUENCY_LONG
+        positions = np.arange(
+            len(vertical_trending_demand),
+            len(vertical_trending_demand) + len(forecast_interval),
+        )
+        expected = (
+            positions % frequency
+            + (positions // frequency + 1) * ((positions % frequency) % 5 - 2)
+        )
+
+        result = extrapolate_season.predict(
+            training_ts=vertical_trending_demand,
+            forecast_interval=forecast_interval,
+            frequency=frequency,
+        )
+
+        np.testing.assert_allclose(result['prediction'].to_numpy(), expected)
+
+    def test_incomplete_last_cycle(self, vertical_trending_demand):
+        """The last cycle in the training data may be incomplete.
+
+        That is the case for real-time time series.
+        """
+        frequency = test_config.VERTICAL_FREQUENCY_LONG
+        training_ts = vertical_trending_demand.iloc[:-5]
+        forecast_interval = vertical_trending_demand.index[-5:]
+        positions = np.arange(
+            len(vertical_trending_demand) - 5, len(vertical_trending_demand),
+        )
+        # The slope is added twice as in `test_extrapolate_linear_trends()`.
+        expected = (
+            positions % frequency
+            + (positions // frequency + 1) * ((positions % frequency) % 5 - 2)
+        )
+
+        result = extrapolate_season.predict(
+            training_ts=training_ts,
+            forecast_interval=pd.DatetimeIndex(forecast_interval),
+            frequency=frequency,
+        )
+
+        np.testing.assert_allclose(result['prediction'].to_numpy(), expected)
+
+    def test_not_enough_training_data(self, vertical_no_demand, forecast_interval):
+        """All seasonal lags must be observed at least twice."""
+        with pytest.raises(ValueError, match='missing predictions'):
+            extrapolate_season.predict(
+                training_ts=vertical_no_demand.iloc[:10],
+                forecast_interval=forecast_interval,
+                frequency=test_config.VERTICAL_FREQUENCY_LONG,
+            )
+
+    def test_batch_contains_nan_values(self, horizontal_batch):
+        """`training_ts` must not contain `NaN` values."""
+        horizontal_batch = horizontal_batch.astype(float)
+        horizontal_batch.iloc[1, 0] = pd.NA
+
+        with pytest.raises(ValueError, match='must not contain `NaN`'):
+            extrapolate_season.predict_batch(
+                training_ts=horizontal_batch, n_steps_ahead=1, frequency=7,
+            )
+
+    def test_same_predictions_as_one_by_one(
+        self, horizontal_batch, horizontal_datetime_index,
+    ):
+        """`.predict_batch()` predicts the same as `.predict()` per time series."""
+        forecast_interval = pd.date_range(
+            horizontal_datetime_index[-1] + dt.timedelta(days=1), periods=10, freq='D',
+        )
+
+        results = extrapolate_season.predict_batch(
+            training_ts=horizontal_batch,
+            n_steps_ahead=len(forecast_interval),
+            frequency=7,
+        )
+
+        assert results.index.names == ['pixel_id', 'step']
+        for pixel_id, row in horizontal_batch.iterrows():
+            expected = extrapolate_season.predict(
+                training_ts=row.set_axis(horizontal_datetime_index),
+                forecast_interval=forecast_interval,
+                frequency=7,
+            )
+
+            np.testing.assert_array_equal(
+                results.loc[pixel_id].to_numpy(), expected.to_numpy(),
+            )
+
+    @pytest.mark.parametrize('seed', range(10))
+    @pytest.mark.parametrize('kind', ['horizontal', 'vertical', 'real-time'])
+    def test_same_predictions_as_loop_over_lags(  # noqa:WPS210
+        self, horizontal_datetime_index, vertical_datetime_index, kind, seed,
+    ):
+        """The predictions are the same as with the original implementation.
+
+        The original `extrapolate_season.predict()` is copied below. The
+        predictions must be identical bit for bit and not only close.
+        """
+        rng = np.random.default_rng(seed)
+
+        if kind == 'horizontal':
+            frequency = 7
+            datetime_index = horizontal_datetime_index
+            n_steps_ahead = int(rng.integers(1, 15))
+        else:
+            frequency = test_config.VERTICAL_FREQUENCY_LONG
+            datetime_index = vertical_datetime_index
+            n_steps_ahead = 12 if kind == 'vertical' else int(rng.integers(1, 12))
+
+        # Forecast the last time steps, either the last day (vertical),
+        # some hours of it (real-time), or some days (horizontal).
+        time_series = pd.Series(
+            rng.normal(0, 3, size=len(datetime_index)) * 10.0 ** rng.integers(-3, 4),
+            index=datetime_index,
+        )
+        training_ts = time_series.iloc[:-n_steps_ahead]
+        forecast_interval = pd.DatetimeIndex(time_series.index[-n_steps_ahead:])
+
+        result = extrapolate_season.predict(
+            training_ts=training_ts,
+            forecast_interval=forecast_interval,
+            frequency=frequency,
+        )
+
+        expected = _predict_with_loop_over_lags(
+            training_ts=training_ts,
+            forecast_interval=forecast_interval,
+            frequency=frequency,
+        )
+        np.testing.assert_array_equal(
+            result['prediction'].to_numpy().view(np.int64),
+            expected.to_numpy().view(np.int64),
+        )
+
+
+@pytest.mark.r
+class TestARIMAOrder:
+    """Fit ARIMA models with a known `order`."""
+
+    def test_order_not_for_seasonal_fits(self, horizontal_demand, forecast_interval):
+        """Only non-seasonal orders can be re-used."""
+        with pytest.raises(ValueError, match='non-seasonal'):
+            arima.predict(
+                training_ts=horizontal_demand,
+                forecast_interval=forecast_interval,
+                frequency=7,
+                seasonal_fit=True,
+                order=(1, 0, 0),
+            )
+
+    def test_chosen_order_is_returned(self, horizontal_demand, forecast_interval):
+        """The `.attrs` hold the order chosen by R and the residuals' variance."""
+        result = arima.predict(
+            training_ts=horizontal_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+        )
+
+        assert len(result.attrs['order']) == 3
+        assert isinstance(result.attrs['include_mean'], bool)
+        assert isinstance(result.attrs['include_drift'], bool)
+        assert result.attrs['sigma2'] > 0
+
+    def test_reuse_order(self, horizontal_demand, forecast_interval):
+        """Re-fitting the chosen order keeps the order."""
+        result1 = arima.predict(
+            training_ts=horizontal_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+        )
+
+        result2 = arima.predict(
+            training_ts=horizontal_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+            order=result1.attrs['order'],
+        )
+
+        assert result2.attrs['order'] == result1.attrs['order']
+        assert list(result2.columns) == list(result1.columns)
+
+    def test_reuse_order_with_drift(self, horizontal_datetime_index, forecast_interval):
+        """A model with drift is fitted with the drift again.
+
+        Then, the predictions are the same as the ones of the chosen model.
+        """
+        rng = np.random.default_rng(42)
+        n_obs = len(horizontal_datetime_index)
+        trending_demand = pd.Series(
+            np.arange(n_obs) + rng.normal(0, 1, size=n_obs),
+            index=horizontal_datetime_index,
+            name='n_orders',
+        )
+        result1 = arima.predict(
+            training_ts=trending_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+        )
+
+        result2 = arima.predict(
+            training_ts=trending_demand,
+            forecast_interval=forecast_interval,
+            frequency=7,
+            order=result1.attrs['order'],
+            include_mean=result1.attrs['include_mean'],
+            include_drift=result1.attrs['include_drift'],
+        )
+
+        assert result1.attrs['include_drift']
+        assert result2.attrs['include_drift']
+        pd.testing.assert_frame_equal(result2, result1)
@@ -0,0 +1,415 @@
+"""Test the `DemandCube` class in the `urban_meal_delivery.forecasts.cube` module."""
+
+import datetime as dt
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests import config as test_config
+from urban_meal_delivery import config
+from urban_meal_delivery.forecasts import cube as cube_mod
+
+
+@pytest.fixture
+def random_totals(order_totals):
+    """Like the `order_totals` fixture but with random order counts."""
+    rng = np.random.default_rng(42)
+    totals = order_totals.copy()
+    totals['n_orders'] = rng.integers(0, 10, size=len(totals))
+
+    return totals
+
+
+@pytest.fixture
+def cube(random_totals):
+    """A `DemandCube` made from the `random_totals`."""
+    return cube_mod.DemandCube.from_totals(
+        random_totals, time_step=test_config.LONG_TIME_STEP,
+    )
+
+
+class TestSpecialMethods:
+    """Test the special methods in `DemandCube`."""
+
+    def test_instantiate(self, cube):
+        """Test `DemandCube.__init__()`."""
+        assert cube is not None
+
+    def test_wrong_number_of_slots(self):
+        """The third dimension must match the number of daily time steps."""
+        with pytest.raises(ValueError, match='one slot per time step'):
+            cube_mod.DemandCube(
+                counts=np.zeros((1, 1, 5), dtype=np.int64),
+                pixel_ids=np.array([1]),
+                first_day=test_config.START.date(),
+                time_step=test_config.LONG_TIME_STEP,
+            )
+
+    def test_wrong_number_of_pixels(self):
+        """The first dimension must match the number of `pixel_ids`."""
+        with pytest.raises(ValueError, match='one row per `pixel_id`'):
+            cube_mod.DemandCube(
+                counts=np.zeros((1, 1, 12), dtype=np.int64),
+                pixel_ids=np.array([1, 2]),
+                first_day=test_config.START.date(),
+                time_step=test_config.LONG_TIME_STEP,
+            )
+
+
+class TestConversion:
+    """Test the conversion from and to order totals."""
+
+    def test_shape(self, cube, good_pixel_id):
+        """The `.counts` have one row per pixel, column per day, and slot per hour."""
+        # `+1` as both the `START` and `END` day are included.
+        n_days = (test_config.END - test_config.START).days + 1
+
+        assert cube.counts.shape == (2, n_days, 12)
+        assert list(cube.pixel_ids) == [good_pixel_id, good_pixel_id + 1]
+        assert cube.first_day == test_config.START.date()
+        assert cube.n_days == n_days
+        assert cube.n_daily_time_steps == 12
+        assert cube.time_step == test_config.LONG_TIME_STEP
+
+    def test_round_trip(self, cube, random_totals):
+        """Converting the `DemandCube` back yields the original order totals."""
+        result = cube.to_totals()
+
+        pd.testing.assert_frame_equal(result, random_totals, check_names=False)
+        assert result.index.names == ['pixel_id', 'start_at']
+
+    def test_missing_time_steps_are_filled_with_zeros(self, random_totals):
+        """Sparse order totals are made dense."""
+        sparse_totals = random_totals[random_totals['n_orders'] > 0]
+
+        result = cube_mod.DemandCube.from_totals(
+            sparse_totals, time_step=test_config.LONG_TIME_STEP,
+        )
+
+        assert result.counts.sum() == random_totals['n_orders'].sum()
+        assert (result.counts == 0).sum() == (random_totals['n_orders'] == 0).sum()
+
+    def test_no_totals(self, random_totals):
+        """Edge case that does not occur for real-life data."""
+        result = cube_mod.DemandCube.from_totals(
+            random_totals.iloc[:0], time_step=test_config.LONG_TIME_STEP,
+        )
+
+        assert result.counts.shape == (0, 0, 12)
+        assert len(result.to_totals()) == 0  # noqa:WPS507
+
+    def test_extend_to_other_pixels_and_days(self, random_totals, good_pixel_id):
+        """Pixels and days without any order totals are filled with `0`s."""
+        first_day = test_config.START.date() - dt.timedelta(days=1)
+        last_day = test_config.END.date() + dt.timedelta(days=2)
+
+        result = cube_mod.DemandCube.from_totals(
+            random_totals,
+            time_step=test_config.LONG_TIME_STEP,
+            pixel_ids=[good_pixel_id + 2, good_pixel_id],
+            first_day=first_day,
+            last_day=last_day,
+        )
+
+        n_days = (last_day - first_day).days + 1
+        assert result.counts.shape == (3, n_days, 12)
+        assert result.first_day == first_day
+        assert list(result.pixel_ids) == [
+            good_pixel_id,
+            good_pixel_id + 1,
+            good_pixel_id + 2,
+        ]
+        assert result.counts[2].sum() == 0
+        assert result.counts[:, [0, -2, -1]].sum() == 0
+        pd.testing.assert_frame_equal(
+            result.to_totals().loc[random_totals.index],
+            random_totals,
+            check_names=False,
+        )
+
+    def test_no_totals_but_other_pixels_and_days(self, random_totals, good_pixel_id):
+        """Only `Order`s outside the operating hours yield a cube of `0`s."""
+        result = cube_mod.DemandCube.from_totals(
+            random_totals.iloc[:0],
+            time_step=test_config.LONG_TIME_STEP,
+            pixel_ids=[good_pixel_id],
+            first_day=test_config.START.date(),
+            last_day=test_config.START.date(),
+        )
+
+        assert result.counts.shape == (1, 1, 12)
+        assert result.counts.sum() == 0
+        assert result.first_day == test_config.START.date()
+
+    def test_start_at_outside_operating_hours(self, random_totals, good_pixel_id):
+        """A "start_at" must lie within the operating hours."""
+        late = dt.datetime(
+            test_config.YEAR, test_config.MONTH, test_config.DAY, config.SERVICE_END,
+        )
+        index = pd.MultiIndex.from_tuples(
+            [(good_pixel_id, late)], names=['pixel_id', 'start_at'],
+        )
+        totals = pd.DataFrame(data={'n_orders': [1]}, index=index)
+
+        with pytest.raises(ValueError, match='operating hours'):
+            cube_mod.DemandCube.from_totals(
+                totals, time_step=test_config.LONG_TIME_STEP,
+            )
+
+
+class TestLookups:
+    """Test the mappings into the `.counts`."""
+
+    def test_row(self, cube, good_pixel_id):
+        """The rows are sorted by "pixel_id"."""
+        assert cube.row(good_pixel_id) == 0
+        assert cube.row(good_pixel_id + 1) == 1
+
+    def test_row_of_non_existing_pixel(self, cube):
+        """A `pixel_id` that is not in the `grid`."""
+        with pytest.raises(LookupError, match='`pixel_id` is not in the `grid`'):
+            cube.row(-1)
+
+    def test_column(self, cube):
+        """The columns are consecutive days."""
+        assert cube.column(test_config.START.date()) == 0
+        assert cube.column(test_config.END.date()) == cube.n_days - 1
+
+    def test_position(self, cube):
+        """A position counts the time steps in a flattened row."""
+        noon_on_second_day = test_config.START + dt.timedelta(days=1, hours=1)
+
+        result = cube.position(noon_on_second_day)
+
+        assert result == 12 + 1
+
+    @pytest.mark.parametrize('hour', [config.SERVICE_START - 1, config.SERVICE_END])
+    def test_position_outside_operating_hours(self, cube, hour):
+        """A "start_at" outside the operating hours has no position."""
+        start_at = dt.datetime(
+            test_config.YEAR, test_config.MONTH, test_config.DAY, hour,
+        )
+
+        with pytest.raises(LookupError, match='not a time step'):
+            cube.position(start_at)
+
+    def test_position_not_at_a_time_step(self, cube):
+        """A "start_at" must mark the beginning of a time step."""
+        start_at = dt.datetime(
+            test_config.YEAR, test_config.MONTH, test_config.DAY, test_config.NOON, 30,
+        )
+
+        with pytest.raises(LookupError, match='not a time step'):
+            cube.position(start_at)
+
+    def test_positions_same_as_position(self, cube):
+        """`DemandCube.positions()` is the vectorized `DemandCube.position()`."""
+        start_ats = [
+            test_config.START,
+            test_config.START + dt.timedelta(days=3, hours=5),
+            test_config.END - dt.timedelta(hours=1),
+        ]
+
+        result = cube.positions(start_ats)
+
+        assert list(result) == [cube.position(start_at) for start_at in start_ats]
+
+    @pytest.mark.parametrize('minute', [0, 30])
+    def test_positions_outside_operating_hours(self, cube, minute):
+        """The "start_at"s must be time steps in operating hours."""
+        start_ats = [test_config.START, test_config.END.replace(minute=minute)]
+
+        with pytest.raises(LookupError, match='not a time step'):
+            cube.positions(start_ats)
+
+    def test_start_ats_are_inverse_of_position(self, cube, random_totals):
+        """`.start_ats()` maps positions back to "start_at"s."""
+        start_ats = random_totals.loc[random_totals.index[0][0]].index
+        positions = [cube.position(start_at) for start_at in start_ats]
+
+        result = cube.start_ats(np.array(positions))
+
+        assert (result == start_ats).all()
+
+
+class TestSliceTimeSeries:
+    """Test the `DemandCube.slice_ts()` method.
+
+    The results must be the same as with label-based slicing on the order totals.
+    """
+
+    @pytest.mark.parametrize(
+        ['first_day', 'last_day', 'step'],
+        [
+            (0, 56, 1),  # entire order history
+            (3, 10, 1),  # in the middle
+            (-5, 10, 1),  # begins before the order history
+            (50, 60, 1),  # ends after the order history
+            (3, 10, 12),  # like a horizontal time series
+            (-5, 10, 12),  # like a horizontal time series beginning too early
+            (57, 60, 1),  # entirely after the order history
+            (-10, -3, 1),  # entirely before the order history
+            (-10, -3, 12),  # like a horizontal time series entirely too early
+        ],
+    )
+    def test_same_as_label_based_slicing(  # noqa:WPS211
+        self, cube, random_totals, good_pixel_id, first_day, last_day, step,
+    ):
+        """Compare to slicing with `pd.DataFrame.loc[]`."""
+        first_start_at = test_config.START + dt.timedelta(days=first_day, hours=1)
+        last_start_at = test_config.START + dt.timedelta(days=last_day, hours=1)
+
+        result = cube.slice_ts(
+            cube.row(good_pixel_id), first_start_at, last_start_at, step,
+        )
+
+        expected = random_totals.loc[good_pixel_id, 'n_orders'].loc[
+            first_start_at:last_start_at:step
+        ]
+        pd.testing.assert_series_equal(result, expected, check_freq=False)
+
+    def test_slice_is_a_view(self, cube, good_pixel_id):
+        """The values of a time series are not copied."""
+        last_start_at = test_config.END - dt.timedelta(hours=1)
+
+        result = cube.slice_ts(
+            cube.row(good_pixel_id), test_config.START, last_start_at,
+        )
+
+        assert np.shares_memory(result.values, cube.counts)
+
+
+class TestCoarsen:
+    """Test the `DemandCube.coarsen()` method."""
+
+    @pytest.fixture
+    def fine_cube(self, good_pixel_id):
+        """A `DemandCube` with random order totals per quarter of an hour."""
+        rng = np.random.default_rng(42)
+
+        return cube_mod.DemandCube(
+            counts=rng.integers(0, 10, size=(2, 3, 48)),
+            pixel_ids=np.array([good_pixel_id, good_pixel_id + 1]),
+            first_day=test_config.START.date(),
+            time_step=15,
+        )
+
+    @pytest.mark.parametrize('time_step', [15, 30, 60, 120])
+    def test_same_as_aggregating_with_pandas(self, fine_cube, time_step):
+        """Coarsening is the same as aggregating the "start_at"s anew."""
+        result = fine_cube.coarsen(time_step)
+
+        totals = fine_cube.to_totals().reset_index()
+        # Time steps are counted from the start of the operating hours.
+        since_start = (
+            totals['start_at']
+            - totals['start_at'].dt.normalize()
+            - pd.Timedelta(hours=config.SERVICE_START)
+        )
+        totals['start_at'] -= since_start % pd.Timedelta(minutes=time_step)
+        expected = totals.groupby(['pixel_id', 'start_at']).sum()
+        pd.testing.assert_frame_equal(result.to_totals(), expected)
+        assert result.time_step == time_step
+
+    def test_no_totals(self, random_totals):
+        """Edge case that does not occur for real-life data."""
+        cube = cube_mod.DemandCube.from_totals(
+            random_totals.iloc[:0], time_step=test_config.SHORT_TIME_STEP,
+        )
+
+        result = cube.coarsen(test_config.LONG_TIME_STEP)
+
+        assert result.counts.shape == (0, 0, 12)
+
+    def test_not_a_multiple(self, fine_cube):
+        """A `time_step` cannot be split up."""
+        with pytest.raises(ValueError, match='multiple of the current one'):
+            fine_cube.coarsen(20)
+
+    def test_not_dividing_the_operating_hours(self, fine_cube):
+        """The last time step of a day must not be cut off."""
+        with pytest.raises(ValueError, match='divide the operating hours'):
+            fine_cube.coarsen(105)
+
+
+class TestProject:
+    """Test the `DemandCube.project()` method."""
+
+    def test_rows_are_summed_up(self, cube, good_pixel_id):
+        """Both rows are summed up into one."""
+        result = cube.project({good_pixel_id: 42, good_pixel_id + 1: 42})
+
+        assert list(result.pixel_ids) == [42]
+        np.testing.assert_array_equal(result.counts[0], cube.counts.sum(axis=0))
+        assert result.first_day == cube.first_day
+        assert result.time_step == cube.time_step
+
+    def test_rows_are_sorted_by_new_pixel_id(self, cube, good_pixel_id):
+        """The rows may also be swapped."""
+        result = cube.project({good_pixel_id: 2, good_pixel_id + 1: 1})
+
+        assert list(result.pixel_ids) == [1, 2]
+        np.testing.assert_array_equal(result.counts, cube.counts[::-1])
+
+    def test_unmapped_rows_are_dropped(self, cube, good_pixel_id):
+        """Only the first row is kept."""
+        result = cube.project({good_pixel_id: 1})
+
+        assert list(result.pixel_ids) == [1]
+        np.testing.assert_array_equal(result.counts, cube.counts[:1])
+
+    def test_no_mapping(self, cube):
+        """Edge case that does not occur for real-life data."""
+        result = cube.project({})
+
+        assert result.counts.shape == (0, cube.n_days, 12)
+
+
+class TestPersistence:
+    """Test saving a `DemandCube` to and loading it from disk."""
+
+    @pytest.mark.parametrize('mmap', [True, False])
+    def test_round_trip(self, cube, tmp_path, mmap):
+        """Loading a saved `DemandCube` yields the same data."""
+        path = str(tmp_path / 'cube')
+        cube.save(path)
+
+        result = cube_mod.DemandCube.load(path, mmap=mmap)
+
+        np.testing.assert_array_equal(result.counts, cube.counts)
+        np.testing.assert_array_equal(result.pixel_ids, cube.pixel_ids)
+        assert result.first_day == cube.first_day
+        assert result.time_step == cube.time_step
+
+    def test_counts_are_memory_mapped(self, cube, tmp_path):
+        """The `.counts` are not read into memory."""
+        path = str(tmp_path / 'cube')
+        cube.save(path)
+
+        result = cube_mod.DemandCube.load(path)
+
+        assert isinstance(result.counts.base, np.memmap)
+        assert not result.counts.flags.writeable
+
+    def test_no_totals(self, random_totals, tmp_path):
+        """Edge case that does not occur for real-life data."""
+        cube = cube_mod.DemandCube.from_totals(
+            random_totals.iloc[:0], time_step=test_config.LONG_TIME_STEP,
+        )
+        path = str(tmp_path / 'cube')
+        cube.save(path)
+
+        result = cube_mod.DemandCube.load(path)
+
+        assert result.counts.shape == (0, 0, 12)
+        assert result.first_day is None
+
+    def test_existing_path_is_not_overwritten(self, cube, tmp_path):
+        """Another process may have saved the same `DemandCube` already."""
+        path = str(tmp_path / 'cube')
+        cube.save(path)
+        cube.save(path)
+
+        assert sorted(os.listdir(tmp_path)) == ['cube']
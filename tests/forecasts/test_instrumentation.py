@@ -0,0 +1,172 @@
+"""Tests for the `urban_meal_delivery.forecasts.instrumentation` module."""
+
+import json
+
+import pytest
+
+from urban_meal_delivery.forecasts import instrumentation
+
+
+@pytest.fixture
+def metrics():
+    """Empty `Metrics`."""
+    return instrumentation.Metrics()
+
+
+class TestMetrics:
+    """Test the `Metrics` class."""
+
+    def test_nothing_recorded(self, metrics):
+        """New `Metrics` are empty."""
+        result = metrics.to_dict()
+
+        assert result == {'timers': {}, 'counters': {}}
+
+    def test_timer(self, metrics):
+        """A timer sums up the time spent in `with` blocks."""
+        for _ in range(3):
+            with metrics.timer('fit'):
+                pass  # noqa:WPS420
+
+        result = metrics.to_dict()['timers']['fit']
+
+        assert result['calls'] == 3
+        assert result['seconds'] >= 0
+
+    def test_timer_with_error(self, metrics):
+        """The time is also measured if an error occurs."""
+        with pytest.raises(RuntimeError):
+            with metrics.timer('fit'):
+                raise RuntimeError('some error')
+
+        result = metrics.to_dict()['timers']['fit']
+
+        assert result['calls'] == 1
+
+    def test_count(self, metrics):
+        """Counters are incremented."""
+        metrics.count('fits')
+        metrics.count('rows_written', 12)
+        metrics.count('rows_written', 12)
+
+        result = metrics.to_dict()['counters']
+
+        assert result == {'fits': 1, 'rows_written': 24}
+
+    def test_counter(self, metrics):
+        """A counter's value may be looked up, even if never incremented."""
+        metrics.count('fits', 2)
+
+        assert metrics.counter('fits') == 2
+        assert metrics.counter('memo_hits') == 0
+
+    def test_merge(self, metrics):
+        """The `Metrics` of other processes are added up."""
+        metrics.count('fits')
+        with metrics.timer('fit'):
+            pass  # noqa:WPS420
+        other = instrumentation.Metrics()
+        other.count('fits', 2)
+        other.count('cache_hits')
+        with other.timer('fit'):
+            pass  # noqa:WPS420
+
+        metrics.merge(other.to_dict())
+
+        result = metrics.to_dict()
+        assert result['counters'] == {'cache_hits': 1, 'fits': 3}
+        assert result['timers']['fit']['calls'] == 2
+
+    def test_reset(self, metrics):
+        """`.reset()` forgets everything recorded."""
+        metrics.count('fits')
+        with metrics.timer('fit'):
+            pass  # noqa:WPS420
+
+        metrics.reset()
+
+        assert metrics.to_dict() == {'timers': {}, 'counters': {}}
+
+
+def test_timed(mocker):
+    """A function decorated with `timed()` is measured with `metrics`."""
+    metrics = mocker.patch.object(
+        instrumentation, 'metrics', instrumentation.Metrics(),
+    )
+
+    @instrumentation.timed('slice')
+    def func(arg):
+        """Some function."""
+        return arg
+
+    result = func(42)
+
+    assert result == 42
+    assert func.__doc__ == 'Some function.'
+    assert metrics.to_dict()['timers']['slice']['calls'] == 1
+
+
+class TestProgress:
+    """Test the `Progress` class."""
+
+    @pytest.fixture
+    def clock(self, mocker):
+        """A fake `time.monotonic()` starting at `0`."""
+        return mocker.patch.object(
+            instrumentation.time, 'monotonic', return_value=0,
+        )
+
+    def test_first_update_is_reported(self, clock, capsys):
+        """The progress is reported right away."""
+        progress = instrumentation.Progress(n_total=100, interval=10)
+        clock.return_value = 5
+
+        progress.update(10)
+
+        assert capsys.readouterr().out == (
+            'Progress: 10/100 forecasts (2.0/s), ETA 0:00:45\n'
+        )
+
+    def test_updates_are_reported_periodically(self, clock, capsys):
+        """Updates within the `interval` are not reported."""
+        progress = instrumentation.Progress(n_total=100, interval=10)
+        for second in (1, 2, 3, 12):
+            clock.return_value = second
+            progress.update(1)
+
+        lines = capsys.readouterr().out.splitlines()
+
+        assert len(lines) == 2
+        assert lines[-1].startswith('Progress: 4/100 forecasts')
+
+    def test_last_update_is_reported(self, clock, capsys):
+        """When everything is done, the progress is always reported."""
+        progress = instrumentation.Progress(n_total=2, interval=10)
+        for second in (1, 2):
+            clock.return_value = second
+            progress.update(1)
+
+        lines = capsys.readouterr().out.splitlines()
+
+        assert lines[-1] == 'Progress: 2/2 forecasts (1.0/s), ETA 0:00:00'
+
+    def test_no_eta_without_progress(self, clock):
+        """Without any throughput, the ETA is unknown."""
+        progress = instrumentation.Progress(n_total=2)
+
+        result = progress.line()
+
+        assert result.endswith('ETA ?')
+
+
+def test_write_report(metrics, tmp_path):
+    """The `Metrics` of a run are written into a JSON file."""
+    metrics.count('fits', 3)
+    path = tmp_path / 'report.json'
+
+    instrumentation.write_report(str(path), metrics, city='Paris')
+
+    with open(path) as file:
+        result = json.load(file)
+
+    assert result == {'city': 'Paris', 'timers': {}, 'counters': {'fits': 3}}
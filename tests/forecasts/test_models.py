@@ -1,12 +1,19 @@
 """Tests for the `urban_meal_delivery.forecasts.models` sub-package."""
 
+import datetime as dt
 
 import pandas as pd
 import pytest
+from psycopg2 import extras
+from sqlalchemy.dialects import postgresql
 
 from tests import config as test_config
+from urban_meal_delivery import config
 from urban_meal_delivery import db
+from urban_meal_delivery.forecasts import instrumentation
+from urban_meal_delivery.forecasts import methods
 from urban_meal_delivery.forecasts import models
+from urban_meal_delivery.forecasts.models.tactical import orders
 
 
 MODELS = (
@@ -123,6 +130,33 @@ class TestGenericForecastingModelProperties:
         assert not result['actual'].isnull().any()
         assert not result['prediction'].isnull().any()
 
+    @pytest.mark.r
+    def test_predict_day(self, model_cls, order_history, pixel, predict_at):
+        """`*Model.predict_day()` makes the same predictions ...
+
+        ... as `*Model.predict()` for every time step on a day.
+        """  # noqa:RST215
+        model = model_cls(order_history=order_history)
+
+        result = model.predict_day(
+            pixel=pixel,
+            predict_day=predict_at.date(),
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        expected = pd.concat(
+            model.predict(
+                pixel=pixel,
+                predict_at=start_at.to_pydatetime(),
+                train_horizon=test_config.LONG_TRAIN_HORIZON,
+            ).loc[[start_at]]
+            for start_at in result.index
+        )
+        assert len(result) == 12  # = time steps per day
+        pd.testing.assert_frame_equal(
+            result, expected, check_dtype=False, check_freq=False, check_names=False,
+        )
+
     @pytest.mark.db
     @pytest.mark.r
     def test_make_forecast(  # noqa:WPS211
@@ -170,3 +204,747 @@ class TestGenericForecastingModelProperties:
         assert n_cached_forecasts == db_session.query(db.Forecast).count()
 
         assert result1 == result2
+
+
+class TestPredictDay:
+    """Test the `*Model.predict_day()` methods without R."""
+
+    @pytest.fixture
+    def predict_day(self, predict_at):
+        """The day of `predict_at`."""
+        return predict_at.date()
+
+    def predict_steps(self, model, pixel, start_ats):
+        """Call `*Model.predict()` for all `start_ats` one after another."""
+        return pd.concat(
+            model.predict(
+                pixel=pixel,
+                predict_at=start_at.to_pydatetime(),
+                train_horizon=test_config.LONG_TRAIN_HORIZON,
+            )
+            for start_at in start_ats
+        )
+
+    @pytest.mark.parametrize(
+        'model_cls', [models.HorizontalSMAModel, models.TrivialModel],
+    )
+    def test_vectorized_models(
+        self, model_cls, order_history, pixel, predict_day,
+    ):
+        """The predictions are the same as with `*Model.predict()`."""
+        model = model_cls(order_history=order_history)
+
+        result = model.predict_day(
+            pixel=pixel,
+            predict_day=predict_day,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        expected = self.predict_steps(model, pixel, result.index)
+        assert len(result) == 12  # = time steps per day
+        assert (result.index.date == predict_day).all()
+        pd.testing.assert_frame_equal(
+            result, expected, check_dtype=False, check_freq=False, check_names=False,
+        )
+
+    def test_horizontal_ets_model(
+        self, order_history, pixel, predict_day, monkeypatch,
+    ):
+        """The ETS models are fitted as with `*Model.predict()`."""
+        monkeypatch.setattr(config, 'ETS_BACKEND', 'python')
+        model = models.HorizontalETSModel(order_history=order_history)
+
+        result = model.predict_day(
+            pixel=pixel,
+            predict_day=predict_day,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        expected = self.predict_steps(model, pixel, result.index)
+        assert len(result) == 12  # = time steps per day
+        pd.testing.assert_frame_equal(
+            result, expected, check_dtype=False, check_freq=False, check_names=False,
+        )
+
+    def test_default_for_one_step_models(
+        self, order_history, pixel, predict_day, mocker,
+    ):
+        """By default, `*Model.predict()` is called for every time step."""
+        model = models.RealtimeARIMAModel(order_history=order_history)
+        mocker.patch.object(
+            model,
+            'predict',
+            side_effect=lambda pixel, predict_at, train_horizon: pd.DataFrame(
+                data={'actual': 1, 'prediction': 1.0}, index=[predict_at],
+            ),
+        )
+
+        result = model.predict_day(
+            pixel=pixel,
+            predict_day=predict_day,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert len(result) == 12  # = time steps per day
+        assert model.predict.call_count == 12
+
+    def test_default_for_whole_day_models(
+        self, order_history, pixel, predict_day, vertical_datetime_index, mocker,
+    ):
+        """By default, time steps already predicted are skipped."""
+        model = models.VerticalARIMAModel(order_history=order_history)
+        day_index = vertical_datetime_index[
+            vertical_datetime_index.date == predict_day
+        ]
+        mocker.patch.object(
+            model,
+            'predict',
+            return_value=pd.DataFrame(
+                data={'actual': 1, 'prediction': 1.0}, index=day_index,
+            ),
+        )
+
+        result = model.predict_day(
+            pixel=pixel,
+            predict_day=predict_day,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert len(result) == 12  # = time steps per day
+        model.predict.assert_called_once()
+
+
+class TestRunMethod:
+    """Test the `ForecastingModelABC._run_method()` method."""
+
+    def test_run_in_current_process(self, order_history, mocker):
+        """The method is called in the current process."""
+        model = models.TrivialModel(order_history=order_history)
+        method = mocker.Mock(return_value=42)
+
+        result = model._run_method(method, a=1)
+
+        assert result == 42
+        method.assert_called_once_with(a=1)
+
+    def test_fits_are_instrumented(self, order_history, mocker):
+        """The time spent in the method is measured."""
+        mocker.patch.object(instrumentation, 'metrics', instrumentation.Metrics())
+        model = models.TrivialModel(order_history=order_history)
+
+        model._run_method(mocker.Mock(), a=1)
+
+        result = instrumentation.metrics.to_dict()
+        assert result['counters'] == {'fits': 1}
+        assert result['timers']['fit']['calls'] == 1
+
+    def test_memo_hits_are_not_fits(self, order_history, mocker):
+        """A result re-used by `methods.memoize` is not counted as a fit."""
+        mocker.patch.object(instrumentation, 'metrics', instrumentation.Metrics())
+        model = models.TrivialModel(order_history=order_history)
+
+        def method(**_kwargs):
+            instrumentation.metrics.count('memo_hits')
+
+        model._run_method(method, a=1)
+
+        result = instrumentation.metrics.to_dict()
+        assert result['counters'] == {'memo_hits': 1}
+        assert result['timers']['fit']['calls'] == 1
+
+
+class TestReuseARIMAOrders:
+    """Test the `orders.predict()` function.
+
+    Instead of R, a fake `run_method` returns predictions with made-up
+    `.attrs` such that the logic of re-using the orders can be tested.
+    """
+
+    key = ('varima', 1, 60, 8)
+    day = dt.date(2016, 7, 1)
+
+    @pytest.fixture(autouse=True)
+    def reuse_orders(self, monkeypatch):
+        """Re-use chosen orders for three days."""
+        monkeypatch.setattr(config, 'ARIMA_ORDER_DAYS', 3)
+        monkeypatch.setattr(config, 'ARIMA_ORDER_TOLERANCE', 0.1)
+        orders.clear()
+
+        yield
+
+        orders.clear()
+
+    @pytest.fixture
+    def run_method(self, mocker):
+        """Fake `run_method` choosing the (1, 0, 1) order with `sigma2=1.0`.
+
+        The chosen model has a mean but no drift term.
+        """
+
+        def fake_run_method(  # noqa:WPS430
+            method, *, order=None, include_mean=True, include_drift=False, **kwargs,
+        ):
+            predictions = pd.DataFrame({'prediction': [0.0]})
+            predictions.attrs['order'] = order or (1, 0, 1)
+            predictions.attrs['include_mean'] = include_mean
+            predictions.attrs['include_drift'] = include_drift
+            predictions.attrs['sigma2'] = 1.0
+
+            return predictions
+
+        return mocker.Mock(side_effect=fake_run_method)
+
+    def predict(self, run_method, day_offset=0):
+        """Shortcut to predict `day_offset` days after the first `day`."""
+        return orders.predict(
+            run_method,
+            key=self.key,
+            day=self.day + dt.timedelta(days=day_offset),
+            training_ts='training_ts',
+        )
+
+    def test_choose_order_on_first_day(self, run_method):
+        """Without a previous fit, R chooses the order."""
+        self.predict(run_method)
+
+        run_method.assert_called_once_with(
+            methods.arima.predict, training_ts='training_ts',
+        )
+
+    def test_reuse_order_on_following_days(self, run_method):
+        """On the following days, the order is re-used."""
+        for day_offset in range(3):
+            self.predict(run_method, day_offset)
+
+        assert run_method.call_count == 3
+        run_method.assert_called_with(
+            methods.arima.predict,
+            order=(1, 0, 1),
+            include_mean=True,
+            include_drift=False,
+            training_ts='training_ts',
+        )
+
+    def test_choose_order_again_after_some_days(self, run_method):
+        """After `ARIMA_ORDER_DAYS` days, R chooses the order anew."""
+        self.predict(run_method)
+        self.predict(run_method, day_offset=3)
+
+        run_method.assert_called_with(
+            methods.arima.predict, training_ts='training_ts',
+        )
+
+    def test_choose_order_again_for_past_days(self, run_method):
+        """The order is not re-used for days before the one it was chosen on."""
+        self.predict(run_method, day_offset=1)
+        self.predict(run_method)
+
+        run_method.assert_called_with(
+            methods.arima.predict, training_ts='training_ts',
+        )
+
+    def test_choose_order_again_if_fit_degrades(self, run_method):
+        """If the residuals' variance grows too much, R chooses the order anew."""
+        self.predict(run_method)
+
+        worse_predictions = pd.DataFrame({'prediction': [0.0]})
+        worse_predictions.attrs.update(
+            order=(1, 0, 1), include_mean=True, include_drift=False, sigma2=1.2,
+        )
+        run_method.side_effect = None
+        run_method.return_value = worse_predictions
+
+        self.predict(run_method, day_offset=1)
+
+        assert run_method.call_count == 3
+        run_method.assert_called_with(
+            methods.arima.predict, training_ts='training_ts',
+        )
+
+    def test_order_changed_by_r(self, run_method):
+        """If the old order cannot be fitted, R chooses another one.
+
+        That order is then re-used.
+        """
+        self.predict(run_method)
+
+        other_predictions = pd.DataFrame({'prediction': [0.0]})
+        other_predictions.attrs.update(
+            order=(2, 1, 0), include_mean=False, include_drift=False, sigma2=5.0,
+        )
+        run_method.side_effect = None
+        run_method.return_value = other_predictions
+
+        self.predict(run_method, day_offset=1)
+        self.predict(run_method, day_offset=2)
+
+        assert run_method.call_count == 3
+        run_method.assert_called_with(
+            methods.arima.predict,
+            order=(2, 1, 0),
+            include_mean=False,
+            include_drift=False,
+            training_ts='training_ts',
+        )
+
+    def test_reuse_drift(self, run_method):
+        """If R chooses a model with drift, the drift is re-used as well."""
+        drift_predictions = pd.DataFrame({'prediction': [0.0]})
+        drift_predictions.attrs.update(
+            order=(0, 1, 1), include_mean=False, include_drift=True, sigma2=1.0,
+        )
+        run_method.side_effect = None
+        run_method.return_value = drift_predictions
+
+        self.predict(run_method)
+        self.predict(run_method, day_offset=1)
+
+        assert run_method.call_count == 2
+        run_method.assert_called_with(
+            methods.arima.predict,
+            order=(0, 1, 1),
+            include_mean=False,
+            include_drift=True,
+            training_ts='training_ts',
+        )
+
+    def test_disabled(self, run_method, monkeypatch):
+        """With `ARIMA_ORDER_DAYS=0`, R chooses the order every time."""
+        monkeypatch.setattr(config, 'ARIMA_ORDER_DAYS', 0)
+
+        for day_offset in range(2):
+            self.predict(run_method, day_offset)
+
+        run_method.assert_called_with(
+            methods.arima.predict, training_ts='training_ts',
+        )
+
+
+class TestForecastCache:
+    """Test the `ForecastCache` class."""
+
+    @pytest.fixture
+    def forecast(self, pixel, predict_at):
+        """A `Forecast` made in the `pixel` at `predict_at`."""
+        return db.Forecast(
+            pixel=pixel,
+            start_at=predict_at,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model='trivial',
+            actual=12,
+            prediction=12.3,
+            low80=None,
+            high80=None,
+            low95=None,
+            high95=None,
+        )
+
+    @pytest.fixture(autouse=True)
+    def metrics(self, mocker):
+        """Fresh `instrumentation.metrics` for each test case."""
+        return mocker.patch.object(
+            instrumentation, 'metrics', instrumentation.Metrics(),
+        )
+
+    @pytest.fixture
+    def forecast_cache(self, forecast, predict_at, mocker):
+        """A `ForecastCache` with the `forecast` prefetched for its day.
+
+        The database is replaced by a mock returning the `forecast`.
+        """
+        session = mocker.patch.object(db, 'session')
+        query = session.query.return_value.filter.return_value.filter.return_value
+        query.filter.return_value.all.return_value = [forecast]
+
+        forecast_cache = models.ForecastCache()
+        forecast_cache.prefetch(
+            forecast.pixel, first_day=predict_at.date(), last_day=predict_at.date(),
+        )
+
+        return forecast_cache
+
+    def test_prefetch(self, forecast_cache):
+        """The prefetched `Forecast`s are in the cache."""
+        assert len(forecast_cache) == 1
+
+    def test_covers_prefetched_days(self, forecast_cache, pixel, predict_at):
+        """Only the days prefetched for a `Pixel` are covered."""
+        one_day = dt.timedelta(days=1)
+
+        assert forecast_cache.covers(pixel, predict_at.date())
+        assert not forecast_cache.covers(pixel, predict_at.date() + one_day)
+        assert not forecast_cache.covers(pixel, predict_at.date() - one_day)
+
+    def test_get_forecast(self, forecast_cache, forecast, pixel, predict_at):
+        """A `Forecast` is looked up by the values of the unique constraint."""
+        result = forecast_cache.get(
+            pixel=pixel,
+            start_at=predict_at,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model='trivial',
+        )
+
+        assert result is forecast
+
+    def test_get_missing_forecast(self, forecast_cache, pixel, predict_at):
+        """A `Forecast` for another `*Model` is not in the cache."""
+        result = forecast_cache.get(
+            pixel=pixel,
+            start_at=predict_at,
+            time_step=test_config.LONG_TIME_STEP,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            model='hets',
+        )
+
+        assert result is None
+
+    def test_add_forecasts(self, forecast, pixel, predict_at):
+        """`Forecast`s may be added to the cache, e.g., after being made."""
+        forecast_cache = models.ForecastCache()
+
+        forecast_cache.add([forecast])
+
+        assert len(forecast_cache) == 1
+        assert not forecast_cache.covers(pixel, predict_at.date())
+
+    def test_make_forecast_from_cache(
+        self, forecast_cache, forecast, order_history, pixel, predict_at,
+    ):
+        """`*Model.make_forecast()` returns a prefetched `Forecast` ...
+
+        ... without querying the database again.
+        """
+        model = models.TrivialModel(
+            order_history=order_history, forecast_cache=forecast_cache,
+        )
+        db.session.reset_mock()
+
+        result = model.make_forecast(
+            pixel=pixel,
+            predict_at=predict_at,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert result is forecast
+        db.session.query.assert_not_called()
+        assert instrumentation.metrics.to_dict()['counters']['cache_hits'] == 1
+
+    def test_make_forecast_not_in_cache(
+        self, forecast_cache, order_history, pixel, predict_at,
+    ):
+        """`*Model.make_forecast()` makes a `Forecast` not prefetched ...
+
+        ... without querying the database and puts it into the cache.
+        """
+        model = models.TrivialModel(
+            order_history=order_history, forecast_cache=forecast_cache,
+        )
+        db.session.reset_mock()
+        predict_at += dt.timedelta(hours=1)
+
+        result = model.make_forecast(
+            pixel=pixel,
+            predict_at=predict_at,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert result.start_at == predict_at
+        db.session.query.assert_not_called()
+        db.session.commit.assert_called_once()
+        assert len(forecast_cache) == 2
+
+    def test_make_day_forecasts_with_one_fit(
+        self, forecast_cache, forecast, order_history, pixel, predict_at, mocker,
+    ):
+        """`*Model.make_day_forecasts()` makes the `Forecast`s not prefetched ...
+
+        ... with one call to `*Model.predict_day()` and puts them into the cache.
+        """
+        model = models.TrivialModel(
+            order_history=order_history, forecast_cache=forecast_cache,
+        )
+        predict_day = mocker.spy(model, 'predict_day')
+        db.session.reset_mock()
+
+        result = model.make_day_forecasts(
+            pixel=pixel,
+            predict_day=predict_at.date(),
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert len(result) == 12  # = time steps per day
+        assert [forecast.start_at for forecast in result] == sorted(
+            forecast.start_at for forecast in result
+        )
+        assert forecast in result
+        predict_day.assert_called_once()
+        db.session.query.assert_not_called()
+        db.session.commit.assert_called_once()
+        assert len(forecast_cache) == 12
+        counters = instrumentation.metrics.to_dict()['counters']
+        assert counters['cache_hits'] == 1
+        assert counters['cache_misses'] == 11
+        assert counters['rows_written'] == 11
+
+    def test_make_day_forecasts_from_cache(
+        self, forecast_cache, order_history, pixel, predict_at, mocker,
+    ):
+        """`*Model.make_day_forecasts()` does not predict a day made before."""
+        model = models.TrivialModel(
+            order_history=order_history, forecast_cache=forecast_cache,
+        )
+        model.make_day_forecasts(
+            pixel=pixel,
+            predict_day=predict_at.date(),
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+        predict_day = mocker.spy(model, 'predict_day')
+
+        result = model.make_day_forecasts(
+            pixel=pixel,
+            predict_day=predict_at.date(),
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert len(result) == 12  # = time steps per day
+        predict_day.assert_not_called()
+
+    @pytest.mark.db
+    def test_prefetch_from_database(  # noqa:WPS211
+        self, db_session, order_history, pixel, predict_at,
+    ):
+        """`Forecast`s made before are prefetched for a `Grid`."""
+        model = models.TrivialModel(order_history=order_history)
+        model.make_forecast(
+            pixel=pixel,
+            predict_at=predict_at,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+        forecast_cache = models.ForecastCache()
+
+        result = forecast_cache.prefetch(
+            pixel.grid, first_day=predict_at.date(), last_day=predict_at.date(),
+        )
+
+        assert result == 1
+        assert forecast_cache.covers(pixel, predict_at.date())
+
+
+class TestForecastWriter:
+    """Test the `ForecastWriter` class."""
+
+    @pytest.fixture
+    def row(self, pixel, predict_at):
+        """A `Forecast` made in the `pixel` at `predict_at` as a row."""
+        return {
+            'pixel_id': pixel.id,
+            'start_at': predict_at,
+            'time_step': test_config.LONG_TIME_STEP,
+            'train_horizon': test_config.LONG_TRAIN_HORIZON,
+            'model': 'trivial',
+            'actual': 12,
+            'prediction': 12.3,
+            'low80': None,
+            'high80': None,
+            'low95': None,
+            'high95': None,
+        }
+
+    @pytest.fixture
+    def session(self, mocker):
+        """The database is replaced by a mock."""
+        return mocker.patch.object(db, 'session')
+
+    def test_invalid_batch_size(self):
+        """The `batch_size` must be positive."""
+        with pytest.raises(ValueError, match='positive'):
+            models.ForecastWriter(batch_size=0)
+
+    def test_default_batch_size(self, row, session, monkeypatch):
+        """The `batch_size` defaults to `config.FORECAST_BATCH_SIZE`."""
+        monkeypatch.setattr(config, 'FORECAST_BATCH_SIZE', 2)
+        forecast_writer = models.ForecastWriter()
+
+        forecast_writer.add([row, row])
+
+        assert len(forecast_writer) == 0
+
+    def test_buffer_rows(self, row, session):
+        """Rows are buffered until a batch is full."""
+        forecast_writer = models.ForecastWriter(batch_size=2)
+
+        forecast_writer.add([row])
+
+        assert len(forecast_writer) == 1
+        session.execute.assert_not_called()
+
+    def test_write_full_batch(self, row, session):
+        """A full batch is written in one transaction."""
+        forecast_writer = models.ForecastWriter(batch_size=2)
+
+        forecast_writer.add([row, row])
+
+        assert len(forecast_writer) == 0
+        assert forecast_writer.n_written == 2
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+
+    def test_persisting_is_instrumented(self, row, session, mocker):
+        """The time spent on inserting rows is measured."""
+        mocker.patch.object(instrumentation, 'metrics', instrumentation.Metrics())
+        forecast_writer = models.ForecastWriter(batch_size=2)
+
+        forecast_writer.add([row, row])
+
+        result = instrumentation.metrics.to_dict()
+        assert result['counters'] == {'rows_written': 2}
+        assert result['timers']['persist']['calls'] == 1
+
+    def test_insert_skips_existing_rows(self, row, session):
+        """`Forecast`s already in the database are not inserted again."""
+        forecast_writer = models.ForecastWriter(batch_size=1)
+
+        forecast_writer.add([row])
+
+        statement, rows = session.execute.call_args.args
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert 'ON CONFLICT (pixel_id, start_at, time_step' in sql
+        assert 'DO NOTHING' in sql
+        assert rows == [row]
+
+    def test_rollback_after_a_failed_insert(self, row, session):
+        """A failed batch is rolled back and kept for the next `.flush()`."""
+        forecast_writer = models.ForecastWriter(batch_size=2)
+        forecast_writer.add([row])
+        session.execute.side_effect = RuntimeError('connection lost')
+
+        with pytest.raises(RuntimeError, match='connection lost'):
+            forecast_writer.flush()
+
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
+        assert len(forecast_writer) == 1
+        assert forecast_writer.n_written == 0
+
+        session.execute.side_effect = None
+        result = forecast_writer.flush()
+
+        assert result == 1
+        assert len(forecast_writer) == 0
+        assert session.execute.call_args.args[1] == [row]
+
+    def test_flush_empty_buffer(self, session):
+        """Without buffered rows, nothing is written."""
+        forecast_writer = models.ForecastWriter()
+
+        result = forecast_writer.flush()
+
+        assert result == 0
+        session.execute.assert_not_called()
+
+    def test_flush_at_the_end_of_with_block(self, row, session):
+        """The remaining rows are written when the writer is closed."""
+        with models.ForecastWriter(batch_size=2) as forecast_writer:
+            forecast_writer.add([row])
+
+        assert forecast_writer.n_written == 1
+        session.commit.assert_called_once()
+
+    def test_no_flush_after_an_error(self, row, session):
+        """After an error, the last batch is lost."""
+        with pytest.raises(RuntimeError):
+            with models.ForecastWriter(batch_size=2) as forecast_writer:
+                forecast_writer.add([row])
+                raise RuntimeError('crash')
+
+        assert forecast_writer.n_written == 0
+        session.execute.assert_not_called()
+
+    def test_make_forecast_with_writer(
+        self, order_history, pixel, predict_at, session,
+    ):
+        """`*Model.make_forecast()` hands new `Forecast`s to the writer ...
+
+        ... instead of adding them to the session.
+        """
+        forecast_writer = models.ForecastWriter(batch_size=2)
+        model = models.TrivialModel(
+            order_history=order_history, forecast_writer=forecast_writer,
+        )
+        session.query.return_value.filter_by.return_value.filter_by.return_value = (
+            session.query.return_value.filter_by.return_value
+        )
+        session.query.return_value.filter_by.return_value.first.return_value = None
+
+        result = model.make_forecast(
+            pixel=pixel,
+            predict_at=predict_at,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert result.start_at == predict_at
+        assert result.pixel is pixel
+        assert result not in pixel.forecasts
+        assert len(forecast_writer) == 1
+        session.add_all.assert_not_called()
+        session.commit.assert_not_called()
+
+    def test_make_day_forecasts_with_writer(
+        self, order_history, pixel, predict_at, session,
+    ):
+        """`*Model.make_day_forecasts()` hands the day's `Forecast`s ...
+
+        ... to the writer at once.
+        """
+        forecast_writer = models.ForecastWriter(batch_size=100)
+        model = models.TrivialModel(
+            order_history=order_history, forecast_writer=forecast_writer,
+        )
+        session.query.return_value.filter_by.return_value.filter_by.return_value = (
+            session.query.return_value.filter_by.return_value
+        )
+        session.query.return_value.filter_by.return_value.first.return_value = None
+
+        result = model.make_day_forecasts(
+            pixel=pixel,
+            predict_day=predict_at.date(),
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert len(result) == 12  # = time steps per day
+        assert len(forecast_writer) == 12
+        session.add_all.assert_not_called()
+        session.commit.assert_not_called()
+
+    @pytest.mark.db
+    def test_write_into_database(  # noqa:WPS211
+        self, db_session, order_history, pixel, predict_at, row,
+    ):
+        """`Forecast`s are persisted and existing ones are skipped."""
+        db_session.add(pixel)
+        db_session.commit()
+        forecast_writer = models.ForecastWriter(batch_size=1)
+
+        forecast_writer.add([row])
+        forecast_writer.add([row])
+
+        assert db_session.query(db.Forecast).count() == 1
+
+    @pytest.mark.db
+    def test_write_with_execute_values(self, db_session, pixel, row, mocker):
+        """A batch is sent as one `VALUES` list with `psycopg2`'s helper."""
+        db_session.add(pixel)
+        db_session.commit()
+        execute_values = mocker.spy(extras, 'execute_values')
+        forecast_writer = models.ForecastWriter(batch_size=2)
+        next_row = {
+            **row,
+            'start_at': row['start_at'] + dt.timedelta(minutes=row['time_step']),
+        }
+
+        forecast_writer.add([row, next_row])
+
+        execute_values.assert_called_once()
+        assert db_session.query(db.Forecast).count() == 2
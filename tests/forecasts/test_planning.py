@@ -0,0 +1,118 @@
+"""Tests for the `urban_meal_delivery.forecasts.planning` module."""
+
+import datetime as dt
+
+import pytest
+
+from tests import config as test_config
+from urban_meal_delivery.forecasts import models
+from urban_meal_delivery.forecasts import planning
+
+
+class TestPlanTacticalForecasts:
+    """Test the `plan_tactical_forecasts()` function.
+
+    The `order_history` has `train_horizon` weeks of data plus one day.
+    So, there is exactly one day to be forecast per `Pixel`.
+    """
+
+    @pytest.fixture
+    def pixel_ids(self, good_pixel_id):
+        """The two `Pixel`s in the `order_history`."""
+        return [good_pixel_id, good_pixel_id + 1]
+
+    def test_plan_without_forecasts(self, order_history, pixel_ids):
+        """Without `Forecast`s, all `Pixel`s start after the `train_horizon`."""
+        result = planning.plan_tactical_forecasts(
+            order_history=order_history,
+            pixel_ids=pixel_ids,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            last_predict_ats={},
+        )
+
+        assert result == [
+            planning.Task(
+                pixel_id=pixel_id, predict_day=test_config.END.date(), model='hets',
+            )
+            for pixel_id in pixel_ids
+        ]
+
+    def test_plan_some_pixels(self, order_history, pixel_ids):
+        """Only the given `Pixel`s are planned."""
+        result = planning.plan_tactical_forecasts(
+            order_history=order_history,
+            pixel_ids=pixel_ids[1:],
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            last_predict_ats={},
+        )
+
+        assert [task.pixel_id for task in result] == pixel_ids[1:]
+
+    def test_models_from_tactical_schedule(self, order_history, pixel_ids, mocker):
+        """The `*Model`s are looked up in `OrderHistory.tactical_schedule()` ...
+
+        ... and not instantiated per `Pixel` and day.
+        """
+        choose_tactical_model = mocker.spy(order_history, 'choose_tactical_model')
+
+        result = planning.plan_tactical_forecasts(
+            order_history=order_history,
+            pixel_ids=pixel_ids,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            last_predict_ats={},
+        )
+
+        schedule = order_history.tactical_schedule(
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+        assert [task.model for task in result] == [
+            schedule.at[(task.pixel_id, task.predict_day), 'model'] for task in result
+        ]
+        choose_tactical_model.assert_not_called()
+
+    def test_continue_on_day_of_last_forecast(
+        self, order_history, pixel_ids, predict_at,
+    ):
+        """The day of the latest `Forecast` is planned again ...
+
+        ... as some of its `Forecast`s may be missing.
+        """
+        result = planning.plan_tactical_forecasts(
+            order_history=order_history,
+            pixel_ids=pixel_ids,
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            last_predict_ats={pixel_ids[0]: predict_at},
+        )
+
+        assert [task.predict_day for task in result] == [predict_at.date()] * 2
+
+    def test_nothing_left_to_do(self, order_history, pixel_ids, predict_at):
+        """After the last order, there is nothing to be forecast."""
+        result = planning.plan_tactical_forecasts(
+            order_history=order_history,
+            pixel_ids=pixel_ids[:1],
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+            last_predict_ats={pixel_ids[0]: predict_at + dt.timedelta(days=1)},
+        )
+
+        assert result == []
+
+
+@pytest.mark.db
+def test_last_predictions(db_session, order_history, pixel, predict_at):
+    """The latest `Forecast`s of all `Pixel`s are obtained in one query."""
+    model = models.TrivialModel(order_history=order_history)
+    for hours in (0, 1):
+        model.make_forecast(
+            pixel=pixel,
+            predict_at=predict_at + dt.timedelta(hours=hours),
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+    result = planning.last_predictions(
+        grid=pixel.grid,
+        time_step=test_config.LONG_TIME_STEP,
+        train_horizon=test_config.LONG_TRAIN_HORIZON,
+    )
+
+    assert result == {pixel.id: predict_at + dt.timedelta(hours=1)}
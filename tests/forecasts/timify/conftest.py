@@ -0,0 +1,23 @@
+"""Fixtures for testing the `urban_meal_delivery.forecasts.timify` module."""
+
+import pytest
+
+from tests import config as test_config
+from urban_meal_delivery.forecasts import timify
+
+
+@pytest.fixture(params=['dataframe', 'cube'])
+def order_history(request, order_totals, grid):
+    """An `OrderHistory` object that does not need the database.
+
+    Uses the LONG_TIME_STEP as the length of a time step.
+
+    Overrides the fixture of the same name in `tests.forecasts.conftest`
+    such that all test cases for the `timify` module run with both `storage`s.
+    """
+    oh = timify.OrderHistory(
+        grid=grid, time_step=test_config.LONG_TIME_STEP, storage=request.param,
+    )
+    oh._data = order_totals
+
+    return oh
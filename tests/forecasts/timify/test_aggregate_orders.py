@@ -2,13 +2,62 @@
 
 import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from tests import config as test_config
+from urban_meal_delivery import config
 from urban_meal_delivery import db
 from urban_meal_delivery.forecasts import timify
 
 
+class TestMakeCompleteIndex:
+    """Test the `OrderHistory._make_complete_index()` method.
+
+    The index is used to fill in `0`s where there is no demand.
+    """
+
+    @pytest.mark.parametrize('time_step', test_config.TIME_STEPS)
+    def test_same_as_python_loop(self, grid, time_step):
+        """The vectorized index is the same as one built with a Python loop."""
+        oh = timify.OrderHistory(grid=grid, time_step=time_step)
+        pixel_ids = [3, 1, 2]
+
+        result = oh._make_complete_index(
+            pixel_ids=pixel_ids,
+            first_day=test_config.START.date(),
+            last_day=test_config.END.date(),
+        )
+
+        expected = pd.MultiIndex.from_tuples(
+            (
+                (pixel_id, start_at)
+                for pixel_id in sorted(pixel_ids)
+                for start_at in pd.date_range(
+                    test_config.START, test_config.END, freq=f'{time_step}T',
+                )
+                if config.SERVICE_START <= start_at.hour < config.SERVICE_END
+            ),
+            names=['pixel_id', 'start_at'],
+        )
+        assert result.equals(expected)
+        assert result.names == expected.names
+
+    def test_one_day(self, grid):
+        """The index covers the operating hours of one day per `Pixel`."""
+        oh = timify.OrderHistory(grid=grid, time_step=test_config.LONG_TIME_STEP)
+
+        result = oh._make_complete_index(
+            pixel_ids=[1, 2],
+            first_day=test_config.START.date(),
+            last_day=test_config.START.date(),
+        )
+
+        assert len(result) == 2 * 12
+        assert result.get_level_values('start_at').min() == test_config.START
+
+
 @pytest.mark.db
 class TestAggregateOrders:
     """Test the `OrderHistory.aggregate_orders()` method.
@@ -289,6 +338,145 @@ class TestAggregateOrders:
         assert result['n_orders'].max() == 1
         assert result['n_orders'].sum() == 18
 
+    def test_refresh_with_new_orders(  # noqa:WPS218
+        self, db_session, one_pixel_grid, restaurant, make_order,
+    ):
+        """Test `OrderHistory.refresh()` ...
+
+        ... with 12 ad-hoc orders on the first day and 2 more orders later on.
+
+        One of the later orders is placed in the last aggregated time step
+        and the other one on the next day.
+        """
+        for hour in range(11, 23):
+            order = make_order(
+                scheduled=False,
+                restaurant=restaurant,
+                placed_at=datetime.datetime(
+                    test_config.YEAR, test_config.MONTH, test_config.DAY, hour, 11,
+                ),
+            )
+            db_session.add(order)
+
+        db_session.commit()
+
+        oh = timify.OrderHistory(
+            grid=one_pixel_grid, time_step=test_config.LONG_TIME_STEP,
+        )
+
+        assert oh.totals['n_orders'].sum() == 12  # sanity check
+
+        late_order = make_order(
+            scheduled=False,
+            restaurant=restaurant,
+            placed_at=datetime.datetime(
+                test_config.YEAR, test_config.MONTH, test_config.DAY, 22, 42,
+            ),
+        )
+        next_day_order = make_order(
+            scheduled=False,
+            restaurant=restaurant,
+            placed_at=datetime.datetime(
+                test_config.YEAR, test_config.MONTH, test_config.DAY + 1, 12, 11,
+            ),
+        )
+        db_session.add(late_order)
+        db_session.add(next_day_order)
+
+        db_session.commit()
+
+        result = oh.refresh()
+
+        # The resulting `DataFrame` has 24 rows, 12 for each day.
+        assert len(result) == 24
+        assert result['n_orders'].sum() == 14
+        assert result.iloc[11]['n_orders'] == 2
+        assert result.iloc[12 + 1]['n_orders'] == 1
+
+    def test_aggregate_cube_with_no_orders(self, db_session, one_pixel_grid):
+        """Edge case that does not occur for real-life data."""
+        db_session.commit()
+
+        oh = timify.OrderHistory(
+            grid=one_pixel_grid, time_step=test_config.LONG_TIME_STEP,
+        )
+
+        result = oh.aggregate_cube()
+
+        assert result.counts.shape == (0, 0, 12)
+        assert result.first_day is None
+
+    @pytest.mark.parametrize('time_step', test_config.TIME_STEPS)
+    def test_aggregate_cube_same_as_aggregate_orders(  # noqa:WPS218
+        self, db_session, one_pixel_grid, restaurant, make_order, time_step,
+    ):
+        """`OrderHistory.aggregate_cube()` bins and zero-fills in the database.
+
+        Orders are placed at the beginning and the end of time steps
+        on two days that are not adjacent.
+        """
+        for day, hour, minute in (  # noqa:WPS352
+            (test_config.DAY, 11, 0),
+            (test_config.DAY, 11, 59),
+            (test_config.DAY, 17, 30),
+            (test_config.DAY + 2, 12, 29),
+            (test_config.DAY + 2, 22, 59),
+        ):
+            order = make_order(
+                scheduled=False,
+                restaurant=restaurant,
+                placed_at=datetime.datetime(
+                    test_config.YEAR, test_config.MONTH, day, hour, minute, 42,
+                ),
+            )
+            db_session.add(order)
+
+        db_session.commit()
+
+        oh = timify.OrderHistory(grid=one_pixel_grid, time_step=time_step)
+
+        result = oh.aggregate_cube()
+
+        expected = oh.aggregate_orders()
+        assert result.counts.shape == (1, 3, 12 * 60 // time_step)
+        assert result.first_day == test_config.START.date()
+        pd.testing.assert_frame_equal(result.to_totals(), expected)
+        assert oh._last_placed_at == datetime.datetime(
+            test_config.YEAR, test_config.MONTH, test_config.DAY + 2, 22, 59, 42,
+        )
+
+    def test_city_order_history_same_as_aggregate_orders(
+        self, db_session, one_pixel_grid, restaurant, make_order,
+    ):
+        """Test `CityOrderHistory.order_history()` ...
+
+        ... with one ad-hoc order every other hour over two days.
+        """
+        for day in (test_config.DAY, test_config.DAY + 1):
+            for hour in range(11, 23, 2):
+                order = make_order(
+                    scheduled=False,
+                    restaurant=restaurant,
+                    placed_at=datetime.datetime(
+                        test_config.YEAR, test_config.MONTH, day, hour, 11,
+                    ),
+                )
+                db_session.add(order)
+
+        db_session.commit()
+
+        city_history = timify.CityOrderHistory(
+            city=one_pixel_grid.city, time_step=test_config.LONG_TIME_STEP,
+        )
+
+        result = city_history.order_history(one_pixel_grid)
+
+        oh = timify.OrderHistory(
+            grid=one_pixel_grid, time_step=test_config.LONG_TIME_STEP,
+        )
+        pd.testing.assert_frame_equal(result.totals, oh.aggregate_orders())
+        assert result._last_placed_at == oh._last_placed_at
+
     @pytest.fixture
     def two_pixel_grid(  # noqa:WPS211
         self, db_session, city, make_address, make_restaurant, addresses_mock,
@@ -384,3 +572,113 @@ class TestAggregateOrders:
         assert result['n_orders'].min() == 0
         assert result['n_orders'].max() == 2
         assert result['n_orders'].sum() == 30
+
+    @pytest.mark.parametrize('time_step', test_config.TIME_STEPS)
+    def test_aggregate_cube_with_orders_outside_operating_hours(  # noqa:WPS218
+        self, db_session, two_pixel_grid, make_order, monkeypatch, time_step,
+    ):
+        """`OrderHistory.aggregate_cube()` keeps the same days and `Pixel`s ...
+
+        ... as `OrderHistory.aggregate_orders()` if some of them
+        only have `Order`s outside the operating hours.
+        """
+        # With shorter operating hours, `Order`s may be placed outside of them.
+        monkeypatch.setattr(config, 'SERVICE_START', 12)
+        monkeypatch.setattr(config, 'SERVICE_END', 22)
+
+        address1, address2 = two_pixel_grid.city.addresses
+        restaurant1, restaurant2 = address1.restaurants[0], address2.restaurants[0]
+
+        # `restaurant1` has `Order`s within the operating hours, ...
+        for hour in (12, 15):
+            order = make_order(
+                scheduled=False,
+                restaurant=restaurant1,
+                placed_at=datetime.datetime(
+                    test_config.YEAR, test_config.MONTH, test_config.DAY, hour, 11,
+                ),
+            )
+            db_session.add(order)
+
+        # ... and `restaurant2` only outside of them, one of which on a day
+        # without any other `Order`s.
+        for day, hour in ((test_config.DAY, 11), (test_config.DAY + 2, 22)):
+            order = make_order(
+                scheduled=False,
+                restaurant=restaurant2,
+                placed_at=datetime.datetime(
+                    test_config.YEAR, test_config.MONTH, day, hour, 30,
+                ),
+            )
+            db_session.add(order)
+
+        db_session.commit()
+
+        oh = timify.OrderHistory(grid=two_pixel_grid, time_step=time_step)
+
+        result = oh.aggregate_cube()
+
+        expected = oh.aggregate_orders()
+        assert result.counts.shape == (2, 3, 10 * 60 // time_step)
+        assert result.counts.sum() == 2
+        pd.testing.assert_frame_equal(result.to_totals(), expected)
+        assert oh._last_placed_at == datetime.datetime(
+            test_config.YEAR, test_config.MONTH, test_config.DAY + 2, 22, 30,
+        )
+
+    @pytest.mark.parametrize('time_step', test_config.TIME_STEPS)
+    def test_city_cube_with_orders_outside_operating_hours(  # noqa:WPS218
+        self, db_session, two_pixel_grid, make_order, monkeypatch, time_step,
+    ):
+        """The `CityOrderHistory.aggregate_cube()` projected onto a `Grid` ...
+
+        ... equals `OrderHistory.aggregate_cube()` for that `Grid` if some days
+        and `Pixel`s only have `Order`s outside the operating hours.
+        """
+        # With shorter operating hours, `Order`s may be placed outside of them.
+        monkeypatch.setattr(config, 'SERVICE_START', 12)
+        monkeypatch.setattr(config, 'SERVICE_END', 22)
+        # Look up the `Pixel`s of the `Address`es in the database.
+        monkeypatch.setattr(db, 'session', db_session)
+
+        address1, address2 = two_pixel_grid.city.addresses
+        restaurant1, restaurant2 = address1.restaurants[0], address2.restaurants[0]
+
+        # `restaurant1` has `Order`s within the operating hours, ...
+        for hour in (12, 15):
+            order = make_order(
+                scheduled=False,
+                restaurant=restaurant1,
+                placed_at=datetime.datetime(
+                    test_config.YEAR, test_config.MONTH, test_config.DAY + 1, hour, 11,
+                ),
+            )
+            db_session.add(order)
+
+        # ... and `restaurant2` only outside of them, including
+        # the first and the last day with any `Order`s.
+        for day, hour in ((test_config.DAY, 11), (test_config.DAY + 3, 22)):
+            order = make_order(
+                scheduled=False,
+                restaurant=restaurant2,
+                placed_at=datetime.datetime(
+                    test_config.YEAR, test_config.MONTH, day, hour, 30,
+                ),
+            )
+            db_session.add(order)
+
+        db_session.commit()
+
+        city_history = timify.CityOrderHistory(
+            city=two_pixel_grid.city, time_step=time_step,
+        )
+
+        result = city_history.order_history(two_pixel_grid)
+
+        oh = timify.OrderHistory(grid=two_pixel_grid, time_step=time_step)
+        expected = oh.aggregate_cube()
+        assert result.cube.counts.shape == (2, 4, 10 * 60 // time_step)
+        np.testing.assert_array_equal(result.cube.counts, expected.counts)
+        np.testing.assert_array_equal(result.cube.pixel_ids, expected.pixel_ids)
+        assert result.cube.first_day == expected.first_day
+        assert result._last_placed_at == oh._last_placed_at
@@ -1,11 +1,13 @@
 """Tests for the `OrderHistory.avg_daily_demand()` and ...
 
-`OrderHistory.choose_tactical_model()` methods.
+`OrderHistory.choose_tactical_model()` methods, and their vectorized
+counterparts `OrderHistory.avg_daily_demands()` and `.tactical_schedule()`.
 
 We test both methods together as they take the same input and are really
 two parts of the same conceptual step.
 """
 
+import numpy as np
 import pytest
 
 from tests import config as test_config
@@ -141,3 +143,90 @@ class TestChooseTacticalModel:
                 predict_day=predict_at.date(),
                 train_horizon=test_config.SHORT_TRAIN_HORIZON,
             )
+
+
+class TestAverageDailyDemands:
+    """Tests for the `OrderHistory.avg_daily_demands()` method."""
+
+    @pytest.mark.parametrize('train_horizon', test_config.TRAIN_HORIZONS)
+    def test_same_as_avg_daily_demand(self, order_history, train_horizon):
+        """The ADDs are the same as calculated one by one."""
+        rng = np.random.default_rng(42)
+        order_history._data.loc[:, 'n_orders'] = rng.integers(
+            0, 4, size=len(order_history._data),
+        )
+
+        result = order_history.avg_daily_demands(train_horizon=train_horizon)
+
+        # The order history covers `8` weeks plus one day.
+        assert len(result) == 2 * (7 * (8 - train_horizon) + 1)
+        for (pixel_id, predict_day), add in result.items():
+            assert add == order_history.avg_daily_demand(
+                pixel_id=pixel_id,
+                predict_day=predict_day,
+                train_horizon=train_horizon,
+            )
+
+    def test_not_enough_historic_data(self, order_history):
+        """There is no `predict_day` with `9` weeks of data before it."""
+        result = order_history.avg_daily_demands(train_horizon=9)
+
+        assert len(result) == 0  # noqa:WPS507
+        assert result.index.names == ['pixel_id', 'predict_day']
+
+
+class TestTacticalSchedule:
+    """Tests for the `OrderHistory.tactical_schedule()` method."""
+
+    @pytest.mark.parametrize(
+        'n_orders, model_name', [(3, 'hets'), (2, 'hets'), (1, 'hets'), (0, 'trivial')],
+    )
+    def test_model_names(
+        self, order_history, good_pixel_id, predict_at, n_orders, model_name,
+    ):
+        """The schedule holds the name of the chosen `*Model`."""
+        order_history._data.loc[:, 'n_orders'] = n_orders
+
+        result = order_history.tactical_schedule(
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        row = result.loc[(good_pixel_id, predict_at.date())]
+        assert row['avg_daily_demand'] == 12 * n_orders
+        assert row['model'] == model_name
+
+    def test_same_as_choose_tactical_model(
+        self, order_history, good_pixel_id, predict_at,
+    ):
+        """The schedule and `OrderHistory.choose_tactical_model()` agree."""
+        result = order_history.tactical_schedule(
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        model = order_history.choose_tactical_model(
+            pixel_id=good_pixel_id,
+            predict_day=predict_at.date(),
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+        assert result.loc[(good_pixel_id, predict_at.date()), 'model'] == model.name
+
+    def test_schedule_is_cached(self, order_history):
+        """The ADDs are calculated only once per `train_horizon`."""
+        result1 = order_history.tactical_schedule(
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+        result2 = order_history.tactical_schedule(
+            train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert result1 is result2
+
+    def test_unknown_train_horizon(self, order_history):
+        """For `train_horizon`s not included in the rule-based system ...
+
+        ... the method raises a `RuntimeError`.
+        """
+        with pytest.raises(RuntimeError, match='no rule'):
+            order_history.tactical_schedule(
+                train_horizon=test_config.SHORT_TRAIN_HORIZON,
+            )
@@ -0,0 +1,165 @@
+"""Test the `CityOrderHistory` class in the `timify` module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests import config as test_config
+from urban_meal_delivery import db
+from urban_meal_delivery.forecasts import timify
+from urban_meal_delivery.forecasts.cube import DemandCube
+
+
+@pytest.fixture
+def address_totals(order_totals):
+    """Random order totals for three `Address`es in the `city`."""
+    start_ats = order_totals.index.get_level_values('start_at').unique()
+    index = pd.MultiIndex.from_product(
+        [[101, 102, 103], start_ats], names=['address_id', 'start_at'],
+    )
+    rng = np.random.default_rng(42)
+
+    return pd.DataFrame(
+        data={'n_orders': rng.integers(0, 5, size=len(index))}, index=index,
+    )
+
+
+@pytest.fixture
+def two_pixel_grid(grid, pixel):
+    """The `grid` with two `Pixel`s; two `Address`es are in the first `Pixel`."""
+    other_pixel = db.Pixel(id=pixel.id + 1, grid=grid, n_x=0, n_y=1)
+
+    db.AddressPixelAssociation(address_id=101, pixel=pixel)
+    db.AddressPixelAssociation(address_id=102, pixel=pixel)
+    db.AddressPixelAssociation(address_id=103, pixel=other_pixel)
+
+    return grid
+
+
+@pytest.fixture
+def city_history(city, address_totals):
+    """A `CityOrderHistory` object that does not need the database."""
+    city_history = timify.CityOrderHistory(
+        city=city, time_step=test_config.LONG_TIME_STEP,
+    )
+    city_history._cube = DemandCube.from_totals(
+        address_totals, time_step=test_config.LONG_TIME_STEP,
+    )
+
+    return city_history
+
+
+class TestProperties:
+    """Test the properties in `CityOrderHistory`."""
+
+    def test_time_step(self, city_history):
+        """Test `CityOrderHistory.time_step` property."""
+        assert city_history.time_step == test_config.LONG_TIME_STEP
+
+    def test_cube_is_cached(self, city, monkeypatch):
+        """Test `CityOrderHistory.cube` property."""
+        city_history = timify.CityOrderHistory(
+            city=city, time_step=test_config.LONG_TIME_STEP,
+        )
+        sentinel = object()
+        monkeypatch.setattr(city_history, 'aggregate_cube', lambda: sentinel)
+
+        result1 = city_history.cube
+        result2 = city_history.cube
+
+        assert result1 is result2
+        assert result1 is sentinel
+
+
+class TestOrderHistory:
+    """Test the `CityOrderHistory.order_history()` method."""
+
+    @pytest.fixture(autouse=True)
+    def address_pixels(self, monkeypatch):
+        """Look up the `Pixel`s of the `Address`es without the database."""
+
+        def address_pixels(_self, grid):  # noqa:WPS430
+            return {
+                association.address_id: pixel.id
+                for pixel in grid.pixels
+                for association in pixel.addresses
+            }
+
+        monkeypatch.setattr(timify.CityOrderHistory, '_address_pixels', address_pixels)
+
+    @pytest.mark.parametrize('storage', ['dataframe', 'cube'])
+    def test_addresses_are_summed_up_into_pixels(
+        self, city_history, two_pixel_grid, pixel, address_totals, storage,
+    ):
+        """The order totals of a `Pixel` are the ones of its `Address`es."""
+        result = city_history.order_history(two_pixel_grid, storage=storage)
+
+        n_orders = address_totals['n_orders']
+        totals = result.totals['n_orders']
+        np.testing.assert_array_equal(
+            totals.loc[pixel.id].to_numpy(),
+            n_orders.loc[101].to_numpy() + n_orders.loc[102].to_numpy(),
+        )
+        np.testing.assert_array_equal(
+            totals.loc[pixel.id + 1].to_numpy(), n_orders.loc[103].to_numpy(),
+        )
+        assert result.time_step == test_config.LONG_TIME_STEP
+        assert result._storage == storage
+
+    def test_same_as_order_totals_of_grid(
+        self, city_history, two_pixel_grid, pixel, address_totals,
+    ):
+        """The result looks as if the orders were aggregated for the `grid`."""
+        result = city_history.order_history(two_pixel_grid)
+
+        pixel_ids = address_totals.index.get_level_values('address_id').map(
+            {101: pixel.id, 102: pixel.id, 103: pixel.id + 1},
+        )
+        expected = address_totals.groupby(
+            [pixel_ids, address_totals.index.get_level_values('start_at')],
+        ).sum()
+        expected.index.names = ['pixel_id', 'start_at']
+        pd.testing.assert_frame_equal(result.totals, expected)
+
+    def test_watermark_is_kept(self, city_history, two_pixel_grid, monkeypatch):
+        """The derived `OrderHistory` may be refreshed."""
+        last_placed_at = test_config.END
+        monkeypatch.setattr(city_history, '_last_placed_at', last_placed_at)
+
+        result = city_history.order_history(two_pixel_grid)
+
+        assert result._last_placed_at == last_placed_at
+
+    def test_grid_in_other_city(self, city_history):
+        """A `Grid` of another `City` cannot be projected."""
+        grid = db.Grid(city=db.City(), side_length=1000)
+
+        with pytest.raises(ValueError, match='`grid` must be in the `city`'):
+            city_history.order_history(grid)
+
+
+@pytest.mark.db
+class TestAddressPixels:
+    """Test the `CityOrderHistory._address_pixels()` method."""
+
+    def test_one_pixel_per_address(self, db_session, city_history, address, pixel):
+        """The `Address`es are mapped to their `Pixel` in the `Grid`."""
+        db_session.add(db.AddressPixelAssociation(address=address, pixel=pixel))
+        db_session.commit()
+
+        result = city_history._address_pixels(pixel.grid)
+
+        assert result == {address.id: pixel.id}
+
+    def test_other_grids_are_ignored(self, db_session, city_history, address, pixel):
+        """`Address`es in other `Grid`s are not mapped."""
+        db_session.add(db.AddressPixelAssociation(address=address, pixel=pixel))
+        db_session.commit()
+
+        other_grid = db.Grid(city=pixel.grid.city, side_length=999)
+        db_session.add(other_grid)
+        db_session.commit()
+
+        result = city_history._address_pixels(other_grid)
+
+        assert result == {}
@@ -6,11 +6,13 @@ Unless otherwise noted, each `time_step` is 60 minutes long implying
 
 import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from tests import config as test_config
 from urban_meal_delivery import config
+from urban_meal_delivery.forecasts import timify
 
 
 @pytest.fixture
@@ -397,3 +399,212 @@ class TestMakeRealTimeTimeSeries:
             order_history.make_realtime_ts(
                 pixel_id=good_pixel_id, predict_at=good_predict_at, train_horizon=999,
             )
+
+
+class TestStoragesAreEquivalent:
+    """Slicing the time series yields the same results with both `storage`s."""
+
+    @pytest.fixture
+    def order_histories(self, order_totals, grid):
+        """Two `OrderHistory` objects with the same random order totals."""
+        rng = np.random.default_rng(42)
+        totals = order_totals.copy()
+        totals['n_orders'] = rng.integers(0, 10, size=len(totals))
+
+        histories = []
+        for storage in ('dataframe', 'cube'):
+            oh = timify.OrderHistory(
+                grid=grid, time_step=test_config.LONG_TIME_STEP, storage=storage,
+            )
+            oh._data = totals
+            histories.append(oh)
+
+        return histories
+
+    @pytest.mark.parametrize('hour', [config.SERVICE_START, test_config.NOON, 22])
+    @pytest.mark.parametrize('train_horizon', test_config.TRAIN_HORIZONS)
+    @pytest.mark.parametrize(
+        'method', ['make_horizontal_ts', 'make_realtime_ts', 'make_vertical_ts'],
+    )
+    def test_same_time_series(  # noqa:WPS211
+        self,
+        order_histories,
+        good_pixel_id,
+        good_predict_at,
+        hour,
+        train_horizon,
+        method,
+    ):
+        """Compare the time series sliced out of both `storage`s."""
+        predict_at = good_predict_at.replace(hour=hour)
+        if method == 'make_vertical_ts':
+            kwargs = {'predict_day': predict_at.date()}
+        else:
+            kwargs = {'predict_at': predict_at}
+
+        results = [
+            getattr(oh, method)(
+                pixel_id=good_pixel_id, train_horizon=train_horizon, **kwargs,
+            )
+            for oh in order_histories
+        ]
+
+        training_ts1, frequency1, actuals_ts1 = results[0]
+        training_ts2, frequency2, actuals_ts2 = results[1]
+
+        pd.testing.assert_series_equal(training_ts1, training_ts2, check_freq=False)
+        assert frequency1 == frequency2
+        pd.testing.assert_series_equal(actuals_ts1, actuals_ts2, check_freq=False)
+
+    @pytest.mark.parametrize('train_horizon', test_config.TRAIN_HORIZONS)
+    @pytest.mark.parametrize(
+        'method', ['make_horizontal_ts', 'make_realtime_ts', 'make_vertical_ts'],
+    )
+    def test_predict_day_before_history(
+        self, order_histories, good_pixel_id, train_horizon, method,
+    ):
+        """Both `storage`s raise the same error without any history.
+
+        On the first day with orders, the training horizon lies entirely before it.
+        """
+        predict_at = test_config.START.replace(hour=test_config.NOON)
+        if method == 'make_vertical_ts':
+            kwargs = {'predict_day': predict_at.date()}
+        else:
+            kwargs = {'predict_at': predict_at}
+
+        for oh in order_histories:
+            with pytest.raises(RuntimeError, match='Not enough historic data'):
+                getattr(oh, method)(
+                    pixel_id=good_pixel_id, train_horizon=train_horizon, **kwargs,
+                )
+
+
+class TestMakeBatches:
+    """Test the vectorized versions of the `make_*_ts()` methods."""
+
+    @pytest.fixture
+    def random_history(self, order_history):
+        """The `order_history` with random order totals."""
+        rng = np.random.default_rng(42)
+        order_history._data.loc[:, 'n_orders'] = rng.integers(
+            0, 10, size=len(order_history._data),
+        )
+
+        return order_history
+
+    @pytest.fixture
+    def batch(self, good_pixel_id, good_predict_at):
+        """Pairs of "pixel_id"s and all `predict_at`s on the last day."""
+        pixel_ids, predict_ats = [], []
+        for hour in range(config.SERVICE_START, config.SERVICE_END):
+            for pixel_id in (good_pixel_id, good_pixel_id + 1):
+                pixel_ids.append(pixel_id)
+                predict_ats.append(good_predict_at.replace(hour=hour))
+
+        return pixel_ids, predict_ats
+
+    @pytest.mark.parametrize('train_horizon', test_config.TRAIN_HORIZONS)
+    @pytest.mark.parametrize(
+        'method', ['make_horizontal_ts', 'make_realtime_ts'],
+    )
+    def test_same_as_single_time_series(
+        self, random_history, batch, train_horizon, method,
+    ):
+        """Each row in the batch is the same as the corresponding time series."""
+        pixel_ids, predict_ats = batch
+        batch_method = getattr(random_history, method.replace('_ts', '_batch'))
+
+        training, frequency, actuals = batch_method(
+            pixel_ids=pixel_ids, predict_ats=predict_ats, train_horizon=train_horizon,
+        )
+
+        assert len(training) == len(actuals) == len(pixel_ids)
+        for row, (pixel_id, predict_at) in enumerate(zip(pixel_ids, predict_ats)):
+            training_ts, frequency_ts, actuals_ts = getattr(random_history, method)(
+                pixel_id=pixel_id, predict_at=predict_at, train_horizon=train_horizon,
+            )
+            # Real-time time series are padded with `NaN`s on the left.
+            values = training[row][~np.isnan(training[row].astype(float))]
+            np.testing.assert_array_equal(values, training_ts.to_numpy())
+            assert actuals[row] == actuals_ts.iloc[0]
+            assert frequency == frequency_ts
+
+    @pytest.mark.parametrize('train_horizon', test_config.TRAIN_HORIZONS)
+    def test_vertical_same_as_single_time_series(
+        self, random_history, batch, train_horizon,
+    ):
+        """Each row in the batch is the same as the corresponding time series."""
+        pixel_ids, predict_ats = batch
+        predict_days = [predict_at.date() for predict_at in predict_ats]
+
+        training, frequency, actuals = random_history.make_vertical_batch(
+            pixel_ids=pixel_ids, predict_days=predict_days, train_horizon=train_horizon,
+        )
+
+        assert training.shape == (len(pixel_ids), frequency * train_horizon)
+        assert actuals.shape == (len(pixel_ids), 12)
+        for row, (pixel_id, predict_day) in enumerate(zip(pixel_ids, predict_days)):
+            training_ts, frequency_ts, actuals_ts = random_history.make_vertical_ts(
+                pixel_id=pixel_id, predict_day=predict_day, train_horizon=train_horizon,
+            )
+            np.testing.assert_array_equal(training[row], training_ts.to_numpy())
+            np.testing.assert_array_equal(actuals[row], actuals_ts.to_numpy())
+            assert frequency == frequency_ts
+
+    @pytest.mark.parametrize(
+        'method', ['make_horizontal_batch', 'make_realtime_batch'],
+    )
+    def test_wrong_pixel(self, order_history, good_predict_at, method):
+        """A `pixel_id` that is not in the `grid`."""
+        with pytest.raises(LookupError):
+            getattr(order_history, method)(
+                pixel_ids=[999_999],
+                predict_ats=[good_predict_at],
+                train_horizon=test_config.LONG_TRAIN_HORIZON,
+            )
+
+    @pytest.mark.parametrize(
+        'method', ['make_horizontal_batch', 'make_realtime_batch'],
+    )
+    def test_no_long_enough_history(
+        self, order_history, good_pixel_id, good_predict_at, bad_predict_at, method,
+    ):
+        """One `predict_at` in the batch is too early in the `START`-`END` horizon."""
+        with pytest.raises(RuntimeError):
+            getattr(order_history, method)(
+                pixel_ids=[good_pixel_id, good_pixel_id],
+                predict_ats=[good_predict_at, bad_predict_at],
+                train_horizon=test_config.LONG_TRAIN_HORIZON,
+            )
+
+    def test_vertical_no_long_enough_history(
+        self, order_history, good_pixel_id, bad_predict_at,
+    ):
+        """The `predict_day` is too early in the `START`-`END` horizon."""
+        with pytest.raises(RuntimeError):
+            order_history.make_vertical_batch(
+                pixel_ids=[good_pixel_id],
+                predict_days=[bad_predict_at.date()],
+                train_horizon=test_config.LONG_TRAIN_HORIZON,
+            )
+
+    def test_different_lengths(self, order_history, good_pixel_id, good_predict_at):
+        """There must be one `predict_at` per `pixel_id`."""
+        with pytest.raises(ValueError, match='same length'):
+            order_history.make_horizontal_batch(
+                pixel_ids=[good_pixel_id, good_pixel_id],
+                predict_ats=[good_predict_at],
+                train_horizon=test_config.LONG_TRAIN_HORIZON,
+            )
+
+    @pytest.mark.parametrize(
+        'method', ['make_horizontal_batch', 'make_realtime_batch'],
+    )
+    def test_empty_batch(self, order_history, method):
+        """Edge case that does not occur in practice."""
+        training, _, actuals = getattr(order_history, method)(
+            pixel_ids=[], predict_ats=[], train_horizon=test_config.LONG_TRAIN_HORIZON,
+        )
+
+        assert len(training) == len(actuals) == 0  # noqa:WPS507
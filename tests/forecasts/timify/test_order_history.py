@@ -2,9 +2,12 @@
 
 import datetime as dt
 
+import pandas as pd
 import pytest
 
 from tests import config as test_config
+from urban_meal_delivery import config
+from urban_meal_delivery.forecasts import cube
 from urban_meal_delivery.forecasts import timify
 
 
@@ -15,6 +18,13 @@ class TestSpecialMethods:
         """Test `OrderHistory.__init__()`."""
         assert order_history is not None
 
+    def test_instantiate_with_invalid_storage(self, grid):
+        """Test `OrderHistory.__init__()` with bad input."""
+        with pytest.raises(ValueError, match='`storage` must be either'):
+            timify.OrderHistory(
+                grid=grid, time_step=test_config.LONG_TIME_STEP, storage='invalid',
+            )
+
 
 class TestProperties:
     """Test the properties in `OrderHistory`."""
@@ -41,7 +51,7 @@ class TestProperties:
 
         assert result is order_totals
 
-    def test_totals_is_cached(self, order_history, monkeypatch):
+    def test_totals_is_cached(self, order_history, mocker, monkeypatch):
         """Test `OrderHistory.totals` property.
 
         The result of the `OrderHistory.aggregate_orders()` method call
@@ -49,10 +59,15 @@ class TestProperties:
 
         Note: We make `OrderHistory.aggregate_orders()` return a `sentinel`
         that is cached into `OrderHistory._data`, which must be unset first.
+        With the "cube" `storage`, the `sentinel` is derived from the result
+        of `OrderHistory.aggregate_cube()` instead.
         """
         monkeypatch.setattr(order_history, '_data', None)
         sentinel = object()
         monkeypatch.setattr(order_history, 'aggregate_orders', lambda: sentinel)
+        cube = mocker.Mock()
+        cube.to_totals.return_value = sentinel
+        monkeypatch.setattr(order_history, 'aggregate_cube', lambda: cube)
 
         result1 = order_history.totals
         result2 = order_history.totals
@@ -60,6 +75,71 @@ class TestProperties:
         assert result1 is result2
         assert result1 is sentinel
 
+    def test_cube(self, order_history, order_totals):
+        """Test `OrderHistory.cube` property.
+
+        The `DemandCube` holds the same data as the `OrderHistory.totals`.
+        """
+        result = order_history.cube
+
+        assert result.counts.sum() == order_totals['n_orders'].sum()
+        assert result.time_step == order_history.time_step
+
+    def test_cube_is_cached(self, order_history):
+        """Test `OrderHistory.cube` property."""
+        result1 = order_history.cube
+        result2 = order_history.cube
+
+        assert result1 is result2
+
+
+class TestActivity:
+    """Test the `OrderHistory.activity` property."""
+
+    def test_activity(self, order_history, good_pixel_id):
+        """In the `order_totals`, there are orders in all time steps."""
+        result = order_history.activity
+
+        n_days = (test_config.END - test_config.START).days + 1
+        one_time_step = dt.timedelta(minutes=test_config.LONG_TIME_STEP)
+        assert list(result.index) == [good_pixel_id, good_pixel_id + 1]
+        assert (result['first_order_at'] == test_config.START).all()
+        assert (result['last_order_at'] == test_config.END - one_time_step).all()
+        assert (result['n_active_days'] == n_days).all()
+
+    def test_activity_with_sparse_orders(self, order_history, good_pixel_id):
+        """Only the time steps with orders are considered."""
+        data = order_history._data
+        data.loc[:, 'n_orders'] = 0
+        first_order_at = test_config.START + dt.timedelta(days=3, hours=2)
+        last_order_at = test_config.START + dt.timedelta(days=9, hours=5)
+        data.loc[(good_pixel_id, first_order_at), 'n_orders'] = 1
+        data.loc[(good_pixel_id, last_order_at), 'n_orders'] = 2
+
+        result = order_history.activity
+
+        assert result.loc[good_pixel_id, 'first_order_at'] == first_order_at
+        assert result.loc[good_pixel_id, 'last_order_at'] == last_order_at
+        assert result.loc[good_pixel_id, 'n_active_days'] == 2
+        # The other `Pixel` has no orders at all.
+        assert result.loc[good_pixel_id + 1, 'first_order_at'] is pd.NaT
+        assert result.loc[good_pixel_id + 1, 'n_active_days'] == 0
+
+    def test_activity_without_orders(self, order_history, order_totals):
+        """Edge case that does not occur for real-life data."""
+        order_history._data = order_totals.iloc[:0]
+
+        result = order_history.activity
+
+        assert len(result) == 0  # noqa:WPS507
+
+    def test_activity_is_cached(self, order_history):
+        """Test `OrderHistory.activity` property."""
+        result1 = order_history.activity
+        result2 = order_history.activity
+
+        assert result1 is result2
+
 
 class TestMethods:
     """Test various methods in `OrderHistory`."""
@@ -90,3 +170,336 @@ class TestMethods:
             LookupError, match='`pixel_id` is not in the `grid`',
         ):
             order_history.last_order_at(-1)
+
+
+class TestFromCube:
+    """Test the `OrderHistory.from_cube()` alternative constructor."""
+
+    def test_same_totals(self, order_history, order_totals):
+        """The order totals are taken from the `DemandCube`."""
+        result = timify.OrderHistory.from_cube(
+            grid=order_history._grid, cube=order_history.cube,
+        )
+
+        assert result.time_step == order_history.time_step
+        pd.testing.assert_frame_equal(result.totals, order_totals)
+
+    def test_saved_cube(self, order_history, order_totals, tmp_path):
+        """A `DemandCube` loaded from disk replaces the database query."""
+        path = str(tmp_path / 'cube')
+        order_history.cube.save(path)
+
+        result = timify.OrderHistory.from_cube(
+            grid=order_history._grid, cube=cube.DemandCube.load(path), storage='cube',
+        )
+
+        assert result._storage == 'cube'
+        pd.testing.assert_frame_equal(result.totals, order_totals)
+
+
+class TestCoarsen:
+    """Test the `OrderHistory.coarsen()` method."""
+
+    def test_longer_time_step(self, order_history, order_totals):
+        """The order totals are summed up over two hours."""
+        result = order_history.coarsen(2 * test_config.LONG_TIME_STEP)
+
+        assert result.time_step == 2 * test_config.LONG_TIME_STEP
+        assert len(result.totals) == len(order_totals) // 2
+        assert result.totals['n_orders'].sum() == order_totals['n_orders'].sum()
+        assert result.totals['n_orders'].max() == 2
+
+    def test_storage_and_watermark_are_kept(self, order_history, monkeypatch):
+        """The derived `OrderHistory` may be sliced and refreshed alike."""
+        last_placed_at = test_config.END - dt.timedelta(minutes=30)
+        monkeypatch.setattr(order_history, '_last_placed_at', last_placed_at)
+
+        result = order_history.coarsen(2 * test_config.LONG_TIME_STEP)
+
+        assert result._storage == order_history._storage
+        assert result._last_placed_at == last_placed_at
+
+    def test_shorter_time_step(self, order_history):
+        """The order totals cannot be split up."""
+        with pytest.raises(ValueError, match='multiple'):
+            order_history.coarsen(test_config.SHORT_TIME_STEP)
+
+
+class TestLoad:
+    """Test the `OrderHistory.load()` method.
+
+    The database is mocked by setting `OrderHistory.aggregate_orders()`
+    to return the `order_totals` and `OrderHistory._fingerprint()`
+    to return a fixed state of the `Order`s in the database.
+    """
+
+    @pytest.fixture
+    def fingerprint(self):
+        """The number of `Order`s and the latest `Order.placed_at`."""
+        return 100, test_config.END - dt.timedelta(minutes=30)
+
+    @pytest.fixture
+    def empty_history(self, grid, order_totals, fingerprint, monkeypatch):
+        """An `OrderHistory` without any data loaded yet."""
+        order_history = timify.OrderHistory(
+            grid=grid, time_step=test_config.LONG_TIME_STEP,
+        )
+        monkeypatch.setattr(order_history, 'aggregate_orders', lambda: order_totals)
+        monkeypatch.setattr(order_history, '_fingerprint', lambda: fingerprint)
+
+        return order_history
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        """Enable caching on disk."""
+        monkeypatch.setattr(config, 'CACHE_DIR', str(tmp_path))
+
+        return tmp_path
+
+    def test_without_cache(self, empty_history, order_totals, tmp_path):
+        """Without a `config.CACHE_DIR`, the order totals are aggregated."""
+        empty_history.load()
+
+        assert empty_history.totals is order_totals
+        assert list(tmp_path.iterdir()) == []
+
+    def test_without_cache_with_cube_storage(self, grid, monkeypatch):
+        """With the "cube" `storage`, the order totals are aggregated densely."""
+        order_history = timify.OrderHistory(
+            grid=grid, time_step=test_config.LONG_TIME_STEP, storage='cube',
+        )
+        sentinel = object()
+        monkeypatch.setattr(order_history, 'aggregate_cube', lambda: sentinel)
+
+        order_history.load()
+
+        assert order_history.cube is sentinel
+
+    def test_cache_is_populated(self, empty_history, cache_dir, order_totals):
+        """The first time, the order totals are aggregated and cached."""
+        empty_history.load()
+
+        assert empty_history.totals is order_totals
+        assert len(list((cache_dir / 'totals').iterdir())) == 1
+
+    def test_cache_is_used(  # noqa:WPS218
+        self, empty_history, grid, cache_dir, order_totals, fingerprint, monkeypatch,
+    ):
+        """The second time, the order totals are read from the cache."""
+        empty_history.load()
+
+        order_history = timify.OrderHistory(
+            grid=grid, time_step=test_config.LONG_TIME_STEP,
+        )
+        monkeypatch.setattr(order_history, 'aggregate_orders', lambda: 1 / 0)
+        monkeypatch.setattr(order_history, '_fingerprint', lambda: fingerprint)
+
+        order_history.load()
+
+        assert order_history.cube.counts.sum() == order_totals['n_orders'].sum()
+        pd.testing.assert_frame_equal(
+            order_history.totals, order_totals, check_names=False,
+        )
+        # The cached order totals may be `.refresh()`ed.
+        assert order_history._last_placed_at == fingerprint[1]
+
+    def test_cache_is_used_implicitly(
+        self, empty_history, grid, cache_dir, order_totals, fingerprint, monkeypatch,
+    ):
+        """`OrderHistory.cube` loads the order totals from the cache."""
+        empty_history.load()
+
+        order_history = timify.OrderHistory(
+            grid=grid, time_step=test_config.LONG_TIME_STEP, storage='cube',
+        )
+        monkeypatch.setattr(order_history, 'aggregate_orders', lambda: 1 / 0)
+        monkeypatch.setattr(order_history, '_fingerprint', lambda: fingerprint)
+
+        result = order_history.cube
+
+        assert result.counts.sum() == order_totals['n_orders'].sum()
+        assert order_history._data is None
+
+    def test_cache_is_invalidated(
+        self, empty_history, cache_dir, fingerprint, monkeypatch,
+    ):
+        """New `Order`s in the database change the fingerprint."""
+        empty_history.load()
+
+        new_fingerprint = (fingerprint[0] + 1, fingerprint[1])
+        monkeypatch.setattr(empty_history, '_fingerprint', lambda: new_fingerprint)
+
+        empty_history.load()
+
+        assert len(list((cache_dir / 'totals').iterdir())) == 2
+
+    def test_no_orders(self, empty_history, cache_dir, order_totals, monkeypatch):
+        """Edge case that does not occur for real-life data."""
+        monkeypatch.setattr(empty_history, '_fingerprint', lambda: (0, None))
+
+        empty_history.load()
+
+        assert empty_history.totals is order_totals
+        assert list(cache_dir.iterdir()) == []
+
+
+class TestRefresh:
+    """Test the `OrderHistory.refresh()` method.
+
+    The database is mocked by setting `OrderHistory._query_totals()`
+    to return the order totals of the newly placed orders.
+    """
+
+    @pytest.fixture
+    def new_totals(self):
+        """A factory for sparse order totals as loaded from the database."""
+
+        def make(*rows):
+            index = pd.MultiIndex.from_tuples(
+                [(pixel_id, start_at) for pixel_id, start_at, _ in rows],
+                names=['pixel_id', 'start_at'],
+            )
+            return pd.DataFrame(
+                data={'n_orders': [n_orders for _, _, n_orders in rows]},
+                index=index,
+            )
+
+        return make
+
+    @pytest.fixture
+    def refreshable_history(self, order_history, monkeypatch):
+        """The `order_history` as if its totals were aggregated from the database."""
+        last_placed_at = test_config.END - dt.timedelta(minutes=30)
+        monkeypatch.setattr(order_history, '_last_placed_at', last_placed_at)
+
+        return order_history
+
+    def test_first_refresh_aggregates_everything(self, order_history, monkeypatch):
+        """Without prior aggregation, all orders are aggregated."""
+        monkeypatch.setattr(order_history, '_data', None)
+        sentinel = object()
+        monkeypatch.setattr(order_history, 'aggregate_orders', lambda: sentinel)
+
+        result = order_history.refresh()
+
+        assert result is sentinel
+        assert order_history.totals is sentinel
+
+    def test_only_new_orders_are_queried(self, refreshable_history, monkeypatch):
+        """The latest aggregated `Order.placed_at` is used as the watermark."""
+        calls = []
+
+        def query_totals(since=None):
+            calls.append(since)
+            return refreshable_history.totals.iloc[:0]
+
+        monkeypatch.setattr(refreshable_history, '_query_totals', query_totals)
+
+        refreshable_history.refresh()
+
+        assert calls == [test_config.END - dt.timedelta(minutes=30)]
+
+    def test_no_new_orders(self, refreshable_history, order_totals, monkeypatch):
+        """Without new orders, the totals stay the same."""
+        monkeypatch.setattr(
+            refreshable_history, '_query_totals', lambda since: order_totals.iloc[:0],
+        )
+
+        result = refreshable_history.refresh()
+
+        assert result is order_totals
+
+    def test_new_orders_in_last_time_step(  # noqa:WPS218
+        self,
+        refreshable_history,
+        order_totals,
+        new_totals,
+        good_pixel_id,
+        monkeypatch,
+    ):
+        """New orders in an already aggregated time step are added to the totals."""
+        last_start_at = test_config.END - dt.timedelta(hours=1)
+        new_data = new_totals((good_pixel_id, last_start_at, 2))
+        monkeypatch.setattr(
+            refreshable_history, '_query_totals', lambda since: new_data,
+        )
+
+        result = refreshable_history.refresh()
+
+        assert len(result) == len(order_totals)
+        assert result.loc[(good_pixel_id, last_start_at), 'n_orders'] == 1 + 2
+        assert result['n_orders'].sum() == order_totals['n_orders'].sum() + 2
+        assert result['n_orders'].dtype == order_totals['n_orders'].dtype
+
+    def test_new_day(  # noqa:WPS218
+        self,
+        refreshable_history,
+        order_totals,
+        new_totals,
+        good_pixel_id,
+        monkeypatch,
+    ):
+        """A new day is appended for all `Pixel`s and filled with `0`s."""
+        next_day_at_noon = test_config.END + dt.timedelta(hours=13)
+        new_data = new_totals((good_pixel_id, next_day_at_noon, 3))
+        monkeypatch.setattr(
+            refreshable_history, '_query_totals', lambda since: new_data,
+        )
+
+        result = refreshable_history.refresh()
+
+        assert len(result) == len(order_totals) + 2 * 12
+        assert result.loc[(good_pixel_id, next_day_at_noon), 'n_orders'] == 3
+        assert result['n_orders'].sum() == order_totals['n_orders'].sum() + 3
+        assert result.index.is_monotonic_increasing
+
+    def test_new_pixel(
+        self,
+        refreshable_history,
+        order_totals,
+        new_totals,
+        good_pixel_id,
+        monkeypatch,
+    ):
+        """A new `Pixel` is filled with `0`s for all past days."""
+        new_pixel_id = good_pixel_id + 2
+        last_start_at = test_config.END - dt.timedelta(hours=1)
+        new_data = new_totals((new_pixel_id, last_start_at, 1))
+        monkeypatch.setattr(
+            refreshable_history, '_query_totals', lambda since: new_data,
+        )
+
+        result = refreshable_history.refresh()
+
+        assert len(result) == len(order_totals) * 3 // 2
+        assert result.loc[new_pixel_id, 'n_orders'].sum() == 1
+
+    def test_cube_is_refreshed(
+        self, refreshable_history, new_totals, good_pixel_id, monkeypatch,
+    ):
+        """The `OrderHistory.cube` is derived from the refreshed totals."""
+        next_day_at_noon = test_config.END + dt.timedelta(hours=13)
+        new_data = new_totals((good_pixel_id, next_day_at_noon, 3))
+        monkeypatch.setattr(
+            refreshable_history, '_query_totals', lambda since: new_data,
+        )
+        n_days = refreshable_history.cube.n_days
+
+        refreshable_history.refresh()
+
+        assert refreshable_history.cube.n_days == n_days + 1
+
+    def test_activity_is_refreshed(
+        self, refreshable_history, new_totals, good_pixel_id, monkeypatch,
+    ):
+        """The `OrderHistory.activity` is derived from the refreshed totals."""
+        next_day_at_noon = test_config.END + dt.timedelta(hours=13)
+        new_data = new_totals((good_pixel_id, next_day_at_noon, 3))
+        monkeypatch.setattr(
+            refreshable_history, '_query_totals', lambda since: new_data,
+        )
+        refreshable_history.last_order_at(good_pixel_id)
+
+        refreshable_history.refresh()
+
+        assert refreshable_history.last_order_at(good_pixel_id) == next_day_at_noon